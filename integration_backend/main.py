@@ -3,35 +3,224 @@ Integration Backend for AI Resume Screening System
 FastAPI server that connects the Website frontend to the resume_model_engine
 """
 
+import asyncio
+import functools
+import heapq
+import hmac
+import json
+import os
+import random
 import sys
 import time
 import uuid
-from pathlib import Path
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from pathlib import Path, PurePosixPath
+from typing import List, Dict, Any, AsyncIterator, Awaitable, Callable, Iterable, Iterator, Optional, Set, Sized, Tuple, Union
 
-from fastapi import FastAPI, File, UploadFile, Form, HTTPException
+from fastapi import FastAPI, File, UploadFile, Form, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 
 # Adjust sys.path to import the model engine
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 try:
-    from resume_model_engine.src.pipeline import evaluate_candidates
+    from resume_model_engine.src.pipeline import (
+        evaluate_candidates,
+        iter_candidate_results,
+        score_candidates,
+        shutdown_process_pool,
+        warm_up_steps,
+    )
+    from resume_model_engine.src.ranker import rank_candidates
+    from resume_model_engine.src.similarity import load_tfidf_model
+    from resume_model_engine.src.text_cache import get_pdf_text_cache
+    from resume_model_engine.src.feature_cache import get_feature_cache
 except ImportError as e:
     raise ImportError(
         f"Failed to import evaluate_candidates from resume_model_engine: {e}\n"
         "Make sure the resume_model_engine folder exists in the project root."
     )
 
-from utils.pdf_parser import extract_text_from_pdf
+from utils.pdf_parser import extract_text_from_pdf_bounded, warm_up_pdf_parser
+from utils.jobs import JobManager, JOB_COMPLETED, JOB_FAILED
+from utils.archives import ArchiveError, ArchiveLimitError, is_supported_archive, iter_archive_files
+from utils.metrics import MetricsRegistry
+from utils.profiling import RequestProfiler, try_start_profile
+from utils.uploads import UploadSpool, UploadTooLargeError
+
+# Optional pre-fitted TF-IDF model (see resume_model_engine/fit_tfidf_model.py).
+# Loaded once at startup so request-time similarity is transform-only.
+TFIDF_MODEL_PATH = os.getenv("TFIDF_MODEL_PATH", "")
+tfidf_model = load_tfidf_model(TFIDF_MODEL_PATH) if TFIDF_MODEL_PATH else None
+
+# Number of worker processes used by the model engine (1 = serial)
+EVAL_WORKERS = int(os.getenv("EVAL_WORKERS", "1"))
+
+# Threads available for blocking work (PDF parsing, model evaluation) so it
+# never runs on the event loop
+EXECUTOR_WORKERS = int(os.getenv("EXECUTOR_WORKERS", "4"))
+
+# Background evaluation jobs (/api/jobs): concurrent jobs and how many
+# finished jobs are kept for result retrieval
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+MAX_STORED_JOBS = int(os.getenv("MAX_STORED_JOBS", "100"))
+
+# Uploads are spooled to temporary files (in UPLOAD_SPOOL_DIR, default: the
+# system temp dir); larger files are skipped, larger requests rejected (413)
+MAX_UPLOAD_FILE_MB = int(os.getenv("MAX_UPLOAD_FILE_MB", "20"))
+MAX_UPLOAD_REQUEST_MB = int(os.getenv("MAX_UPLOAD_REQUEST_MB", "2048"))
+UPLOAD_SPOOL_DIR = os.getenv("UPLOAD_SPOOL_DIR") or None
+
+# Archive uploads (/api/evaluate/archive): limits against zip bombs
+ARCHIVE_MAX_ENTRIES = int(os.getenv("ARCHIVE_MAX_ENTRIES", "5000"))
+ARCHIVE_MAX_EXTRACTED_MB = int(os.getenv("ARCHIVE_MAX_EXTRACTED_MB", "2048"))
+
+# Opt-in profiling (cProfile + tracemalloc) of evaluation requests: a sampled
+# fraction of requests, plus any request sending the admin token in the
+# X-Profile-Token header. Results are written to PROFILE_DIR/<job_id>/
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+PROFILE_ADMIN_TOKEN = os.getenv("PROFILE_ADMIN_TOKEN", "")
+PROFILE_DIR = os.getenv("PROFILE_DIR", "profiles")
+
+# Load and warm all models at startup so the first request does not pay for
+# them; /ready answers 503 until warm-up has succeeded
+WARMUP_ON_STARTUP = os.getenv("WARMUP_ON_STARTUP", "1") != "0"
+
+# Component readiness states
+COMPONENT_PENDING = "pending"
+COMPONENT_LOADING = "loading"
+COMPONENT_READY = "ready"
+COMPONENT_FAILED = "failed"
+
+# Load status of each warmed component, reported by /ready
+component_status: Dict[str, Dict[str, Any]] = {}
+
+# Shared executor for blocking work (lazy created)
+_executor: Optional[ThreadPoolExecutor] = None
+
+job_manager = JobManager(max_workers=JOB_WORKERS, max_jobs=MAX_STORED_JOBS)
+
+# Prometheus metrics (see /metrics)
+metrics = MetricsRegistry()
+STAGE_SECONDS = metrics.histogram(
+    "resume_stage_duration_seconds",
+    "Time spent per request in each processing stage",
+    ["stage"],
+)
+REQUEST_SECONDS = metrics.histogram(
+    "resume_request_duration_seconds",
+    "End-to-end evaluation time per request",
+    ["endpoint"],
+)
+CANDIDATES_PROCESSED = metrics.counter(
+    "resume_candidates_processed_total",
+    "Candidates evaluated by the model engine",
+    ["endpoint"],
+)
+FILES_SKIPPED = metrics.counter(
+    "resume_files_skipped_total",
+    "Uploaded files skipped before evaluation",
+    ["reason"],
+)
+FILES_TRUNCATED = metrics.counter(
+    "resume_files_truncated_total",
+    "PDF resumes whose text extraction stopped at the page/character/time limits",
+)
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Get or create the shared executor for blocking work."""
+    global _executor
+
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=EXECUTOR_WORKERS, thread_name_prefix="resume-worker"
+        )
+
+    return _executor
+
+
+async def run_blocking(func: Callable, *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking function in the shared executor without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), functools.partial(func, *args, **kwargs))
+
+
+_ITERATION_DONE = object()
+
+
+async def iterate_blocking(iterator: Iterator[Any]) -> AsyncIterator[Any]:
+    """Advance a blocking iterator in the shared executor, yielding its items."""
+    while True:
+        item = await run_blocking(next, iterator, _ITERATION_DONE)
+        if item is _ITERATION_DONE:
+            return
+        yield item
+
+
+def _warm_up_steps() -> List[Tuple[str, Callable[[], Any]]]:
+    """Warm-up steps for the PDF parser and the model engine."""
+    return [("pdf_parser", warm_up_pdf_parser)] + warm_up_steps(EVAL_WORKERS, tfidf_model)
+
+
+def _run_warm_up(steps: List[Tuple[str, Callable[[], Any]]]) -> None:
+    """
+    Run warm-up steps in order, recording each component's status and load time.
+
+    A failed step is reported and the remaining steps still run.
+    """
+    for name, step in steps:
+        component_status[name] = {"status": COMPONENT_LOADING, "load_time_ms": None, "error": None}
+        start = time.perf_counter()
+        try:
+            step()
+        except Exception as e:
+            status, error = COMPONENT_FAILED, str(e)
+            print(f"Warning: Warm-up of '{name}' failed: {e}")
+        else:
+            status, error = COMPONENT_READY, None
+        load_time_ms = round((time.perf_counter() - start) * 1000, 2)
+        component_status[name] = {"status": status, "load_time_ms": load_time_ms, "error": error}
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Warm up the models in the background on startup; release the executors,
+    job workers and engine process pool on shutdown.
+    """
+    global _executor
+
+    warm_up = None
+    if WARMUP_ON_STARTUP:
+        steps = _warm_up_steps()
+        # Mark every component pending before serving, so /ready never
+        # reports ready ahead of the warm-up
+        component_status.clear()
+        for name, _ in steps:
+            component_status[name] = {"status": COMPONENT_PENDING, "load_time_ms": None, "error": None}
+        warm_up = asyncio.create_task(run_blocking(_run_warm_up, steps))
+
+    yield
+
+    if warm_up is not None:
+        warm_up.cancel()
+    job_manager.shutdown()
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+    shutdown_process_pool()
+
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Resume Screening Integration API",
     description="Backend integration layer connecting frontend to AI model",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Enable CORS for frontend access
@@ -88,6 +277,8 @@ def _sanitize_candidate(candidate: Dict[str, Any]) -> Dict[str, Any]:
 
     return {
         "candidate_id": candidate.get("candidate_id", "NA"),
+        # True when only the first pages/characters of the PDF were read
+        "truncated": bool(candidate.get("truncated", False)),
 
         "emails": na_list(candidate.get("emails", [])),
         "phones": na_list(candidate.get("phones", [])),
@@ -123,35 +314,27 @@ async def root():
     }
 
 
-@app.post("/api/evaluate")
-async def evaluate_resumes(
-    jd_text: str = Form(...),
-    resumes: List[UploadFile] = File(...),
-) -> JSONResponse:
-    """
-    Evaluate resumes vs job description and return ranked candidates.
-    """
-    print("\n" + "="*60)
-    print("📥 NEW EVALUATION REQUEST")
-    print("="*60)
-    print(f"JD Text Length: {len(jd_text)} characters")
-    print(f"Number of Files: {len(resumes)}")
-    print(f"File Names: {[f.filename for f in resumes]}")
-    print("="*60 + "\n")
-    
-    start_time = time.time()
-    job_id = str(uuid.uuid4())
-    skipped_files: List[Dict[str, str]] = []
+def _new_upload_spool() -> UploadSpool:
+    """Create a spool for the uploads of one request."""
+    return UploadSpool(
+        max_file_bytes=MAX_UPLOAD_FILE_MB * 1024 * 1024,
+        max_request_bytes=MAX_UPLOAD_REQUEST_MB * 1024 * 1024,
+        temp_dir=UPLOAD_SPOOL_DIR,
+    )
 
-    # Validate inputs
-    if not jd_text or jd_text.strip() == "":
-        raise HTTPException(status_code=400, detail="Job description text is required")
 
-    if not resumes or len(resumes) == 0:
-        raise HTTPException(status_code=400, detail="At least one resume file is required")
+async def _read_uploads(
+    resumes: List[UploadFile],
+    spool: UploadSpool,
+) -> Tuple[List[Tuple[str, Path]], List[Dict[str, str]]]:
+    """
+    Spool uploaded PDF files to disk, skipping non-PDF and oversized files.
 
-    # Extract resume text from PDFs
-    candidates: Dict[str, str] = {}
+    Raises:
+        HTTPException: 413 if the request exceeds MAX_UPLOAD_REQUEST_MB
+    """
+    files: List[Tuple[str, Path]] = []
+    skipped_files: List[Dict[str, str]] = []
 
     for resume_file in resumes:
         filename = resume_file.filename or "unknown"
@@ -159,75 +342,812 @@ async def evaluate_resumes(
         # Only PDF files allowed
         if not filename.lower().endswith(".pdf"):
             skipped_files.append({"filename": filename, "reason": "Not a PDF file"})
+            FILES_SKIPPED.inc(reason="not_pdf")
             continue
 
         try:
-            pdf_bytes = await resume_file.read()
-            resume_text = extract_text_from_pdf(pdf_bytes)
+            path = await spool.add(resume_file)
+        except UploadTooLargeError as e:
+            raise HTTPException(status_code=413, detail=str(e))
 
-            if not resume_text or resume_text.strip() == "":
-                skipped_files.append({"filename": filename, "reason": "Empty or unreadable PDF"})
-                continue
+        if path is None:
+            skipped_files.append(
+                {"filename": filename, "reason": f"File exceeds the {MAX_UPLOAD_FILE_MB} MB limit"}
+            )
+            FILES_SKIPPED.inc(reason="too_large")
+            continue
+
+        files.append((filename, path))
+
+    return files, skipped_files
+
+
+def _upload_candidate_id(filename: str) -> str:
+    """Candidate id of an uploaded file: its name without the extension."""
+    return Path(filename).stem
+
+
+def _archive_candidate_id(entry_name: str) -> str:
+    """
+    Candidate id of an archive entry: its path inside the archive without the
+    extension, so alice/resume.pdf and bob/resume.pdf stay distinct.
+    """
+    return str(PurePosixPath(entry_name.lstrip("/")).with_suffix(""))
 
-            candidate_id = Path(filename).stem
-            candidates[candidate_id] = resume_text
 
+def _iter_candidates(
+    files: Iterable[Tuple[str, Union[Path, bytes]]],
+    skipped_files: List[Dict[str, str]],
+    truncated: Set[str],
+    candidate_ids: List[str],
+    candidate_id_for: Callable[[str], str] = _upload_candidate_id,
+    timings: Optional[Dict[str, float]] = None,
+) -> Iterator[Tuple[str, str]]:
+    """
+    Lazily extract resume text from spooled PDF files or PDF bytes (blocking),
+    one file at a time, skipping unreadable ones. Each spooled file is
+    deleted as soon as its text is extracted.
+
+    Files whose candidate id (see candidate_id_for) is already taken are
+    skipped rather than overwriting the earlier candidate.
+
+    Args:
+        files: (file name, spooled path or PDF bytes) pairs
+        skipped_files: Receives the skipped files
+        truncated: Receives the ids of candidates whose text was truncated
+            at the extraction limits
+        candidate_ids: Receives the ids of the yielded candidates, in order
+        candidate_id_for: Maps a file name to a candidate id
+        timings: Optional dict receiving the 'pdf_extraction' time
+
+    Yields:
+        (candidate_id, resume_text) pairs
+    """
+    taken: Set[str] = set()
+
+    for filename, pdf_source in files:
+        candidate_id = candidate_id_for(filename)
+        if candidate_id in taken:
+            if isinstance(pdf_source, Path):
+                UploadSpool.release(pdf_source)
+            skipped_files.append({"filename": filename, "reason": f"Duplicate candidate id '{candidate_id}'"})
+            FILES_SKIPPED.inc(reason="duplicate")
+            continue
+
+        stage_start = time.perf_counter()
+        try:
+            try:
+                resume_text, was_truncated = extract_text_from_pdf_bounded(pdf_source)
+            finally:
+                if isinstance(pdf_source, Path):
+                    UploadSpool.release(pdf_source)
         except Exception as e:
             skipped_files.append({"filename": filename, "reason": f"Error processing PDF: {str(e)}"})
+            FILES_SKIPPED.inc(reason="pdf_error")
             continue
+        finally:
+            if timings is not None:
+                timings["pdf_extraction"] = timings.get("pdf_extraction", 0.0) + time.perf_counter() - stage_start
+
+        if not resume_text or resume_text.strip() == "":
+            skipped_files.append({"filename": filename, "reason": "Empty or unreadable PDF"})
+            FILES_SKIPPED.inc(reason="empty_pdf")
+            continue
+
+        if was_truncated:
+            truncated.add(candidate_id)
+            FILES_TRUNCATED.inc()
+
+        taken.add(candidate_id)
+        candidate_ids.append(candidate_id)
+        yield candidate_id, resume_text
+
+
+def _extract_candidates(
+    files: Iterable[Tuple[str, Union[Path, bytes]]],
+    candidate_id_for: Callable[[str], str] = _upload_candidate_id,
+) -> Tuple[Dict[str, str], List[Dict[str, str]], Set[str]]:
+    """
+    Extract resume text from all files (blocking), see _iter_candidates.
+
+    Returns the candidates, the skipped files and the ids of candidates whose
+    text was truncated at the extraction limits.
+    """
+    skipped_files: List[Dict[str, str]] = []
+    truncated: Set[str] = set()
+    candidates = dict(_iter_candidates(files, skipped_files, truncated, [], candidate_id_for))
+    return candidates, skipped_files, truncated
 
-    # Check if any candidate is valid
-    if len(candidates) == 0:
-        raise HTTPException(
-            status_code=400,
-            detail="No valid PDF resumes could be processed. All files were skipped.",
-        )
 
-    # Call model engine
+def _mark_truncated(results: List[Dict[str, Any]], truncated: Set[str]) -> None:
+    """Flag results of candidates whose PDF text was truncated."""
+    for result in results:
+        result["truncated"] = result.get("candidate_id") in truncated
+
+
+def _iter_archive_pdfs(archive_path: Path, skipped_files: List[Dict[str, str]]) -> Iterator[Tuple[str, bytes]]:
+    """
+    Yield (entry name, PDF bytes) for the PDFs in an archive, one entry at a
+    time, recording skipped entries with the same rules as uploaded files.
+
+    Raises:
+        ArchiveError: If the archive is invalid or exceeds its limits
+    """
+    entries = iter_archive_files(
+        archive_path,
+        max_entries=ARCHIVE_MAX_ENTRIES,
+        max_total_bytes=ARCHIVE_MAX_EXTRACTED_MB * 1024 * 1024,
+    )
+    for filename, read in entries:
+        if not filename.lower().endswith(".pdf"):
+            skipped_files.append({"filename": filename, "reason": "Not a PDF file"})
+            FILES_SKIPPED.inc(reason="not_pdf")
+            continue
+
+        try:
+            pdf_bytes = read(MAX_UPLOAD_FILE_MB * 1024 * 1024)
+        except ArchiveLimitError:
+            raise
+        except Exception as e:
+            skipped_files.append({"filename": filename, "reason": f"Error processing PDF: {str(e)}"})
+            FILES_SKIPPED.inc(reason="pdf_error")
+            continue
+
+        if pdf_bytes is None:
+            skipped_files.append(
+                {"filename": filename, "reason": f"File exceeds the {MAX_UPLOAD_FILE_MB} MB limit"}
+            )
+            FILES_SKIPPED.inc(reason="too_large")
+            continue
+
+        yield filename, pdf_bytes
+
+
+def _extract_archive_candidates(
+    archive_path: Path,
+) -> Tuple[Dict[str, str], List[Dict[str, str]], Set[str]]:
+    """Extract resume text from the PDFs in an archive (blocking)."""
+    skipped_files: List[Dict[str, str]] = []
+    candidates, extraction_skipped, truncated = _extract_candidates(
+        _iter_archive_pdfs(archive_path, skipped_files), _archive_candidate_id
+    )
+    return candidates, skipped_files + extraction_skipped, truncated
+
+
+def _evaluate(
+    jd_text: str,
+    candidates: Dict[str, str],
+    limit: Optional[int] = None,
+    offset: int = 0,
+    timings: Optional[Dict[str, float]] = None,
+    n_workers: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Run the model engine (blocking) with the backend configuration."""
+    return evaluate_candidates(
+        jd_text,
+        candidates,
+        tfidf_model=tfidf_model,
+        n_workers=EVAL_WORKERS if n_workers is None else n_workers,
+        feature_cache=get_feature_cache(),
+        limit=limit,
+        offset=offset,
+        timings=timings,
+    )
+
+
+def _score(
+    jd_text: str,
+    candidates: Dict[str, str],
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    timings: Optional[Dict[str, float]] = None,
+    n_workers: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Score candidates without ranking (blocking) with the backend configuration."""
+    return score_candidates(
+        jd_text,
+        candidates,
+        tfidf_model=tfidf_model,
+        n_workers=EVAL_WORKERS if n_workers is None else n_workers,
+        feature_cache=get_feature_cache(),
+        progress_callback=progress_callback,
+        timings=timings,
+    )
+
+
+def _iter_results(
+    jd_text: str,
+    candidates: Union[Dict[str, str], Iterable[Tuple[str, str]]],
+    timings: Optional[Dict[str, float]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Score candidates incrementally (blocking) with the backend configuration."""
+    return iter_candidate_results(
+        jd_text,
+        candidates,
+        tfidf_model=tfidf_model,
+        n_workers=EVAL_WORKERS,
+        feature_cache=get_feature_cache(),
+        timings=timings,
+    )
+
+
+def _should_profile(request: Request) -> bool:
+    """
+    Decide whether to profile a request: always when it carries the admin
+    profiling token, otherwise for a PROFILE_SAMPLE_RATE fraction of requests.
+    """
+    if PROFILE_ADMIN_TOKEN:
+        token = request.headers.get("x-profile-token", "")
+        if hmac.compare_digest(token.encode("utf-8"), PROFILE_ADMIN_TOKEN.encode("utf-8")):
+            return True
+
+    return PROFILE_SAMPLE_RATE > 0 and random.random() < PROFILE_SAMPLE_RATE
+
+
+def _profiled_workers(profiler: Optional[RequestProfiler]) -> Optional[int]:
+    """
+    Worker count for a request: profiled requests evaluate in-process, since
+    cProfile cannot see work done in EVAL_WORKERS worker processes.
+    """
+    return None if profiler is None else 1
+
+
+def _run_stage(profiler: Optional[RequestProfiler], stage: str, func: Callable, *args: Any) -> Any:
+    """Run a blocking stage, under the profiler if the request is profiled."""
+    if profiler is None:
+        return func(*args)
+    return profiler.run(stage, func, *args)
+
+
+def _finish_profile(profiler: RequestProfiler) -> None:
+    """Write a request profile to disk (blocking)."""
     try:
-        raw_results = evaluate_candidates(jd_text, candidates)
+        output_path = profiler.finish()
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error during model evaluation: {str(e)}")
+        print(f"Warning: Could not write profile for job {profiler.job_id}: {e}")
+        return
 
-    # Sanitize output for frontend
-    results = [_sanitize_candidate(c) for c in raw_results]
+    if output_path is not None:
+        print(f"Profile for job {profiler.job_id} written to {output_path}")
+
+
+def _observe_stages(timings: Dict[str, float]) -> None:
+    """Record per-stage times (seconds) in the stage histogram."""
+    for stage, seconds in timings.items():
+        STAGE_SECONDS.observe(seconds, stage=stage)
 
-    processing_time = time.time() - start_time
 
-    # Debug print
-    print("\n--- MODEL OUTPUT DEBUG (first candidate) ---")
-    if results:
-        print(results[0])
-    print("------------------------------------------\n")
+def _record_evaluation(endpoint: str, n_candidates: int, timings: Dict[str, float], seconds: float) -> None:
+    """Record the metrics of one finished evaluation."""
+    _observe_stages(timings)
+    CANDIDATES_PROCESSED.inc(n_candidates, endpoint=endpoint)
+    REQUEST_SECONDS.observe(seconds, endpoint=endpoint)
+
+
+def _build_response(
+    job_id: str,
+    total_candidates: int,
+    raw_results: List[Dict[str, Any]],
+    skipped_files: List[Dict[str, str]],
+    processing_time: float,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    stage_timings: Optional[Dict[str, float]] = None,
+) -> Dict[str, Any]:
+    """Build the evaluation response body for one page of ranked results."""
+    # Sanitize output for frontend
+    results = [_sanitize_candidate(c) for c in raw_results]
 
-    response_data = {
+    return {
         "job_id": job_id,
-        "total_candidates": len(candidates),
+        "total_candidates": total_candidates,
+        "offset": offset,
+        "limit": limit,
         "results": results,
         "processing_time_ms": int(processing_time * 1000),
         "processing_time_sec": round(processing_time, 2),
+        "stage_timings_ms": {
+            stage: round(seconds * 1000, 2) for stage, seconds in (stage_timings or {}).items()
+        },
         "skipped_files": skipped_files,
     }
 
-    return JSONResponse(content=response_data)
+
+def _validate_request(jd_text: str, resumes: List[UploadFile]) -> None:
+    """Reject requests without a job description or resume files."""
+    if not jd_text or jd_text.strip() == "":
+        raise HTTPException(status_code=400, detail="Job description text is required")
+
+    if not resumes or len(resumes) == 0:
+        raise HTTPException(status_code=400, detail="At least one resume file is required")
+
+
+async def _load_candidates(
+    resumes: List[UploadFile],
+    timings: Dict[str, float],
+    profiler: Optional[RequestProfiler] = None,
+) -> Tuple[Dict[str, str], List[Dict[str, str]], Set[str]]:
+    """Spool uploads and extract resume text, timing both stages."""
+    spool = _new_upload_spool()
+    try:
+        stage_start = time.perf_counter()
+        files, skipped_files = await _read_uploads(resumes, spool)
+        timings["upload_read"] = time.perf_counter() - stage_start
+
+        stage_start = time.perf_counter()
+        candidates, extraction_skipped, truncated = await run_blocking(
+            _run_stage, profiler, "pdf_extraction", _extract_candidates, files
+        )
+        timings["pdf_extraction"] = time.perf_counter() - stage_start
+    finally:
+        spool.cleanup()
+    skipped_files.extend(extraction_skipped)
+
+    _require_candidates(candidates)
+    return candidates, skipped_files, truncated
+
+
+async def _load_archive_candidates(
+    archive: UploadFile,
+    timings: Dict[str, float],
+    profiler: Optional[RequestProfiler] = None,
+) -> Tuple[Dict[str, str], List[Dict[str, str]], Set[str]]:
+    """Spool an uploaded archive and extract the text of its PDFs, timing both stages."""
+    # The archive itself is only bounded by the request limit
+    spool = UploadSpool(max_request_bytes=MAX_UPLOAD_REQUEST_MB * 1024 * 1024, temp_dir=UPLOAD_SPOOL_DIR)
+    try:
+        stage_start = time.perf_counter()
+        try:
+            archive_path = await spool.add(archive)
+        except UploadTooLargeError as e:
+            raise HTTPException(status_code=413, detail=str(e))
+        timings["upload_read"] = time.perf_counter() - stage_start
+
+        stage_start = time.perf_counter()
+        try:
+            candidates, skipped_files, truncated = await run_blocking(
+                _run_stage, profiler, "pdf_extraction", _extract_archive_candidates, archive_path
+            )
+        except ArchiveLimitError as e:
+            raise HTTPException(status_code=413, detail=str(e))
+        except ArchiveError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        timings["pdf_extraction"] = time.perf_counter() - stage_start
+    finally:
+        spool.cleanup()
+
+    _require_candidates(candidates)
+    return candidates, skipped_files, truncated
+
+
+def _require_candidates(candidates: Sized) -> None:
+    """Reject requests in which no resume (or PDF file) is left to process."""
+    if len(candidates) == 0:
+        raise HTTPException(
+            status_code=400,
+            detail="No valid PDF resumes could be processed. All files were skipped.",
+        )
+
+
+async def _run_evaluation(
+    request: Request,
+    endpoint: str,
+    jd_text: str,
+    load_candidates: Callable[
+        [Dict[str, float], Optional[RequestProfiler]],
+        Awaitable[Tuple[Dict[str, str], List[Dict[str, str]], Set[str]]],
+    ],
+    limit: Optional[int],
+    offset: int,
+) -> JSONResponse:
+    """Load candidates, evaluate them and build the ranked response."""
+    start_time = time.time()
+    job_id = str(uuid.uuid4())
+    timings: Dict[str, float] = {}
+
+    profiler = try_start_profile(job_id, PROFILE_DIR) if _should_profile(request) else None
+    try:
+        # Extract resume text from PDFs
+        candidates, skipped_files, truncated = await load_candidates(timings, profiler)
+
+        # Call model engine
+        try:
+            raw_results = await run_blocking(
+                _run_stage, profiler, "evaluate_candidates",
+                _evaluate, jd_text, candidates, limit, offset, timings, _profiled_workers(profiler),
+            )
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Error during model evaluation: {str(e)}")
+        _mark_truncated(raw_results, truncated)
+    finally:
+        if profiler is not None:
+            await run_blocking(_finish_profile, profiler)
+
+    # Serialization happens after the body is built, so it is only
+    # reported in /metrics
+    stage_start = time.perf_counter()
+    response_data = _build_response(
+        job_id, len(candidates), raw_results, skipped_files, time.time() - start_time, limit, offset, timings
+    )
+    response = JSONResponse(content=response_data)
+    timings["serialization"] = time.perf_counter() - stage_start
+
+    _record_evaluation(endpoint, len(candidates), timings, time.time() - start_time)
+
+    return response
+
+
+@app.post("/api/evaluate")
+async def evaluate_resumes(
+    request: Request,
+    jd_text: str = Form(...),
+    resumes: List[UploadFile] = File(...),
+    limit: Optional[int] = Query(None, ge=1),
+    offset: int = Query(0, ge=0),
+) -> JSONResponse:
+    """
+    Evaluate resumes vs job description and return ranked candidates.
+
+    Pass limit/offset to return only one page of the ranking. The response
+    includes the time spent in each stage (stage_timings_ms).
+    """
+    # Validate inputs
+    _validate_request(jd_text, resumes)
+
+    return await _run_evaluation(
+        request, "evaluate", jd_text, functools.partial(_load_candidates, resumes), limit, offset
+    )
+
+
+@app.post("/api/evaluate/archive")
+async def evaluate_archive(
+    request: Request,
+    jd_text: str = Form(...),
+    archive: UploadFile = File(...),
+    limit: Optional[int] = Query(None, ge=1),
+    offset: int = Query(0, ge=0),
+) -> JSONResponse:
+    """
+    Evaluate the PDF resumes in a ZIP or tar.gz archive.
+
+    Entries are decompressed one at a time straight into PDF extraction (the
+    archive is never unpacked to disk). Same response as /api/evaluate.
+    """
+    _validate_request(jd_text, [archive])
+    if not is_supported_archive(archive.filename or ""):
+        raise HTTPException(status_code=400, detail="Archive must be a .zip, .tar.gz, .tgz or .tar file")
+
+    return await _run_evaluation(
+        request, "archive", jd_text, functools.partial(_load_archive_candidates, archive), limit, offset
+    )
+
+
+def _encode_event(event: Dict[str, Any], sse: bool) -> str:
+    """Serialize a stream event as an NDJSON line or a Server-Sent Event."""
+    data = json.dumps(event)
+    if sse:
+        return f"event: {event['event']}\ndata: {data}\n\n"
+    return data + "\n"
+
+
+async def _stream_evaluation(
+    job_id: str,
+    jd_text: str,
+    files: List[Tuple[str, Union[Path, bytes]]],
+    skipped_files: List[Dict[str, str]],
+    start_time: float,
+    top_k: int,
+    snapshot_every: int,
+    sse: bool,
+    timings: Optional[Dict[str, float]] = None,
+    spool: Optional[UploadSpool] = None,
+) -> AsyncIterator[str]:
+    """
+    Yield evaluation events as PDFs are extracted and candidates scored.
+
+    PDFs are extracted inside the stream, one file at a time, straight into
+    the engine. With a pre-fitted TF-IDF model (TFIDF_MODEL_PATH) each
+    candidate is scored as soon as its PDF is read, so the first result
+    costs about one resume. Without one, the engine needs every resume for
+    its IDF weights, so the first result waits for the whole pool to be
+    extracted and vectorized.
+
+    Events: "start" (total_candidates counts the PDF files received), one
+    "result" per candidate, one "skipped" per PDF that could not be used, a
+    "top_k" snapshot every snapshot_every results, and a final "summary"
+    with the /api/evaluate body (or "error" if evaluation fails).
+    """
+    timings = {} if timings is None else timings
+    total = len(files)
+    skipped_reported = len(skipped_files)
+    truncated: Set[str] = set()
+    candidate_ids: List[str] = []
+    raw_results: List[Dict[str, Any]] = []
+
+    def skipped_events() -> List[str]:
+        nonlocal skipped_reported
+        events = [
+            _encode_event({"event": "skipped", **skipped}, sse) for skipped in skipped_files[skipped_reported:]
+        ]
+        skipped_reported = len(skipped_files)
+        return events
+
+    try:
+        yield _encode_event(
+            {"event": "start", "job_id": job_id, "total_candidates": total, "skipped_files": list(skipped_files)},
+            sse,
+        )
+
+        extracted = _iter_candidates(files, skipped_files, truncated, candidate_ids, timings=timings)
+        try:
+            async for result in iterate_blocking(_iter_results(jd_text, extracted, timings)):
+                for event in skipped_events():
+                    yield event
+
+                result["truncated"] = result["candidate_id"] in truncated
+                raw_results.append(result)
+                done = len(raw_results)
+
+                yield _encode_event(
+                    {"event": "result", "done": done, "total": total, "candidate": _sanitize_candidate(result)},
+                    sse,
+                )
+
+                if done % snapshot_every == 0 and done < total:
+                    leaders = heapq.nlargest(top_k, raw_results, key=lambda c: c.get("final_match_score", 0))
+                    top = [
+                        {
+                            "rank": rank,
+                            "candidate_id": c["candidate_id"],
+                            "final_match_score": c.get("final_match_score", 0),
+                        }
+                        for rank, c in enumerate(leaders, 1)
+                    ]
+                    yield _encode_event({"event": "top_k", "done": done, "total": total, "top": top}, sse)
+        except Exception as e:
+            yield _encode_event({"event": "error", "detail": f"Error during model evaluation: {str(e)}"}, sse)
+            return
+
+        for event in skipped_events():
+            yield event
+    finally:
+        if spool is not None:
+            spool.cleanup()
+
+    if not raw_results:
+        detail = "No valid PDF resumes could be processed. All files were skipped."
+        yield _encode_event({"event": "error", "detail": detail}, sse)
+        return
+
+    # Rank in input order so ties break exactly as in /api/evaluate
+    order = {candidate_id: i for i, candidate_id in enumerate(candidate_ids)}
+    raw_results.sort(key=lambda c: order[c["candidate_id"]])
+
+    stage_start = time.perf_counter()
+    ranked = rank_candidates(raw_results)
+    timings["ranking"] = timings.get("ranking", 0.0) + time.perf_counter() - stage_start
+
+    stage_start = time.perf_counter()
+    summary = _build_response(
+        job_id, len(raw_results), ranked, skipped_files, time.time() - start_time, stage_timings=timings
+    )
+    event = _encode_event({"event": "summary", **summary}, sse)
+    timings["serialization"] = time.perf_counter() - stage_start
+
+    _record_evaluation("stream", len(raw_results), timings, time.time() - start_time)
+    yield event
+
+
+@app.post("/api/evaluate/stream")
+async def evaluate_resumes_stream(
+    request: Request,
+    jd_text: str = Form(...),
+    resumes: List[UploadFile] = File(...),
+    top_k: int = Form(10),
+    snapshot_every: int = Form(5),
+) -> StreamingResponse:
+    """
+    Evaluate resumes and stream each candidate as soon as it is scored.
+
+    Uploads are spooled before the response starts; PDF extraction and
+    scoring happen while streaming (see _stream_evaluation). Responds with
+    NDJSON (one event per line), or Server-Sent Events when the client sends
+    "Accept: text/event-stream".
+    """
+    start_time = time.time()
+    job_id = str(uuid.uuid4())
+
+    _validate_request(jd_text, resumes)
+    if top_k < 1 or snapshot_every < 1:
+        raise HTTPException(status_code=400, detail="top_k and snapshot_every must be positive")
+
+    timings: Dict[str, float] = {}
+    spool = _new_upload_spool()
+    try:
+        stage_start = time.perf_counter()
+        files, skipped_files = await _read_uploads(resumes, spool)
+        timings["upload_read"] = time.perf_counter() - stage_start
+        _require_candidates(files)
+    except BaseException:
+        spool.cleanup()
+        raise
+
+    sse = "text/event-stream" in request.headers.get("accept", "")
+    events = _stream_evaluation(
+        job_id, jd_text, files, skipped_files, start_time, top_k, snapshot_every, sse, timings, spool
+    )
+    return StreamingResponse(events, media_type="text/event-stream" if sse else "application/x-ndjson")
+
+
+@app.post("/api/jobs", status_code=202)
+async def submit_evaluation_job(
+    request: Request,
+    jd_text: str = Form(...),
+    resumes: List[UploadFile] = File(...),
+) -> JSONResponse:
+    """
+    Queue an evaluation and return its job_id immediately.
+
+    Poll GET /api/jobs/{job_id} for progress and fetch the ranked
+    candidates from GET /api/jobs/{job_id}/results once completed.
+    """
+    _validate_request(jd_text, resumes)
+
+    job_id = str(uuid.uuid4())
+    timings: Dict[str, float] = {}
+    profile = _should_profile(request)
+
+    # The spooled files are deleted by the job once extracted
+    spool = _new_upload_spool()
+    try:
+        stage_start = time.perf_counter()
+        files, skipped_files = await _read_uploads(resumes, spool)
+        timings["upload_read"] = time.perf_counter() - stage_start
+    except BaseException:
+        spool.cleanup()
+        raise
+
+    def run_job(progress: Callable[[int, int], None]) -> Dict[str, Any]:
+        start_time = time.time()
+
+        profiler = try_start_profile(job_id, PROFILE_DIR) if profile else None
+        try:
+            stage_start = time.perf_counter()
+            try:
+                candidates, extraction_skipped, truncated = _run_stage(
+                    profiler, "pdf_extraction", _extract_candidates, files
+                )
+            finally:
+                spool.cleanup()
+            timings["pdf_extraction"] = time.perf_counter() - stage_start
+            if len(candidates) == 0:
+                raise ValueError("No valid PDF resumes could be processed. All files were skipped.")
+
+            progress(0, len(candidates))
+            raw_results = _run_stage(
+                profiler, "evaluate_candidates",
+                functools.partial(
+                    _score, progress_callback=progress, timings=timings, n_workers=_profiled_workers(profiler)
+                ),
+                jd_text, candidates,
+            )
+            _mark_truncated(raw_results, truncated)
+        finally:
+            if profiler is not None:
+                _finish_profile(profiler)
+
+        processing_time = time.time() - start_time
+        _record_evaluation("jobs", len(candidates), timings, processing_time)
+
+        # Keep unranked results; pages are ranked when requested
+        return {
+            "total_candidates": len(candidates),
+            "raw_results": raw_results,
+            "skipped_files": skipped_files + extraction_skipped,
+            "processing_time": processing_time,
+            "stage_timings": dict(timings),
+        }
+
+    status = job_manager.submit(job_id, run_job, total=len(files))
+    status["skipped_files"] = skipped_files
+
+    return JSONResponse(status_code=202, content=status)
+
+
+@app.get("/api/jobs/{job_id}")
+async def get_job_status(job_id: str) -> JSONResponse:
+    """Return the status and progress of an evaluation job."""
+    status = job_manager.status(job_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    return JSONResponse(content=status)
+
+
+@app.get("/api/jobs/{job_id}/results")
+async def get_job_results(
+    job_id: str,
+    limit: Optional[int] = Query(None, ge=1),
+    offset: int = Query(0, ge=0),
+) -> JSONResponse:
+    """
+    Return the ranked results of a completed evaluation job.
+
+    Each page is selected (and its reasons generated) on demand from the
+    stored scores, so later pages cost nothing until requested.
+    """
+    status = job_manager.status(job_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    if status["status"] == JOB_FAILED:
+        raise HTTPException(status_code=500, detail=f"Error during model evaluation: {status['error']}")
+
+    if status["status"] != JOB_COMPLETED:
+        raise HTTPException(status_code=409, detail=f"Job is {status['status']}")
+
+    result = job_manager.result(job_id)
+
+    stage_start = time.perf_counter()
+    ranked = await run_blocking(rank_candidates, result["raw_results"], limit, offset)
+    ranking_seconds = time.perf_counter() - stage_start
+    STAGE_SECONDS.observe(ranking_seconds, stage="ranking")
+
+    return JSONResponse(content=_build_response(
+        job_id,
+        result["total_candidates"],
+        ranked,
+        result["skipped_files"],
+        result["processing_time"],
+        limit,
+        offset,
+        {**result["stage_timings"], "ranking": ranking_seconds},
+    ))
 
 
 @app.get("/health")
 async def health_check():
-    """Health check endpoint"""
-    try:
-        from resume_model_engine.src.pipeline import evaluate_candidates as _  # noqa: F401
-        model_status = "available"
-    except Exception as e:
-        model_status = f"unavailable: {str(e)}"
+    """Health check endpoint (cheap: does not import or load any model)"""
+    pdf_text_cache = get_pdf_text_cache()
+    feature_cache = get_feature_cache()
 
     return {
         "status": "healthy",
-        "model_engine": model_status,
+        # The engine is imported at startup; its heavy dependencies (spaCy,
+        # scikit-learn, NumPy, PyMuPDF) only load on first use
+        "model_engine": "available",
+        "pdf_text_cache": pdf_text_cache.stats() if pdf_text_cache else "disabled",
+        "feature_cache": feature_cache.stats() if feature_cache else "disabled",
         "timestamp": time.time(),
     }
 
 
+@app.get("/metrics")
+async def metrics_endpoint() -> Response:
+    """Prometheus metrics in the text exposition format"""
+    return Response(content=metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+@app.get("/ready")
+async def readiness_check():
+    """
+    Readiness check: 200 once every component is loaded and warm, 503 otherwise
+
+    Each component reports its status (pending, loading, ready or failed),
+    load time and error, if any.
+    """
+    components = {name: dict(status) for name, status in component_status.items()}
+    ready = all(status["status"] == COMPONENT_READY for status in components.values())
+
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={
+            "status": "ready" if ready else "not_ready",
+            "components": components,
+            "timestamp": time.time(),
+        },
+    )
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
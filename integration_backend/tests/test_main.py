@@ -0,0 +1,771 @@
+"""
+Tests for the integration backend API.
+"""
+
+import asyncio
+import io
+import json
+import os
+import sys
+import tarfile
+import tempfile
+import threading
+import time
+import zipfile
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import fitz  # PyMuPDF
+import httpx
+
+import main
+from utils.jobs import JobManager
+from utils.metrics import MetricsRegistry
+from resume_model_engine.src.pdf_loader import extract_pdf_text_bounded
+from utils.pdf_parser import extract_text_from_pdf_bounded
+
+
+def _make_pdf(text: str) -> bytes:
+    """Build a one-page PDF containing text."""
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((72, 72), text)
+    pdf_bytes = doc.tobytes()
+    doc.close()
+    return pdf_bytes
+
+
+def test_health_responsive_during_evaluation():
+    """Test /health answers quickly while a long evaluation is in flight."""
+    print("Testing event loop responsiveness...")
+
+    evaluation_seconds = 1.5
+
+    def slow_evaluate(jd_text, candidates, **kwargs):
+        # Stand-in for a large screening request
+        time.sleep(evaluation_seconds)
+        return [{"candidate_id": candidate_id} for candidate_id in candidates]
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            files = [
+                ("resumes", (f"resume_{i}.pdf", _make_pdf(f"Python developer {i}"), "application/pdf"))
+                for i in range(3)
+            ]
+            evaluation = asyncio.create_task(
+                client.post("/api/evaluate", data={"jd_text": "Python developer"}, files=files)
+            )
+
+            # Let the evaluation start before probing health
+            await asyncio.sleep(0.3)
+            assert not evaluation.done()
+
+            start = time.perf_counter()
+            health = await client.get("/health")
+            health_seconds = time.perf_counter() - start
+
+            response = await evaluation
+            return health, health_seconds, response
+
+    original_evaluate = main.evaluate_candidates
+    main.evaluate_candidates = slow_evaluate
+    try:
+        health, health_seconds, response = asyncio.run(scenario())
+    finally:
+        main.evaluate_candidates = original_evaluate
+
+    assert health.status_code == 200
+    assert health_seconds < 0.2
+    assert response.status_code == 200
+    assert response.json()["total_candidates"] == 3
+
+    print(f"✓ Health answered in {health_seconds * 1000:.1f} ms during evaluation")
+
+
+def test_job_api():
+    """Test submitting an evaluation job, polling progress and fetching results."""
+    print("Testing job API...")
+
+    def fake_score(jd_text, candidates, progress_callback=None, **kwargs):
+        results = []
+        for i, candidate_id in enumerate(candidates):
+            time.sleep(0.1)
+            results.append({"candidate_id": candidate_id, "final_match_score": [50.0, 80.0, 65.0][i]})
+            if progress_callback is not None:
+                progress_callback(i + 1, len(candidates))
+        return results
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            files = [
+                ("resumes", (f"resume_{i}.pdf", _make_pdf(f"Python developer {i}"), "application/pdf"))
+                for i in range(3)
+            ]
+            files.append(("resumes", ("notes.txt", b"not a pdf", "text/plain")))
+
+            submitted = await client.post("/api/jobs", data={"jd_text": "Python developer"}, files=files)
+            assert submitted.status_code == 202
+            job_id = submitted.json()["job_id"]
+
+            early = await client.get(f"/api/jobs/{job_id}/results")
+            assert early.status_code == 409
+
+            statuses = []
+            for _ in range(100):
+                status = (await client.get(f"/api/jobs/{job_id}")).json()
+                statuses.append(status)
+                if status["status"] in ("completed", "failed"):
+                    break
+                await asyncio.sleep(0.05)
+
+            results = await client.get(f"/api/jobs/{job_id}/results")
+            page = await client.get(f"/api/jobs/{job_id}/results", params={"limit": 1, "offset": 1})
+            missing = await client.get("/api/jobs/does-not-exist")
+            return submitted.json(), statuses, results, page, missing
+
+    original_score = main.score_candidates
+    main.score_candidates = fake_score
+    try:
+        submitted, statuses, results, page, missing = asyncio.run(scenario())
+    finally:
+        main.score_candidates = original_score
+
+    assert submitted["skipped_files"] == [{"filename": "notes.txt", "reason": "Not a PDF file"}]
+    assert statuses[-1]["status"] == "completed"
+    assert statuses[-1]["progress"] == {"done": 3, "total": 3}
+    assert any(s["status"] == "running" for s in statuses)
+
+    assert results.status_code == 200
+    body = results.json()
+    assert body["job_id"] == submitted["job_id"]
+    assert body["total_candidates"] == 3
+    assert [r["candidate_id"] for r in body["results"]] == ["resume_1", "resume_2", "resume_0"]
+    assert body["skipped_files"] == submitted["skipped_files"]
+
+    assert page.status_code == 200
+    assert page.json()["total_candidates"] == 3
+    assert page.json()["offset"] == 1 and page.json()["limit"] == 1
+    assert [r["candidate_id"] for r in page.json()["results"]] == ["resume_2"]
+
+    assert missing.status_code == 404
+
+    print("✓ Job API tests passed")
+
+
+def test_job_submit_during_shutdown():
+    """Test jobs submitted while the manager shuts down never hit a closed executor."""
+    print("Testing job submission during shutdown...")
+
+    class RecordingExecutor:
+        # Stand-in executor recording whether the manager lock was held
+        def __init__(self):
+            self.locked = []
+
+        def submit(self, fn, *args):
+            self.locked.append(manager._lock.locked())
+
+        def shutdown(self, wait=True, cancel_futures=False):
+            pass
+
+    manager = JobManager(max_workers=1)
+    executor = RecordingExecutor()
+    manager._executor = executor
+    manager.submit("job", lambda progress: None)
+    assert executor.locked == [True]
+
+    # Concurrent submissions and shutdowns never reach a closed executor
+    errors = []
+
+    def submit_jobs(manager):
+        try:
+            for i in range(50):
+                manager.submit(f"job-{i}", lambda progress: None)
+        except Exception as e:
+            errors.append(e)
+
+    for _ in range(20):
+        manager = JobManager(max_workers=1)
+        submitter = threading.Thread(target=submit_jobs, args=(manager,))
+        submitter.start()
+        for _ in range(10):
+            manager.shutdown()
+        submitter.join()
+        manager.shutdown()
+
+    assert errors == []
+
+    print("✓ Job submission during shutdown tests passed")
+
+
+def test_evaluate_stream():
+    """Test streamed results arrive incrementally and end with a ranked summary."""
+    print("Testing streaming evaluation...")
+
+    delay = 0.3
+    scores = [40.0, 90.0, 65.0, 90.0]
+
+    def slow_iter_results(jd_text, candidates, **kwargs):
+        # Yield in reverse input order to exercise the final re-ranking
+        candidate_ids = [candidate_id for candidate_id, _ in candidates]
+        for candidate_id, score in reversed(list(zip(candidate_ids, scores))):
+            time.sleep(delay)
+            yield {"candidate_id": candidate_id, "final_match_score": score, "short_reason": "ok"}
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            files = [
+                ("resumes", (f"resume_{i}.pdf", _make_pdf(f"Python developer {i}"), "application/pdf"))
+                for i in range(len(scores))
+            ]
+            events = []
+            async with client.stream(
+                "POST",
+                "/api/evaluate/stream",
+                data={"jd_text": "Python developer", "top_k": "2", "snapshot_every": "2"},
+                files=files,
+            ) as response:
+                assert response.status_code == 200
+                assert response.headers["content-type"].startswith("application/x-ndjson")
+                async for line in response.aiter_lines():
+                    if line:
+                        events.append(json.loads(line))
+            return events
+
+    original_iter = main.iter_candidate_results
+    main.iter_candidate_results = slow_iter_results
+    try:
+        events = asyncio.run(scenario())
+    finally:
+        main.iter_candidate_results = original_iter
+
+    async def collect_stream():
+        # Consume the event generator directly (the ASGI test transport
+        # buffers response bodies) to check results are emitted incrementally
+        files = [(f"resume_{i}.pdf", _make_pdf(f"Python developer {i}")) for i in range(len(scores))]
+        times = []
+        start = time.perf_counter()
+        async for line in main._stream_evaluation("job", "jd", files, [], start, 2, 2, False):
+            times.append((time.perf_counter() - start, json.loads(line)["event"]))
+        return times
+
+    main.iter_candidate_results = slow_iter_results
+    try:
+        times = asyncio.run(collect_stream())
+    finally:
+        main.iter_candidate_results = original_iter
+
+    kinds = [event["event"] for event in events]
+    assert kinds == ["start", "result", "result", "top_k", "result", "result", "summary"]
+    assert [kind for _, kind in times] == kinds
+
+    # The reversed stand-in scorer only yields once every resume is read
+    assert times[-1][0] >= len(scores) * delay
+
+    streamed = [event["candidate"] for event in events if event["event"] == "result"]
+    assert streamed[0]["candidate_id"] == "resume_3"
+    assert streamed[0]["emails"] == ["NA"]  # sanitized
+
+    snapshot = events[3]
+    assert [c["candidate_id"] for c in snapshot["top"]] == ["resume_3", "resume_2"]
+
+    summary = events[-1]
+    assert summary["total_candidates"] == 4
+    assert [c["candidate_id"] for c in summary["results"]] == ["resume_1", "resume_3", "resume_2", "resume_0"]
+
+    print("✓ Streaming evaluation tests passed")
+
+
+def test_stream_extracts_incrementally():
+    """Test the first streamed result arrives before the PDFs of the whole batch are extracted."""
+    print("Testing incremental PDF extraction while streaming...")
+
+    delay = 0.3
+    pdfs = [_make_pdf(f"Python developer {i}") for i in range(4)]
+    extracted = []
+
+    original_extract = main.extract_text_from_pdf_bounded
+    original_iter = main.iter_candidate_results
+
+    def slow_extract(pdf_source, *args, **kwargs):
+        time.sleep(delay)
+        extracted.append(pdf_source)
+        return original_extract(pdf_source, *args, **kwargs)
+
+    def lazy_iter_results(jd_text, candidates, **kwargs):
+        # Scores one candidate at a time, like the engine with a pre-fitted model
+        for candidate_id, _ in candidates:
+            yield {"candidate_id": candidate_id, "final_match_score": 50.0, "short_reason": "ok"}
+
+    async def collect_stream():
+        files = [(f"resume_{i}.pdf", pdf) for i, pdf in enumerate(pdfs)]
+        files.insert(2, ("blank.pdf", _make_pdf("")))
+        events = []
+        start = time.perf_counter()
+        async for line in main._stream_evaluation("job", "jd", files, [], start, 10, 10, False):
+            events.append((time.perf_counter() - start, len(extracted), json.loads(line)))
+        return events
+
+    main.extract_text_from_pdf_bounded = slow_extract
+    main.iter_candidate_results = lazy_iter_results
+    try:
+        events = asyncio.run(collect_stream())
+    finally:
+        main.extract_text_from_pdf_bounded = original_extract
+        main.iter_candidate_results = original_iter
+
+    first_at, first_extracted, first = next(e for e in events if e[2]["event"] == "result")
+    assert first["candidate"]["candidate_id"] == "resume_0"
+    assert first_extracted == 1
+    assert first_at < 2 * delay
+    assert events[-1][0] >= (len(pdfs) + 1) * delay
+
+    kinds = [event["event"] for _, _, event in events]
+    assert kinds == ["start", "result", "result", "skipped", "result", "result", "summary"]
+    assert events[0][2]["total_candidates"] == 5
+    assert events[3][2]["filename"] == "blank.pdf"
+
+    summary = events[-1][2]
+    assert summary["total_candidates"] == 4
+    assert [s["filename"] for s in summary["skipped_files"]] == ["blank.pdf"]
+
+    print("✓ Incremental streaming extraction tests passed")
+
+
+def test_readiness_after_warm_up():
+    """Test /ready reports per-component status and only succeeds once warm."""
+    print("Testing startup warm-up and readiness...")
+
+    def slow_step():
+        time.sleep(0.3)
+
+    def failing_step():
+        raise RuntimeError("model missing")
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=main.app)
+        async with main.lifespan(main.app):
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                first = await client.get("/ready")
+                health = await client.get("/health")
+                for _ in range(100):
+                    last = await client.get("/ready")
+                    statuses = [c["status"] for c in last.json()["components"].values()]
+                    if all(status in ("ready", "failed") for status in statuses):
+                        break
+                    await asyncio.sleep(0.05)
+                return first, health, last
+
+    original_steps = main._warm_up_steps
+    main._warm_up_steps = lambda: [("fast", lambda: None), ("slow", slow_step)]
+    try:
+        first, health, last = asyncio.run(scenario())
+        main._warm_up_steps = lambda: [("fast", lambda: None), ("broken", failing_step)]
+        _, _, failed = asyncio.run(scenario())
+    finally:
+        main._warm_up_steps = original_steps
+
+    # Not ready while warming up, but alive
+    assert first.status_code == 503
+    assert first.json()["status"] == "not_ready"
+    assert set(first.json()["components"]) == {"fast", "slow"}
+    assert health.status_code == 200
+
+    assert last.status_code == 200
+    assert last.json()["status"] == "ready"
+    assert last.json()["components"]["slow"]["status"] == "ready"
+    assert last.json()["components"]["slow"]["load_time_ms"] >= 300
+
+    assert failed.status_code == 503
+    broken = failed.json()["components"]["broken"]
+    assert broken["status"] == "failed" and broken["error"] == "model missing"
+    assert failed.json()["components"]["fast"]["status"] == "ready"
+
+    print("✓ Readiness tests passed")
+
+
+def test_metrics_registry():
+    """Test counters and histograms render in the Prometheus text format."""
+    print("Testing metrics registry...")
+
+    registry = MetricsRegistry()
+    requests = registry.counter("demo_requests_total", "Requests", ["path"])
+    latency = registry.histogram("demo_latency_seconds", "Latency", ["stage"], buckets=(0.1, 1.0))
+
+    requests.inc(path="/a")
+    requests.inc(2, path='say "hi"\n')
+    for value in (0.05, 0.5, 0.7, 3.0):
+        latency.observe(value, stage="ner")
+
+    text = registry.render()
+    assert "# TYPE demo_requests_total counter" in text
+    assert 'demo_requests_total{path="/a"} 1' in text
+    assert 'demo_requests_total{path="say \\"hi\\"\\n"} 2' in text
+    assert "# TYPE demo_latency_seconds histogram" in text
+    assert 'demo_latency_seconds_bucket{stage="ner",le="0.1"} 1' in text
+    assert 'demo_latency_seconds_bucket{stage="ner",le="1"} 3' in text
+    assert 'demo_latency_seconds_bucket{stage="ner",le="+Inf"} 4' in text
+    assert 'demo_latency_seconds_sum{stage="ner"} 4.25' in text
+    assert 'demo_latency_seconds_count{stage="ner"} 4' in text
+
+    try:
+        requests.inc(stage="x")
+        assert False, "Wrong labels should be rejected"
+    except ValueError:
+        pass
+
+    print("✓ Metrics registry tests passed")
+
+
+def test_evaluate_metrics():
+    """Test /api/evaluate returns stage timings and updates /metrics."""
+    print("Testing evaluation metrics...")
+
+    def fake_evaluate(jd_text, candidates, timings=None, **kwargs):
+        for stage in ("clean", "skills", "contact", "ner", "similarity", "scoring", "ranking"):
+            timings[stage] = 0.01
+        return [{"candidate_id": candidate_id} for candidate_id in candidates]
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            files = [
+                ("resumes", (f"resume_{i}.pdf", _make_pdf(f"Python developer {i}"), "application/pdf"))
+                for i in range(2)
+            ]
+            files.append(("resumes", ("notes.txt", b"not a pdf", "text/plain")))
+            response = await client.post("/api/evaluate", data={"jd_text": "Python developer"}, files=files)
+            exposition = await client.get("/metrics")
+            return response, exposition
+
+    processed_before = main.CANDIDATES_PROCESSED.value(endpoint="evaluate")
+    skipped_before = main.FILES_SKIPPED.value(reason="not_pdf")
+    ner_before = main.STAGE_SECONDS.count(stage="ner")
+
+    original_evaluate = main.evaluate_candidates
+    main.evaluate_candidates = fake_evaluate
+    try:
+        response, exposition = asyncio.run(scenario())
+    finally:
+        main.evaluate_candidates = original_evaluate
+
+    assert response.status_code == 200
+    stage_timings = response.json()["stage_timings_ms"]
+    assert set(stage_timings) == {
+        "upload_read", "pdf_extraction", "clean", "skills", "contact", "ner", "similarity", "scoring", "ranking",
+    }
+    assert stage_timings["ner"] == 10.0
+
+    assert main.CANDIDATES_PROCESSED.value(endpoint="evaluate") == processed_before + 2
+    assert main.FILES_SKIPPED.value(reason="not_pdf") == skipped_before + 1
+    assert main.STAGE_SECONDS.count(stage="ner") == ner_before + 1
+    assert main.STAGE_SECONDS.count(stage="serialization") >= 1
+
+    assert exposition.status_code == 200
+    assert exposition.headers["content-type"].startswith("text/plain")
+    assert 'resume_stage_duration_seconds_count{stage="pdf_extraction"}' in exposition.text
+    assert 'resume_files_skipped_total{reason="not_pdf"}' in exposition.text
+    assert 'resume_request_duration_seconds_bucket{endpoint="evaluate",le="+Inf"}' in exposition.text
+
+    print("✓ Evaluation metrics tests passed")
+
+
+def test_request_profiling():
+    """Test profiled requests write cProfile/tracemalloc output keyed by job_id."""
+    print("Testing request profiling...")
+
+    worker_counts = []
+
+    def fake_evaluate(jd_text, candidates, timings=None, **kwargs):
+        worker_counts.append(kwargs["n_workers"])
+        return [{"candidate_id": candidate_id} for candidate_id in candidates]
+
+    async def scenario(headers):
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            files = [("resumes", ("resume.pdf", _make_pdf("Python developer"), "application/pdf"))]
+            return await client.post(
+                "/api/evaluate", data={"jd_text": "Python developer"}, files=files, headers=headers
+            )
+
+    originals = (
+        main.evaluate_candidates, main.PROFILE_DIR, main.PROFILE_ADMIN_TOKEN, main.PROFILE_SAMPLE_RATE,
+        main.EVAL_WORKERS,
+    )
+    with tempfile.TemporaryDirectory() as profile_dir:
+        main.evaluate_candidates = fake_evaluate
+        main.EVAL_WORKERS = 4
+        main.PROFILE_DIR = profile_dir
+        main.PROFILE_ADMIN_TOKEN = "secret"
+        main.PROFILE_SAMPLE_RATE = 0.0
+        try:
+            # No token and sampling disabled: nothing is written
+            response = asyncio.run(scenario({}))
+            assert response.status_code == 200
+            assert os.listdir(profile_dir) == []
+
+            # Wrong token is ignored
+            response = asyncio.run(scenario({"X-Profile-Token": "wrong"}))
+            assert response.status_code == 200
+            assert os.listdir(profile_dir) == []
+
+            response = asyncio.run(scenario({"X-Profile-Token": "secret"}))
+            assert response.status_code == 200
+            job_id = response.json()["job_id"]
+            output_dir = os.path.join(profile_dir, job_id)
+            for name in ("pdf_extraction.prof", "evaluate_candidates.prof", "evaluate_candidates.txt"):
+                assert os.path.isfile(os.path.join(output_dir, name)), name
+
+            with open(os.path.join(output_dir, "summary.json"), "r", encoding="utf-8") as f:
+                summary = json.load(f)
+            assert summary["job_id"] == job_id
+            assert set(summary["stages"]) == {"pdf_extraction", "evaluate_candidates"}
+            assert "top_allocations" in summary["stages"]["pdf_extraction"]
+
+            # Profiled requests skip the worker pool cProfile cannot see
+            assert worker_counts == [4, 4, 1]
+
+            # Sampling every request profiles without the token
+            main.PROFILE_SAMPLE_RATE = 1.0
+            response = asyncio.run(scenario({}))
+            assert os.path.isdir(os.path.join(profile_dir, response.json()["job_id"]))
+        finally:
+            (
+                main.evaluate_candidates, main.PROFILE_DIR, main.PROFILE_ADMIN_TOKEN, main.PROFILE_SAMPLE_RATE,
+                main.EVAL_WORKERS,
+            ) = originals
+
+    print("✓ Request profiling tests passed")
+
+
+def test_truncated_pdf_extraction():
+    """Test oversized PDFs are read up to the limits and flagged as truncated."""
+    print("Testing truncated PDF extraction...")
+
+    document = fitz.open()
+    for i in range(1, 5):
+        document.new_page().insert_text((72, 72), f"Page {i} Python developer")
+    portfolio_pdf = document.tobytes()
+    document.close()
+
+    no_limits = {"max_pages": None, "max_chars": None, "time_budget_sec": None}
+    full_text, truncated = extract_text_from_pdf_bounded(portfolio_pdf, limits=no_limits)
+    assert not truncated and "Page 4" in full_text
+
+    text, truncated = extract_text_from_pdf_bounded(portfolio_pdf, limits={**no_limits, "max_pages": 2})
+    assert truncated and "Page 2" in text and "Page 3" not in text
+
+    text, truncated = extract_text_from_pdf_bounded(portfolio_pdf, limits={**no_limits, "max_chars": 10})
+    assert truncated and len(text) <= 10 and full_text.startswith(text)
+
+    # Both extractors read pages through the engine's PdfPageReader, so they
+    # agree on truncation (a trailing blank page is not truncation)
+    document = fitz.open(stream=portfolio_pdf, filetype="pdf")
+    document.new_page()
+    padded_pdf = document.tobytes()
+    document.close()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pdf_path = Path(tmp_dir) / "portfolio.pdf"
+        pdf_path.write_bytes(padded_pdf)
+        for limits in (
+            no_limits,
+            {**no_limits, "max_pages": 4},
+            {**no_limits, "max_pages": 5},
+            {**no_limits, "max_chars": len(full_text)},
+            {**no_limits, "max_chars": 30},
+        ):
+            backend_truncated = extract_text_from_pdf_bounded(padded_pdf, limits=limits)[1]
+            assert backend_truncated == extract_pdf_text_bounded(pdf_path, limits=limits)[1], limits
+        assert not extract_text_from_pdf_bounded(padded_pdf, limits={**no_limits, "max_pages": 5})[1]
+
+    def fake_evaluate(jd_text, candidates, timings=None, **kwargs):
+        return [{"candidate_id": candidate_id} for candidate_id in candidates]
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            files = [
+                ("resumes", ("portfolio.pdf", portfolio_pdf, "application/pdf")),
+                ("resumes", ("resume.pdf", _make_pdf("Python developer"), "application/pdf")),
+            ]
+            return await client.post("/api/evaluate", data={"jd_text": "Python developer"}, files=files)
+
+    truncated_before = main.FILES_TRUNCATED.value()
+    original_evaluate = main.evaluate_candidates
+    original_max_pages = os.environ.get("PDF_MAX_PAGES")
+    main.evaluate_candidates = fake_evaluate
+    os.environ["PDF_MAX_PAGES"] = "2"
+    try:
+        response = asyncio.run(scenario())
+    finally:
+        main.evaluate_candidates = original_evaluate
+        if original_max_pages is None:
+            del os.environ["PDF_MAX_PAGES"]
+        else:
+            os.environ["PDF_MAX_PAGES"] = original_max_pages
+
+    assert response.status_code == 200
+    flags = {c["candidate_id"]: c["truncated"] for c in response.json()["results"]}
+    assert flags == {"portfolio": True, "resume": False}
+    assert main.FILES_TRUNCATED.value() == truncated_before + 1
+
+    print("✓ Truncated PDF extraction tests passed")
+
+
+def test_upload_spooling():
+    """Test uploads are spooled to disk with size limits and cleaned up."""
+    print("Testing upload spooling...")
+
+    def fake_evaluate(jd_text, candidates, timings=None, **kwargs):
+        return [{"candidate_id": candidate_id} for candidate_id in candidates]
+
+    async def scenario(files):
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.post("/api/evaluate", data={"jd_text": "Python developer"}, files=files)
+
+    resume_pdf = _make_pdf("Python developer")
+    large_pdf = resume_pdf + b"%" + b"x" * (1024 * 1024)
+
+    originals = (main.evaluate_candidates, main.UPLOAD_SPOOL_DIR, main.MAX_UPLOAD_FILE_MB, main.MAX_UPLOAD_REQUEST_MB)
+    with tempfile.TemporaryDirectory() as spool_dir:
+        main.evaluate_candidates = fake_evaluate
+        main.UPLOAD_SPOOL_DIR = spool_dir
+        main.MAX_UPLOAD_FILE_MB = 1
+        main.MAX_UPLOAD_REQUEST_MB = 2
+        try:
+            skipped_before = main.FILES_SKIPPED.value(reason="too_large")
+            response = asyncio.run(scenario([
+                ("resumes", ("resume.pdf", resume_pdf, "application/pdf")),
+                ("resumes", ("large.pdf", large_pdf, "application/pdf")),
+            ]))
+            assert response.status_code == 200
+            body = response.json()
+            assert [c["candidate_id"] for c in body["results"]] == ["resume"]
+            assert body["skipped_files"] == [{"filename": "large.pdf", "reason": "File exceeds the 1 MB limit"}]
+            assert main.FILES_SKIPPED.value(reason="too_large") == skipped_before + 1
+
+            # Requests over the total limit are rejected
+            response = asyncio.run(scenario([
+                ("resumes", (f"large_{i}.pdf", large_pdf, "application/pdf")) for i in range(3)
+            ]))
+            assert response.status_code == 413
+
+            # Spooled files are removed once the request is done
+            assert os.listdir(spool_dir) == []
+        finally:
+            (
+                main.evaluate_candidates,
+                main.UPLOAD_SPOOL_DIR,
+                main.MAX_UPLOAD_FILE_MB,
+                main.MAX_UPLOAD_REQUEST_MB,
+            ) = originals
+
+    print("✓ Upload spooling tests passed")
+
+
+def test_evaluate_archive():
+    """Test evaluating the PDFs of ZIP and tar.gz archives, with zip bomb limits."""
+    print("Testing archive evaluation...")
+
+    def fake_evaluate(jd_text, candidates, timings=None, **kwargs):
+        return [{"candidate_id": candidate_id} for candidate_id in candidates]
+
+    def make_zip(entries):
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr("packet/", b"")
+            for name, content in entries:
+                archive.writestr(name, content)
+        return buffer.getvalue()
+
+    def make_tar_gz(entries):
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+            for name, content in entries:
+                info = tarfile.TarInfo(name)
+                info.size = len(content)
+                archive.addfile(info, io.BytesIO(content))
+        return buffer.getvalue()
+
+    async def scenario(filename, content):
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.post(
+                "/api/evaluate/archive",
+                data={"jd_text": "Python developer"},
+                files={"archive": (filename, content, "application/octet-stream")},
+            )
+
+    entries = [
+        ("packet/alice.pdf", _make_pdf("Python developer")),
+        ("packet/bob.pdf", _make_pdf("Java developer")),
+        ("packet/notes.txt", b"not a pdf"),
+        ("packet/broken.pdf", b"not a pdf either"),
+    ]
+
+    originals = (main.evaluate_candidates, main.ARCHIVE_MAX_ENTRIES, main.ARCHIVE_MAX_EXTRACTED_MB)
+    main.evaluate_candidates = fake_evaluate
+    try:
+        for filename, content in [("packet.zip", make_zip(entries)), ("packet.tar.gz", make_tar_gz(entries))]:
+            response = asyncio.run(scenario(filename, content))
+            assert response.status_code == 200, response.text
+            body = response.json()
+            assert sorted(c["candidate_id"] for c in body["results"]) == ["packet/alice", "packet/bob"]
+            reasons = {item["filename"]: item["reason"] for item in body["skipped_files"]}
+            assert reasons["packet/notes.txt"] == "Not a PDF file"
+            assert reasons["packet/broken.pdf"].startswith("Error processing PDF")
+
+        # Same file name in different folders: distinct candidates
+        duplicates = [
+            ("alice/resume.pdf", _make_pdf("Alice alice@example.com Python")),
+            ("bob/resume.pdf", _make_pdf("Bob bob@example.com Java")),
+            ("./bob/resume.pdf", _make_pdf("Bob again")),
+        ]
+        for filename, content in [("dups.zip", make_zip(duplicates)), ("dups.tar.gz", make_tar_gz(duplicates))]:
+            body = asyncio.run(scenario(filename, content)).json()
+            assert body["total_candidates"] == 2
+            assert sorted(c["candidate_id"] for c in body["results"]) == ["alice/resume", "bob/resume"]
+            assert body["skipped_files"] == [
+                {"filename": "./bob/resume.pdf", "reason": "Duplicate candidate id 'bob/resume'"}
+            ]
+
+        # Entry-count limit
+        main.ARCHIVE_MAX_ENTRIES = 3
+        assert asyncio.run(scenario("packet.zip", make_zip(entries))).status_code == 413
+        main.ARCHIVE_MAX_ENTRIES = originals[1]
+
+        # Decompressed-size limit: 4 MB of zeros compresses to a few KB
+        main.ARCHIVE_MAX_EXTRACTED_MB = 1
+        bomb = [("bomb.pdf", b"\0" * (4 * 1024 * 1024))]
+        assert asyncio.run(scenario("bomb.zip", make_zip(bomb))).status_code == 413
+        assert asyncio.run(scenario("bomb.tar.gz", make_tar_gz(bomb))).status_code == 413
+        main.ARCHIVE_MAX_EXTRACTED_MB = originals[2]
+
+        # Invalid archives and unsupported file names are rejected
+        assert asyncio.run(scenario("packet.zip", b"not an archive")).status_code == 400
+        assert asyncio.run(scenario("packet.rar", make_zip(entries))).status_code == 400
+    finally:
+        main.evaluate_candidates, main.ARCHIVE_MAX_ENTRIES, main.ARCHIVE_MAX_EXTRACTED_MB = originals
+
+    print("✓ Archive evaluation tests passed")
+
+
+if __name__ == "__main__":
+    test_health_responsive_during_evaluation()
+    test_job_api()
+    test_job_submit_during_shutdown()
+    test_evaluate_stream()
+    test_stream_extracts_incrementally()
+    test_readiness_after_warm_up()
+    test_metrics_registry()
+    test_evaluate_metrics()
+    test_request_profiling()
+    test_truncated_pdf_extraction()
+    test_upload_spooling()
+    test_evaluate_archive()
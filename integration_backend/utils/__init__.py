@@ -2,6 +2,6 @@
 Utils package for integration backend
 """
 
-from .pdf_parser import extract_text_from_pdf
+from .pdf_parser import extract_text_from_pdf, extract_text_from_pdf_bounded
 
-__all__ = ['extract_text_from_pdf']
+__all__ = ['extract_text_from_pdf', 'extract_text_from_pdf_bounded']
@@ -0,0 +1,171 @@
+"""
+Archive Reader
+Iterates the files of a ZIP or tar(.gz) archive one entry at a time, without
+unpacking it to disk, with entry-count and decompressed-size limits against
+zip bombs
+"""
+
+import tarfile
+import zipfile
+import zlib
+from pathlib import Path
+from typing import Callable, Iterator, Optional, Tuple
+
+# Supported archive file name suffixes
+ARCHIVE_SUFFIXES = (".zip", ".tar.gz", ".tgz", ".tar")
+
+# Bytes decompressed at a time
+CHUNK_SIZE = 1024 * 1024
+
+
+class ArchiveError(ValueError):
+    """Raised when an archive is corrupt or not a supported format"""
+
+
+class ArchiveLimitError(ArchiveError):
+    """Raised when an archive exceeds the entry-count or decompressed-size limit"""
+
+
+def is_supported_archive(filename: str) -> bool:
+    """Check whether a file name has a supported archive suffix."""
+    return filename.lower().endswith(ARCHIVE_SUFFIXES)
+
+
+class _DecompressionBudget:
+    """Decompressed bytes allowed for one archive."""
+
+    def __init__(self, max_bytes: Optional[int]):
+        self.max_bytes = max_bytes
+        self.used = 0
+
+    def consume(self, n_bytes: int) -> None:
+        self.used += n_bytes
+        if self.max_bytes is not None and self.used > self.max_bytes:
+            raise ArchiveLimitError(
+                f"Archive exceeds the {self.max_bytes // (1024 * 1024)} MB decompressed size limit"
+            )
+
+
+def _read_limited(stream, max_bytes: Optional[int], budget: _DecompressionBudget) -> Optional[bytes]:
+    """
+    Read an entry stream, decompressing at most max_bytes + 1 bytes.
+
+    Returns:
+        Entry content, or None if it is larger than max_bytes
+    """
+    chunks = []
+    size = 0
+    while True:
+        chunk_size = CHUNK_SIZE if max_bytes is None else min(CHUNK_SIZE, max_bytes + 1 - size)
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+
+        size += len(chunk)
+        budget.consume(len(chunk))
+        if max_bytes is not None and size > max_bytes:
+            return None
+        chunks.append(chunk)
+
+    return b"".join(chunks)
+
+
+def iter_archive_files(
+    archive_path: Path,
+    max_entries: Optional[int] = None,
+    max_total_bytes: Optional[int] = None,
+) -> Iterator[Tuple[str, Callable[[Optional[int]], Optional[bytes]]]]:
+    """
+    Iterate the regular files of a ZIP or tar archive (gzip/bz2/xz or plain).
+
+    Yields (entry name, read) pairs. read(max_bytes) decompresses the entry
+    and returns its content, or None if it is larger than max_bytes; it must
+    be called before advancing to the next entry. Entries that are not read
+    are not decompressed (ZIP) or only skipped over (tar).
+
+    Args:
+        archive_path: Path of the archive file
+        max_entries: Maximum number of entries, directories included
+        max_total_bytes: Maximum total decompressed size (counted as bytes
+            are actually decompressed, not taken from the headers)
+
+    Raises:
+        ArchiveLimitError: If a limit is exceeded
+        ArchiveError: If the archive is corrupt or not a supported format
+    """
+    budget = _DecompressionBudget(max_total_bytes)
+
+    if zipfile.is_zipfile(archive_path):
+        yield from _iter_zip_files(archive_path, max_entries, budget)
+    else:
+        yield from _iter_tar_files(archive_path, max_entries, budget)
+
+
+def _check_entry_count(count: int, max_entries: Optional[int]) -> None:
+    if max_entries is not None and count > max_entries:
+        raise ArchiveLimitError(f"Archive has more than {max_entries} entries")
+
+
+def _iter_zip_files(
+    archive_path: Path,
+    max_entries: Optional[int],
+    budget: _DecompressionBudget,
+) -> Iterator[Tuple[str, Callable[[Optional[int]], Optional[bytes]]]]:
+    try:
+        archive = zipfile.ZipFile(archive_path)
+    except (zipfile.BadZipFile, OSError) as e:
+        raise ArchiveError(f"Invalid ZIP archive: {e}")
+
+    with archive:
+        # The central directory lists every entry up front
+        entries = archive.infolist()
+        _check_entry_count(len(entries), max_entries)
+
+        for info in entries:
+            if info.is_dir():
+                continue
+
+            def read(max_bytes: Optional[int], info: zipfile.ZipInfo = info) -> Optional[bytes]:
+                # Declared sizes can lie; _read_limited still stops at max_bytes
+                if max_bytes is not None and info.file_size > max_bytes:
+                    return None
+                with archive.open(info) as stream:
+                    return _read_limited(stream, max_bytes, budget)
+
+            yield info.filename, read
+
+
+def _iter_tar_files(
+    archive_path: Path,
+    max_entries: Optional[int],
+    budget: _DecompressionBudget,
+) -> Iterator[Tuple[str, Callable[[Optional[int]], Optional[bytes]]]]:
+    try:
+        # Stream mode: members are read in order, never seeking back
+        archive = tarfile.open(archive_path, mode="r|*")
+    except (tarfile.TarError, OSError) as e:
+        raise ArchiveError(f"Unsupported or invalid archive: {e}")
+
+    with archive:
+        count = 0
+        try:
+            for member in archive:
+                count += 1
+                _check_entry_count(count, max_entries)
+                if not member.isfile():
+                    continue
+
+                # The stream decompresses skipped members too, so every
+                # regular file counts against the budget
+                budget.consume(member.size)
+
+                def read(max_bytes: Optional[int], member: tarfile.TarInfo = member) -> Optional[bytes]:
+                    if max_bytes is not None and member.size > max_bytes:
+                        return None
+                    stream = archive.extractfile(member)
+                    # Already counted from member.size
+                    return _read_limited(stream, max_bytes, _DecompressionBudget(None))
+
+                yield member.name, read
+        except (tarfile.TarError, EOFError, OSError, zlib.error) as e:
+            raise ArchiveError(f"Invalid tar archive: {e}")
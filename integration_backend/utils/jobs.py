@@ -0,0 +1,136 @@
+"""
+Background Job Manager
+Runs evaluation jobs on a worker pool and tracks their status and progress
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+# Job states
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+
+
+class JobManager:
+    """
+    Queue of background jobs processed by a fixed pool of worker threads.
+
+    Each job is a callable receiving a progress function ``progress(done, total)``
+    and returning the job result. Finished jobs are kept in memory until
+    ``max_jobs`` newer jobs push them out.
+    """
+
+    def __init__(self, max_workers: int = 2, max_jobs: int = 100):
+        self.max_workers = max_workers
+        self.max_jobs = max_jobs
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, job_id: str, func: Callable[[Callable[[int, int], None]], Any], total: int = 0) -> Dict[str, Any]:
+        """
+        Queue a job.
+
+        Args:
+            job_id: Unique job identifier
+            func: Job body, called as func(progress)
+            total: Initial number of work items (for progress reporting)
+
+        Returns:
+            Status snapshot of the queued job
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="resume-job"
+                )
+
+            self._jobs[job_id] = {
+                "job_id": job_id,
+                "status": JOB_QUEUED,
+                "done": 0,
+                "total": total,
+                "created_at": time.time(),
+                "started_at": None,
+                "finished_at": None,
+                "error": None,
+                "result": None,
+            }
+            self._prune()
+            snapshot = self._snapshot(self._jobs[job_id])
+
+            # Submitted under the lock so shutdown() cannot close this
+            # executor in between
+            self._executor.submit(self._run, job_id, func)
+
+        return snapshot
+
+    def _run(self, job_id: str, func: Callable) -> None:
+        """Execute a job and record its outcome."""
+        self._update(job_id, status=JOB_RUNNING, started_at=time.time())
+
+        def progress(done: int, total: int) -> None:
+            self._update(job_id, done=done, total=total)
+
+        try:
+            result = func(progress)
+        except Exception as e:
+            self._update(job_id, status=JOB_FAILED, error=str(e), finished_at=time.time())
+            return
+
+        self._update(job_id, status=JOB_COMPLETED, result=result, finished_at=time.time())
+
+    def _update(self, job_id: str, **fields: Any) -> None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                job.update(fields)
+
+    def _prune(self) -> None:
+        """Drop the oldest finished jobs beyond max_jobs."""
+        excess = len(self._jobs) - self.max_jobs
+        for job_id in list(self._jobs):
+            if excess <= 0:
+                break
+            if self._jobs[job_id]["status"] in (JOB_COMPLETED, JOB_FAILED):
+                del self._jobs[job_id]
+                excess -= 1
+
+    @staticmethod
+    def _snapshot(job: Dict[str, Any]) -> Dict[str, Any]:
+        """Public status view of a job (without its result)."""
+        started_at = job["started_at"]
+        finished_at = job["finished_at"] or time.time()
+        elapsed = finished_at - started_at if started_at else 0.0
+
+        return {
+            "job_id": job["job_id"],
+            "status": job["status"],
+            "progress": {"done": job["done"], "total": job["total"]},
+            "elapsed_sec": round(elapsed, 2),
+            "error": job["error"],
+        }
+
+    def status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return a status snapshot, or None if the job is unknown."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return self._snapshot(job) if job is not None else None
+
+    def result(self, job_id: str) -> Any:
+        """Return the result of a completed job (None otherwise)."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return job["result"] if job is not None else None
+
+    def shutdown(self) -> None:
+        """Stop accepting jobs and cancel queued ones."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -1,18 +1,30 @@
 """
 PDF Parser Utility
-Extracts text from PDF files using PyMuPDF (fitz)
+Extracts text from PDF files page by page using PyMuPDF (fitz), imported on
+first use, stopping early at the page/character/time limits
 """
 
 import io
-import fitz  # PyMuPDF
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
 
+from resume_model_engine.src.pdf_loader import PdfPageReader, get_pdf_limits
+from resume_model_engine.src.text_cache import PdfTextCache, get_pdf_text_cache
 
-def extract_text_from_pdf(pdf_bytes: bytes) -> str:
+# Cache key component for this extractor's output; bump when extraction changes
+PDF_PARSER_VERSION = "pdf_parser-2"
+
+
+def extract_text_from_pdf(pdf_bytes: bytes, cache: Optional[PdfTextCache] = None) -> str:
     """
     Extract text from PDF file bytes
     
+    Same as extract_text_from_pdf_bounded with the configured limits, without
+    the truncation flag.
+    
     Args:
         pdf_bytes: Raw PDF file bytes
+        cache: Optional PDF text cache (defaults to the configured cache)
         
     Returns:
         Extracted text as a single string
@@ -20,26 +32,110 @@ def extract_text_from_pdf(pdf_bytes: bytes) -> str:
     Raises:
         Exception: If PDF cannot be read or parsed
     """
-    try:
-        # Open PDF from bytes
-        pdf_stream = io.BytesIO(pdf_bytes)
-        pdf_document = fitz.open(stream=pdf_stream, filetype="pdf")
-        
-        # Extract text from all pages
-        text_content = []
+    return extract_text_from_pdf_bounded(pdf_bytes, cache)[0]
+
+
+def extract_text_from_pdf_bounded(
+    pdf_source: Union[bytes, Path],
+    cache: Optional[PdfTextCache] = None,
+    limits: Optional[Dict[str, Optional[Union[int, float]]]] = None,
+) -> Tuple[str, bool]:
+    """
+    Extract text from a PDF, stopping early at the extraction limits
+    
+    Previously extracted PDFs are served from the PDF text cache (configured
+    by PDF_TEXT_CACHE_DIR) without being parsed again. Truncated text is not
+    cached, since a time budget cut depends on machine load.
+    
+    Args:
+        pdf_source: Raw PDF file bytes, or the path of a PDF file (opened
+            without reading it into memory)
+        cache: Optional PDF text cache (defaults to the configured cache)
+        limits: max_pages / max_chars / time_budget_sec (None values mean no
+            limit). Defaults to the PDF_MAX_PAGES, PDF_MAX_CHARS and
+            PDF_TIME_BUDGET_SEC settings.
         
-        for page_num in range(pdf_document.page_count):
-            page = pdf_document[page_num]
-            text = page.get_text()
-            text_content.append(text)
+    Returns:
+        Tuple of (extracted text, truncated)
         
-        # Close the document
-        pdf_document.close()
+    Raises:
+        Exception: If PDF cannot be read or parsed
+    """
+    if limits is None:
+        limits = get_pdf_limits()
+    if cache is None:
+        cache = get_pdf_text_cache()
+    if cache is None:
+        return _parse_pdf(pdf_source, limits)
+    
+    import fitz  # PyMuPDF
+    
+    # Complete extractions do not depend on the limits, so they share a key
+    extractor_version = f"{PDF_PARSER_VERSION}/{fitz.VersionBind}"
+    if isinstance(pdf_source, bytes):
+        key = cache.make_key(pdf_source, extractor_version)
+    else:
+        key = cache.make_file_key(pdf_source, extractor_version)
+    text = cache.get(key)
+    if text is not None:
+        return text, False
+    
+    text, truncated = _parse_pdf(pdf_source, limits)
+    if not truncated:
+        cache.put(key, text)
+    return text, truncated
+
+
+def _parse_pdf(
+    pdf_source: Union[bytes, Path],
+    limits: Optional[Dict[str, Optional[Union[int, float]]]] = None,
+) -> Tuple[str, bool]:
+    """
+    Parse PDF bytes or a PDF file with PyMuPDF one page at a time
+    
+    Pages are read through the engine's PdfPageReader, so the limits and the
+    truncation flag behave exactly as in the engine's PDF loader. Pages are
+    joined with newlines.
+    
+    Returns:
+        Tuple of (text of the pages read, truncated)
+    
+    Raises:
+        Exception: If PDF cannot be read or parsed
+    """
+    import fitz  # PyMuPDF
+    
+    try:
+        if isinstance(pdf_source, bytes):
+            pdf_document = fitz.open(stream=io.BytesIO(pdf_source), filetype="pdf")
+        else:
+            # Pages are loaded from the file on demand
+            pdf_document = fitz.open(str(pdf_source), filetype="pdf")
         
-        # Join all pages with newlines
-        full_text = "\n".join(text_content)
+        reader = PdfPageReader(pdf_document, limits, separator="\n")
+        try:
+            text = reader.separator.join(reader)
+        finally:
+            pdf_document.close()
         
-        return full_text.strip()
+        return text.strip(), reader.truncated
     
     except Exception as e:
         raise Exception(f"Failed to extract text from PDF: {str(e)}")
+
+
+def warm_up_pdf_parser() -> None:
+    """
+    Import PyMuPDF and parse a generated one-page PDF
+    
+    Raises:
+        Exception: If PyMuPDF cannot be loaded or the PDF cannot be parsed
+    """
+    import fitz  # PyMuPDF
+    
+    document = fitz.open()
+    document.new_page().insert_text((72, 72), "warm up")
+    pdf_bytes = document.tobytes()
+    document.close()
+    
+    _parse_pdf(pdf_bytes)
@@ -0,0 +1,151 @@
+"""
+Request Profiler
+Profiles the blocking stages of one request with cProfile and tracemalloc and
+writes the results to a directory keyed by job_id
+"""
+
+import cProfile
+import io
+import json
+import pstats
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+# tracemalloc is process-wide, so only one request is profiled at a time
+_profile_lock = threading.Lock()
+
+# Allocations made by the profiling machinery itself
+_ALLOCATION_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+]
+
+
+def try_start_profile(job_id: str, output_dir: str, top_allocations: int = 25) -> Optional["RequestProfiler"]:
+    """
+    Start profiling a request unless another request is being profiled.
+
+    Args:
+        job_id: Request/job identifier (name of the output directory)
+        output_dir: Directory receiving one subdirectory per profiled request
+        top_allocations: Number of allocation sites reported per stage
+
+    Returns:
+        RequestProfiler (call finish() when the request is done), or None
+        if a profile is already in progress
+    """
+    if not _profile_lock.acquire(blocking=False):
+        return None
+    return RequestProfiler(job_id, output_dir, top_allocations)
+
+
+class RequestProfiler:
+    """
+    cProfile and tracemalloc results for the stages of one request.
+
+    Each stage runs under its own cProfile.Profile (cProfile only sees the
+    thread it is enabled in) with allocation tracing on.
+
+    tracemalloc traces the whole process, not one thread: while a stage
+    runs, concurrent unprofiled requests pay the tracing overhead and their
+    allocations show up in the stage's peak memory and top allocation sites.
+    Work done in other processes (e.g. the EVAL_WORKERS pool) is invisible
+    to both profilers, so callers should run profiled stages in-process.
+    """
+
+    def __init__(self, job_id: str, output_dir: str, top_allocations: int = 25):
+        self.job_id = job_id
+        self.output_path = Path(output_dir) / job_id
+        self.top_allocations = top_allocations
+        self._stages: Dict[str, Dict[str, Any]] = {}
+        self._finished = False
+
+    def run(self, stage: str, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """
+        Run func(*args, **kwargs) as a profiled stage and return its result.
+
+        Args:
+            stage: Stage name (used in output file names)
+            func: Blocking function to profile
+        """
+        profile = cProfile.Profile()
+        tracing = not tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.start()
+
+        start = time.perf_counter()
+        profile.enable()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profile.disable()
+            wall_seconds = time.perf_counter() - start
+
+            snapshot = tracemalloc.take_snapshot().filter_traces(_ALLOCATION_FILTERS)
+            peak = tracemalloc.get_traced_memory()[1]
+            if tracing:
+                tracemalloc.stop()
+
+            self._stages[stage] = {
+                "profile": profile,
+                "snapshot": snapshot,
+                "wall_sec": wall_seconds,
+                "peak_memory_mb": peak / (1024 * 1024),
+            }
+
+    def finish(self) -> Optional[Path]:
+        """
+        Write the collected profiles and release the profiling slot.
+
+        Writes, per stage, <stage>.prof (for pstats/snakeviz) and
+        <stage>.txt (top functions by cumulative time), plus summary.json
+        with timings, peak memory and top allocation sites.
+
+        Returns:
+            Output directory, or None if no stage was profiled
+        """
+        if self._finished:
+            return None
+        self._finished = True
+
+        try:
+            if not self._stages:
+                return None
+
+            self.output_path.mkdir(parents=True, exist_ok=True)
+            summary: Dict[str, Any] = {"job_id": self.job_id, "created_at": time.time(), "stages": {}}
+
+            for stage, data in self._stages.items():
+                data["profile"].dump_stats(str(self.output_path / f"{stage}.prof"))
+
+                report = io.StringIO()
+                stats = pstats.Stats(data["profile"], stream=report)
+                stats.sort_stats("cumulative").print_stats(50)
+                (self.output_path / f"{stage}.txt").write_text(report.getvalue(), encoding="utf-8")
+
+                top = data["snapshot"].statistics("lineno")[: self.top_allocations]
+                summary["stages"][stage] = {
+                    "wall_sec": round(data["wall_sec"], 4),
+                    "peak_memory_mb": round(data["peak_memory_mb"], 2),
+                    "top_allocations": [
+                        {
+                            "site": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                            "size_kb": round(stat.size / 1024, 1),
+                            "count": stat.count,
+                        }
+                        for stat in top
+                    ],
+                }
+
+            with open(self.output_path / "summary.json", "w", encoding="utf-8") as f:
+                json.dump(summary, f, indent=2)
+
+            return self.output_path
+        finally:
+            self._stages.clear()
+            _profile_lock.release()
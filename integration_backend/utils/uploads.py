@@ -0,0 +1,99 @@
+"""
+Upload Spooling
+Streams uploaded files to a per-request temporary directory in chunks, so a
+request never holds whole files in memory, enforcing per-file and per-request
+size limits
+"""
+
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from fastapi import UploadFile
+from starlette.concurrency import run_in_threadpool
+
+# Bytes read from an upload at a time
+CHUNK_SIZE = 1024 * 1024
+
+
+class UploadTooLargeError(ValueError):
+    """Raised when the uploads of one request exceed the per-request limit"""
+
+
+class UploadSpool:
+    """
+    Temporary directory holding the uploads of one request as files.
+
+    Release each file once it has been processed and call cleanup() when the
+    request is done (removes anything left over).
+    """
+
+    def __init__(
+        self,
+        max_file_bytes: Optional[int] = None,
+        max_request_bytes: Optional[int] = None,
+        temp_dir: Optional[str] = None,
+    ):
+        """
+        Args:
+            max_file_bytes: Largest accepted file (None = no limit)
+            max_request_bytes: Largest accepted total of all files (None = no limit)
+            temp_dir: Parent of the spool directory (default: system temp dir)
+        """
+        self.max_file_bytes = max_file_bytes
+        self.max_request_bytes = max_request_bytes
+        self.total_bytes = 0
+        self.directory = Path(tempfile.mkdtemp(prefix="resume_uploads_", dir=temp_dir))
+        self._file_count = 0
+
+    async def add(self, upload: UploadFile) -> Optional[Path]:
+        """
+        Copy an upload into the spool, one chunk at a time.
+
+        Args:
+            upload: Uploaded file
+
+        Returns:
+            Path of the spooled file, or None if the file exceeds
+            max_file_bytes (it is discarded)
+
+        Raises:
+            UploadTooLargeError: If the request exceeds max_request_bytes
+        """
+        self._file_count += 1
+        path = self.directory / f"upload_{self._file_count:06d}"
+        file_bytes = 0
+
+        with open(path, "wb") as f:
+            while True:
+                chunk = await upload.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+
+                file_bytes += len(chunk)
+                self.total_bytes += len(chunk)
+                if self.max_request_bytes is not None and self.total_bytes > self.max_request_bytes:
+                    raise UploadTooLargeError(
+                        f"Uploads exceed the {self.max_request_bytes // (1024 * 1024)} MB request limit"
+                    )
+                if self.max_file_bytes is not None and file_bytes > self.max_file_bytes:
+                    break
+
+                await run_in_threadpool(f.write, chunk)
+
+        await upload.close()
+
+        if self.max_file_bytes is not None and file_bytes > self.max_file_bytes:
+            self.release(path)
+            return None
+        return path
+
+    @staticmethod
+    def release(path: Path) -> None:
+        """Delete one spooled file."""
+        path.unlink(missing_ok=True)
+
+    def cleanup(self) -> None:
+        """Delete the spool directory and any files left in it."""
+        shutil.rmtree(self.directory, ignore_errors=True)
@@ -0,0 +1,110 @@
+"""
+Throughput benchmark for the text cleaner.
+
+Builds multi-megabyte inputs from the golden corpus (real resumes, job
+descriptions and Unicode/whitespace edge cases), times clean_text against the
+original four-regex implementation and checks both produce identical output.
+
+Usage:
+    python benchmarks/cleaner_throughput.py
+    python benchmarks/cleaner_throughput.py --sizes-mb 1 4 16 --check
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add engine root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.cleaner import clean_text
+
+GOLDEN_PATH = Path(__file__).parent.parent / "tests" / "data" / "clean_text_golden.json"
+
+
+def legacy_clean_text(text: str) -> str:
+    """Original multi-pass implementation of clean_text, for reference."""
+    if not text or not isinstance(text, str):
+        return ""
+    text = text.lower()
+    text = re.sub(r'[\n\r\t]+', ' ', text)
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r"[^a-z0-9\s+#.']", ' ', text)
+    text = re.sub(r'\s+', ' ', text)
+    return text.strip()
+
+
+def _build_inputs(size_mb: float) -> dict:
+    """Return name -> text of roughly size_mb megabytes (in characters)."""
+    with open(GOLDEN_PATH, "r", encoding="utf-8") as f:
+        cases = [case["input"] for case in json.load(f)]
+
+    target = int(size_mb * 1024 * 1024)
+    corpus = "\n\n".join(cases)
+    ascii_corpus = "\n\n".join(case for case in cases if case.isascii())
+
+    def repeat(unit: str) -> str:
+        return (unit * (target // len(unit) + 1))[:target]
+
+    return {
+        "corpus": repeat(corpus),
+        "ascii corpus": repeat(ascii_corpus),
+        "non-ascii": repeat("Résumé – naïve façade, 東京    Ünïcödé "),
+        "whitespace": repeat(" \t\n\r\x0b\x0c　 a"),
+    }
+
+
+def _best_time(func, text: str, repeat: int) -> float:
+    """Return the best wall time of func(text) over repeat runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Throughput benchmark for clean_text.")
+    parser.add_argument(
+        "--sizes-mb",
+        type=float,
+        nargs="+",
+        default=[1, 4],
+        help="Input sizes in megabytes of characters (default: 1 4)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (default: 3)")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Fail if any output differs from the legacy implementation",
+    )
+    args = parser.parse_args()
+
+    mismatches = []
+
+    print(f"{'input':<14}{'MB':>6}{'clean_text MB/s':>17}{'legacy MB/s':>13}{'speedup':>9}")
+    for size_mb in args.sizes_mb:
+        for name, text in _build_inputs(size_mb).items():
+            if clean_text(text) != legacy_clean_text(text):
+                mismatches.append(f"{name} ({size_mb:g} MB)")
+
+            mb = len(text) / (1024 * 1024)
+            current = _best_time(clean_text, text, args.repeat)
+            legacy = _best_time(legacy_clean_text, text, args.repeat)
+            print(f"{name:<14}{mb:>6.1f}{mb / current:>17.1f}{mb / legacy:>13.1f}{legacy / current:>8.1f}x")
+
+    if mismatches:
+        print(f"\nOutput differs from legacy: {', '.join(mismatches)}")
+        if args.check:
+            sys.exit(1)
+    else:
+        print("\nAll outputs identical to the legacy implementation.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Adversarial-input benchmark for the contact scanner.
+
+Times extract_contact_info on inputs built to trigger regex backtracking
+(long dotted domains, huge local parts, whitespace runs after phone
+prefixes) at growing sizes, and checks the time grows linearly. The
+original single-pattern email regex is timed alongside for reference.
+
+Usage:
+    python benchmarks/contact_scanner.py
+    python benchmarks/contact_scanner.py --sizes 2000 4000 8000 16000 --check
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add engine root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.regex_extractor import extract_contact_info
+
+LEGACY_EMAIL_PATTERN = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+
+# name -> builder of an adversarial text of roughly n characters
+ADVERSARIAL_INPUTS = {
+    "dotted domain": lambda n: "a@" + "b." * (n // 2),
+    "long local part": lambda n: "a" * n + "@",
+    "dots before @": lambda n: "a." * (n // 2) + "@x.y",
+    "tld pipes": lambda n: "x@y." + "a|" * (n // 2),
+    "many @": lambda n: "a@" * (n // 2),
+    "phone whitespace": lambda n: ("(123)" + " " * 50) * (n // 55),
+    "digit run": lambda n: "1" * n,
+    "url bodies": lambda n: "https://github.com/" * (n // 19),
+}
+
+
+def _best_time(func, text: str, repeat: int) -> float:
+    """Return the best wall time of func(text) over repeat runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Adversarial-input benchmark for extract_contact_info.")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[2000, 4000, 8000, 16000],
+        help="Input sizes in characters (default: 2000 4000 8000 16000)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (default: 3)")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Fail if time grows faster than linearly (per-char time rises more than 3x)",
+    )
+    args = parser.parse_args()
+
+    legacy_email = re.compile(LEGACY_EMAIL_PATTERN)
+    failures = []
+
+    print(f"{'input':<18}{'size':>8}{'scanner ms':>12}{'legacy email ms':>17}{'us/char':>9}")
+    for name, build in ADVERSARIAL_INPUTS.items():
+        per_char = []
+        for size in args.sizes:
+            text = build(size)
+            scanner = _best_time(extract_contact_info, text, args.repeat)
+            legacy = _best_time(legacy_email.findall, text, args.repeat)
+            per_char.append(scanner / max(len(text), 1))
+            print(f"{name:<18}{len(text):>8}{scanner * 1000:>12.2f}{legacy * 1000:>17.2f}{per_char[-1] * 1e6:>9.3f}")
+
+        # Linear time keeps the per-character cost flat as inputs grow
+        if per_char[-1] > 3 * min(per_char):
+            failures.append(name)
+
+    if failures:
+        print(f"\nSuperlinear growth: {', '.join(failures)}")
+        if args.check:
+            sys.exit(1)
+    else:
+        print("\nAll inputs scale linearly.")
+
+
+if __name__ == "__main__":
+    main()
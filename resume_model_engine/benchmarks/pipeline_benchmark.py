@@ -0,0 +1,204 @@
+"""
+End-to-end benchmark of evaluate_candidates on synthetic corpora.
+
+For each corpus size, generates a seeded job description and resume pool
+(see synthetic_corpus.py), then reports the per-stage timings collected by
+evaluate_candidates, throughput and peak traced memory. Results can be saved
+as JSON and compared against a stored baseline.
+
+Usage:
+    python benchmarks/pipeline_benchmark.py
+    python benchmarks/pipeline_benchmark.py --sizes 10 100 1000 --output benchmarks/baseline.json
+    python benchmarks/pipeline_benchmark.py --baseline benchmarks/baseline.json --check
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Add engine root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import __version__, ner_extractor
+from src.pipeline import evaluate_candidates, shutdown_process_pool, warm_up_steps
+from synthetic_corpus import generate_corpus
+
+STAGES = ["clean", "skills", "contact", "ner", "similarity", "scoring", "ranking"]
+
+
+def run_size(n_candidates: int, seed: int, n_workers: int, measure_memory: bool) -> Dict:
+    """
+    Benchmark evaluate_candidates on one synthetic corpus.
+
+    Returns:
+        Dict with candidate count, total time, throughput, peak memory and
+        per-stage timings (seconds)
+    """
+    jd_text, candidates = generate_corpus(n_candidates, seed=seed)
+
+    timings: Dict[str, float] = {}
+    start = time.perf_counter()
+    evaluate_candidates(jd_text, candidates, n_workers=n_workers, timings=timings)
+    total = time.perf_counter() - start
+
+    # Separate run: tracing allocations slows the pipeline down
+    peak_memory_mb = None
+    if measure_memory:
+        tracemalloc.start()
+        try:
+            evaluate_candidates(jd_text, candidates, n_workers=n_workers)
+            peak_memory_mb = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        finally:
+            tracemalloc.stop()
+
+    return {
+        "n_candidates": n_candidates,
+        "total_sec": round(total, 4),
+        "candidates_per_sec": round(n_candidates / total, 2) if total > 0 else None,
+        "peak_memory_mb": round(peak_memory_mb, 2) if peak_memory_mb is not None else None,
+        "stages": {stage: round(timings.get(stage, 0.0), 4) for stage in STAGES},
+    }
+
+
+def print_run(run: Dict) -> None:
+    """Print one benchmark run as a table row."""
+    memory = f"{run['peak_memory_mb']:.1f}" if run["peak_memory_mb"] is not None else "-"
+    stages = "".join(f"{run['stages'][stage]:>11.3f}" for stage in STAGES)
+    print(
+        f"{run['n_candidates']:>8}{run['total_sec']:>10.3f}{run['candidates_per_sec'] or 0:>10.1f}"
+        f"{memory:>9}{stages}"
+    )
+
+
+def compare_to_baseline(runs: List[Dict], baseline: Dict, tolerance: float) -> List[str]:
+    """
+    Print current/baseline ratios and list regressions beyond tolerance.
+
+    Total time and peak memory are checked; stage ratios are shown for
+    context only, since single stages are noisy on small corpora.
+
+    Returns:
+        Descriptions of regressions
+    """
+    baseline_runs = {run["n_candidates"]: run for run in baseline.get("runs", [])}
+    regressions = []
+
+    print(f"\nCompared to baseline ({baseline.get('meta', {}).get('created_at', 'unknown date')}), current / baseline:")
+    print(f"{'size':>8}{'total':>10}{'memory':>9}" + "".join(f"{stage:>11}" for stage in STAGES))
+
+    for run in runs:
+        base = baseline_runs.get(run["n_candidates"])
+        if base is None:
+            continue
+
+        def ratio(current: Optional[float], previous: Optional[float]) -> Optional[float]:
+            if current is None or not previous:
+                return None
+            return current / previous
+
+        def fmt(value: Optional[float], width: int) -> str:
+            return f"{value:>{width}.2f}" if value is not None else f"{'-':>{width}}"
+
+        total_ratio = ratio(run["total_sec"], base["total_sec"])
+        memory_ratio = ratio(run["peak_memory_mb"], base.get("peak_memory_mb"))
+        stage_ratios = [ratio(run["stages"][stage], base["stages"].get(stage)) for stage in STAGES]
+        print(f"{run['n_candidates']:>8}{fmt(total_ratio, 10)}{fmt(memory_ratio, 9)}" + "".join(fmt(r, 11) for r in stage_ratios))
+
+        if total_ratio is not None and total_ratio > 1 + tolerance:
+            regressions.append(f"{run['n_candidates']} candidates: total time x{total_ratio:.2f}")
+        if memory_ratio is not None and memory_ratio > 1 + tolerance:
+            regressions.append(f"{run['n_candidates']} candidates: peak memory x{memory_ratio:.2f}")
+
+    return regressions
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark evaluate_candidates on synthetic corpora.")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10, 100, 1000, 10000],
+        help="Numbers of candidates (default: 10 100 1000 10000)",
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Corpus random seed (default: 42)")
+    parser.add_argument("--workers", type=int, default=1, help="n_workers passed to evaluate_candidates (default: 1)")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc peak memory run")
+    parser.add_argument(
+        "--blank-spacy",
+        action="store_true",
+        help="Use a blank spaCy pipeline (tokenizer only) instead of en_core_web_sm",
+    )
+    parser.add_argument("--output", help="Save results as JSON to this path")
+    parser.add_argument("--baseline", help="Compare against results saved with --output")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed slowdown / memory growth vs the baseline (default: 0.25 = 25%%)",
+    )
+    parser.add_argument("--check", action="store_true", help="Exit with status 1 on regressions")
+    args = parser.parse_args()
+
+    if args.blank_spacy:
+        import spacy
+        ner_extractor._nlp_model = spacy.blank("en")
+
+    # Load models up front so the first size does not pay for them
+    for _, step in warm_up_steps(n_workers=args.workers):
+        step()
+
+    print(f"{'size':>8}{'total s':>10}{'cand/s':>10}{'peak MB':>9}" + "".join(f"{stage:>11}" for stage in STAGES))
+    runs = []
+    try:
+        for size in args.sizes:
+            run = run_size(size, args.seed, args.workers, not args.no_memory)
+            print_run(run)
+            runs.append(run)
+    finally:
+        shutdown_process_pool()
+
+    results = {
+        "meta": {
+            "engine_version": __version__,
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "n_workers": args.workers,
+            "spacy_model": "blank" if args.blank_spacy else "en_core_web_sm",
+        },
+        "runs": runs,
+    }
+
+    if args.output:
+        output_path = Path(args.output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults saved to: {output_path}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("meta", {}).get("spacy_model") != results["meta"]["spacy_model"]:
+            print("\nWarning: Baseline was recorded with a different spaCy model; ratios are not comparable.")
+
+        regressions = compare_to_baseline(runs, baseline, args.tolerance)
+        if regressions:
+            print("\nRegressions:\n  " + "\n  ".join(regressions))
+            if args.check:
+                sys.exit(1)
+        else:
+            print("\nNo regressions beyond tolerance.")
+
+
+if __name__ == "__main__":
+    main()
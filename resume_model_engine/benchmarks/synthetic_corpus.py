@@ -0,0 +1,199 @@
+"""
+Seeded generator of synthetic resumes and job descriptions.
+
+Skills are drawn from data/skills.csv so the generated texts exercise the
+real skill matcher; names, companies, places and contact details come from
+small built-in lists. The same seed always produces the same corpus.
+
+Usage:
+    from synthetic_corpus import generate_corpus
+    jd_text, candidates = generate_corpus(1000, seed=42)
+"""
+
+import random
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Add engine root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.skill_extractor import load_skills
+
+FIRST_NAMES = [
+    "Aarav", "Priya", "Rohan", "Ananya", "Vikram", "Meera", "Arjun", "Kavya",
+    "James", "Emily", "Daniel", "Sofia", "Lucas", "Olivia", "Mateo", "Hana",
+    "Wei", "Yuki", "Omar", "Fatima", "Noah", "Chloe", "Ethan", "Zara",
+]
+LAST_NAMES = [
+    "Sharma", "Patel", "Iyer", "Reddy", "Kulkarni", "Gupta", "Nair", "Das",
+    "Smith", "Johnson", "Garcia", "Müller", "Rossi", "Tanaka", "Kim", "Chen",
+    "Khan", "Haddad", "Novak", "Silva", "Brown", "Martin", "Lopez", "Wilson",
+]
+COMPANIES = [
+    "Infosys", "Tata Consultancy Services", "Wipro", "Google", "Microsoft",
+    "Amazon", "Flipkart", "Zomato", "Accenture", "IBM", "Oracle", "Adobe",
+    "Razorpay", "Swiggy", "Atlassian", "Salesforce", "Deloitte", "Capgemini",
+]
+CITIES = [
+    "Bengaluru", "Pune", "Mumbai", "Hyderabad", "Chennai", "Delhi", "Bhopal",
+    "London", "Berlin", "Singapore", "Toronto", "New York", "Seattle", "Dublin",
+]
+TITLES = [
+    "Software Engineer", "Data Scientist", "Machine Learning Engineer",
+    "Backend Developer", "Frontend Developer", "DevOps Engineer",
+    "Data Analyst", "Full Stack Developer", "Cloud Engineer", "Research Intern",
+]
+DEGREES = [
+    "B.Tech in Computer Science", "M.Tech in Artificial Intelligence",
+    "B.E. in Electronics", "M.Sc. in Data Science", "BCA", "MCA",
+]
+UNIVERSITIES = [
+    "Vellore Institute of Technology", "IIT Bombay", "BITS Pilani",
+    "University of Pune", "Anna University", "NIT Trichy", "Delhi University",
+]
+VERBS = [
+    "Built", "Designed", "Led", "Maintained", "Optimized", "Migrated",
+    "Automated", "Deployed", "Refactored", "Implemented", "Scaled", "Tested",
+]
+OBJECTS = [
+    "a recommendation service", "the data ingestion pipeline", "internal dashboards",
+    "a fraud detection model", "REST APIs for the mobile app", "the CI/CD workflow",
+    "a real-time analytics platform", "customer-facing web pages",
+    "batch ETL jobs", "a document search engine", "the billing system",
+]
+OUTCOMES = [
+    "reducing latency by {n}%", "cutting costs by {n}%", "serving {n}k daily users",
+    "improving accuracy by {n}%", "saving {n} hours a week", "with {n}% test coverage",
+]
+JD_INTROS = [
+    "We are hiring a {title} to join our {city} team.",
+    "{company} is looking for an experienced {title}.",
+    "Join us as a {title} and help build products used by millions.",
+]
+
+
+def load_skill_names(skills_file: Optional[str] = None) -> List[str]:
+    """
+    Load the skill taxonomy as a sorted list (stable across runs).
+
+    Args:
+        skills_file: Path to skills.csv. If None, uses the bundled file.
+
+    Returns:
+        Sorted list of skill names
+    """
+    return sorted(load_skills(skills_file))
+
+
+def _bullet(rng: random.Random, skills: List[str]) -> str:
+    """One experience bullet mentioning a few skills."""
+    used = ", ".join(rng.sample(skills, min(len(skills), rng.randint(1, 3))))
+    outcome = rng.choice(OUTCOMES).format(n=rng.randint(5, 90))
+    return f"- {rng.choice(VERBS)} {rng.choice(OBJECTS)} using {used}, {outcome}."
+
+
+def generate_resume(rng: random.Random, skills: List[str]) -> str:
+    """
+    Generate one synthetic resume.
+
+    Args:
+        rng: Seeded random generator
+        skills: Skills the candidate has
+
+    Returns:
+        Resume text with contact details, experience, education and skills
+    """
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    handle = f"{first}.{last}".lower()
+
+    contact = [f"{first} {last}", f"{handle}{rng.randint(1, 99)}@example.com"]
+    if rng.random() < 0.9:
+        contact.append(f"+91 {rng.randint(6000000000, 9999999999)}")
+    if rng.random() < 0.6:
+        contact.append(f"https://github.com/{handle.replace('.', '-')}")
+    if rng.random() < 0.6:
+        contact.append(f"https://www.linkedin.com/in/{handle.replace('.', '-')}-{rng.randint(100, 999)}")
+
+    lines = [" | ".join(contact), "", "Summary"]
+    lines.append(
+        f"{rng.choice(TITLES)} with {rng.randint(1, 12)} years of experience in "
+        f"{', '.join(rng.sample(skills, min(len(skills), 3)))}."
+    )
+
+    lines += ["", "Experience"]
+    year = 2024
+    for _ in range(rng.randint(1, 4)):
+        start = year - rng.randint(1, 4)
+        lines.append(f"{rng.choice(TITLES)}, {rng.choice(COMPANIES)}, {rng.choice(CITIES)} | {start} - {year}")
+        lines += [_bullet(rng, skills) for _ in range(rng.randint(2, 5))]
+        year = start
+
+    lines += ["", "Education"]
+    lines.append(f"{rng.choice(DEGREES)}, {rng.choice(UNIVERSITIES)} | {year - 4} - {year}")
+
+    lines += ["", "Skills", ", ".join(skills)]
+    return "\n".join(lines)
+
+
+def generate_job_description(rng: random.Random, skills: List[str]) -> str:
+    """
+    Generate one synthetic job description.
+
+    Args:
+        rng: Seeded random generator
+        skills: Skills the role requires
+
+    Returns:
+        Job description text
+    """
+    title = rng.choice(TITLES)
+    intro = rng.choice(JD_INTROS).format(title=title, city=rng.choice(CITIES), company=rng.choice(COMPANIES))
+    required = skills[: max(1, len(skills) * 2 // 3)]
+    preferred = skills[len(required):]
+
+    lines = [title, "", intro, "", "Requirements:"]
+    lines += [f"- Hands-on experience with {skill}" for skill in required]
+    if preferred:
+        lines += ["", "Nice to have: " + ", ".join(preferred)]
+    lines += ["", f"Location: {rng.choice(CITIES)}. {rng.randint(2, 8)}+ years of experience preferred."]
+    return "\n".join(lines)
+
+
+def generate_corpus(
+    n_candidates: int,
+    seed: int = 42,
+    jd_skill_count: int = 10,
+    skills_file: Optional[str] = None
+) -> Tuple[str, Dict[str, str]]:
+    """
+    Generate a job description and a pool of synthetic resumes.
+
+    Each resume shares a random fraction of the JD's skills and adds random
+    skills from the taxonomy, so match scores spread over the whole range.
+
+    Args:
+        n_candidates: Number of resumes
+        seed: Random seed
+        jd_skill_count: Number of skills required by the JD
+        skills_file: Path to skills.csv. If None, uses the bundled file.
+
+    Returns:
+        (job description text, dict mapping candidate_id to resume text)
+    """
+    rng = random.Random(seed)
+    taxonomy = load_skill_names(skills_file)
+
+    jd_skills = rng.sample(taxonomy, min(jd_skill_count, len(taxonomy)))
+    jd_text = generate_job_description(rng, jd_skills)
+
+    width = len(str(n_candidates))
+    candidates = {}
+    for i in range(1, n_candidates + 1):
+        shared = rng.sample(jd_skills, rng.randint(0, len(jd_skills)))
+        extra = rng.sample(taxonomy, rng.randint(3, 15))
+        skills = list(dict.fromkeys(shared + extra))
+        rng.shuffle(skills)
+        candidates[f"candidate_{i:0{width}d}"] = generate_resume(rng, skills)
+
+    return jd_text, candidates
@@ -3,8 +3,13 @@ Demo script showcasing the resume screening pipeline.
 
 This script demonstrates the core functionality with sample job description
 and candidate resumes.
+
+Usage:
+    python demo_run.py
+    python demo_run.py --jd path/to/jd.txt --resumes path/to/resumes --output results.json
 """
 
+import argparse
 import sys
 from pathlib import Path
 import json
@@ -12,8 +17,8 @@ import json
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from src.pipeline import evaluate_candidates
-from src.pdf_loader import load_resumes_from_folder, load_jd_from_file
+BASE_DIR = Path(__file__).parent
+DATA_DIR = BASE_DIR / "data"
 
 
 def print_separator():
@@ -65,15 +70,34 @@ def print_candidate_result(candidate: dict, rank: int):
 
 def main():
     """Run the demo."""
+    parser = argparse.ArgumentParser(description="Screen sample resumes against a job description.")
+    parser.add_argument(
+        "--jd",
+        default=str(DATA_DIR / "Job_descriptions" / "JD.txt"),
+        help="Job description text file (default: data/Job_descriptions/JD.txt)",
+    )
+    parser.add_argument(
+        "--resumes",
+        default=str(DATA_DIR / "resumes"),
+        help="Folder of PDF resumes (default: data/resumes)",
+    )
+    parser.add_argument(
+        "--output",
+        default=str(BASE_DIR / "demo_results.json"),
+        help="Where to save the results as JSON (default: demo_results.json)",
+    )
+    args = parser.parse_args()
+
+    # Imported after argument parsing so --help stays fast
+    from src.pipeline import evaluate_candidates
+    from src.pdf_loader import load_resumes_from_folder, load_jd_from_file
+
     print_separator()
     print("🚀 AI RESUME SCREENING ENGINE - DEMO")
     print_separator()
     # Paths
-    base = Path(__file__).parent
-    data_dir = base / "data"
-    jd_dir = data_dir / "Job_descriptions"
-    jd_file = jd_dir / "JD.txt"
-    resumes_dir = data_dir / "resumes"
+    jd_file = Path(args.jd)
+    resumes_dir = Path(args.resumes)
 
     # Load job description
     jd_text = load_jd_from_file(str(jd_file))
@@ -102,7 +126,7 @@ def main():
         print_candidate_result(candidate, rank)
     
     # Save to JSON for backend integration example
-    output_file = Path(__file__).parent / "demo_results.json"
+    output_file = Path(args.output)
     with open(output_file, 'w', encoding='utf-8') as f:
         json.dump(results, f, indent=2, ensure_ascii=False)
     
@@ -0,0 +1,68 @@
+"""
+Fit a TF-IDF model on a historical resume corpus.
+
+The saved model is loaded once at startup (see similarity.load_tfidf_model)
+so request-time similarity scoring only transforms texts.
+
+Usage:
+    python fit_tfidf_model.py
+    python fit_tfidf_model.py --resumes-dir data/resumes --output data/tfidf_model.npz
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from src.cleaner import clean_text
+from src.pdf_loader import load_resumes_from_folder, load_jd_from_file
+from src.similarity import fit_tfidf_model, save_tfidf_model
+
+
+def main():
+    """Fit and save the TF-IDF model."""
+    base = Path(__file__).parent
+    
+    parser = argparse.ArgumentParser(description="Fit a TF-IDF model on a resume corpus.")
+    parser.add_argument(
+        "--resumes-dir",
+        default=str(base / "data" / "resumes"),
+        help="Folder of PDF resumes to fit on (default: data/resumes)",
+    )
+    parser.add_argument(
+        "--jd-dir",
+        default=str(base / "data" / "Job_descriptions"),
+        help="Optional folder of .txt job descriptions added to the corpus",
+    )
+    parser.add_argument(
+        "--output",
+        default=str(base / "data" / "tfidf_model.npz"),
+        help="Destination .npz file (default: data/tfidf_model.npz)",
+    )
+    args = parser.parse_args()
+    
+    corpus = [clean_text(text) for text in load_resumes_from_folder(args.resumes_dir).values()]
+    
+    jd_dir = Path(args.jd_dir)
+    if jd_dir.is_dir():
+        for jd_file in sorted(jd_dir.glob("*.txt")):
+            corpus.append(clean_text(load_jd_from_file(str(jd_file))))
+    
+    corpus = [text for text in corpus if text]
+    if not corpus:
+        print(f"⚠️  No documents found in: {args.resumes_dir}")
+        return 1
+    
+    model = fit_tfidf_model(corpus)
+    save_tfidf_model(model, args.output)
+    
+    print(f"✅ Fitted TF-IDF model on {len(corpus)} document(s) "
+          f"({len(model.vocabulary_)} terms)")
+    print(f"   Saved to: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
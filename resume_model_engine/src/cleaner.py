@@ -4,17 +4,28 @@ Text cleaning utilities for resume and job description preprocessing.
 
 import re
 
+# Characters kept by clean_text: alphanumeric, +, #, ., apostrophes.
+# This preserves: C++, C#, .NET, don't, won't, etc.
+_KEPT_CHARS = "abcdefghijklmnopqrstuvwxyz0123456789+#.'"
+
+# Byte translation table: kept ASCII characters map to themselves, every
+# other byte (whitespace, punctuation and all bytes of multi-byte UTF-8
+# sequences) maps to a space
+_CLEAN_TABLE = bytes(i if chr(i) in _KEPT_CHARS else 0x20 for i in range(256))
+
+_SPACE_RUNS = re.compile(r' {2,}')
+
 
 def clean_text(text: str) -> str:
     """
     Clean and normalize text while preserving meaningful content.
-    
+
     Args:
         text: Raw input text (resume or job description)
-        
+
     Returns:
         Cleaned and normalized text
-        
+
     Examples:
         >>> clean_text("  Hello   World\\n\\n  ")
         'hello world'
@@ -23,24 +34,15 @@ def clean_text(text: str) -> str:
     """
     if not text or not isinstance(text, str):
         return ""
-    
-    # Convert to lowercase
+
+    # Convert to lowercase (non-ASCII results are never kept)
     text = text.lower()
-    
-    # Replace multiple newlines/tabs with single space
-    text = re.sub(r'[\n\r\t]+', ' ', text)
-    
-    # Remove extra whitespace (multiple spaces to single space)
-    text = re.sub(r'\s+', ' ', text)
-    
-    # Remove special characters but keep: alphanumeric, spaces, +, #, ., apostrophes
-    # This preserves: C++, C#, .NET, don't, won't, etc.
-    text = re.sub(r"[^a-z0-9\s+#.']", ' ', text)
-    
-    # Clean up any resulting multiple spaces again
-    text = re.sub(r'\s+', ' ', text)
-    
-    # Strip leading/trailing whitespace
-    text = text.strip()
-    
+
+    # Replace whitespace and special characters with spaces in one
+    # table-driven pass over the UTF-8 bytes
+    text = text.encode('utf-8', 'surrogatepass').translate(_CLEAN_TABLE).decode('ascii')
+
+    # Collapse multiple spaces and strip leading/trailing spaces
+    text = _SPACE_RUNS.sub(' ', text).strip(' ')
+
     return text
@@ -0,0 +1,252 @@
+"""
+Cache of JD-independent candidate features.
+
+Cleaning, skill extraction, contact regexes and NER do not depend on the job
+description, so their output can be reused across screenings of the same
+resume. Entries are keyed by a hash of the resume text, the engine version,
+the spaCy model name and version, and the skill taxonomy fingerprint; when
+skills.csv (or SKILL_SYNONYMS) changes, stale entries stop matching and are
+purged.
+
+The default cache is configured with environment variables:
+    FEATURE_CACHE_BACKEND      "memory" or "sqlite" (unset: disabled)
+    FEATURE_CACHE_PATH         SQLite database path (sqlite backend)
+    FEATURE_CACHE_MAX_ENTRIES  Maximum number of cached resumes (default 10000)
+"""
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+import hashlib
+import json
+import os
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+from . import __version__
+from .ner_extractor import get_spacy_model_id
+
+# Bump when the structure of cached features changes
+FEATURE_CACHE_VERSION = "1"
+
+
+class FeatureCache(ABC):
+    """Base class for feature caches (LRU, bounded by entry count)."""
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._fingerprint = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(resume_text: str, skills_fingerprint: str) -> str:
+        """
+        Build the cache key for a resume under a given skill taxonomy.
+
+        The key also covers the spaCy model (loaded if needed), so upgrading
+        or swapping it does not serve entities from the previous model.
+        """
+        digest = hashlib.sha256()
+        prefix = f"{__version__}/{FEATURE_CACHE_VERSION}/{get_spacy_model_id()}/{skills_fingerprint}\0"
+        digest.update(prefix.encode("utf-8"))
+        digest.update(resume_text.encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    def get(self, key: str, skills_fingerprint: str) -> Optional[Dict]:
+        """
+        Look up cached features.
+
+        Args:
+            key: Cache key from make_key
+            skills_fingerprint: Fingerprint of the current skill taxonomy
+
+        Returns:
+            Feature dict, or None on a miss
+        """
+        with self._lock:
+            self._check_fingerprint(skills_fingerprint)
+            features = self._get(key)
+            if features is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return features
+
+    def put(self, key: str, skills_fingerprint: str, features: Dict) -> None:
+        """
+        Store features for a resume.
+
+        Args:
+            key: Cache key from make_key
+            skills_fingerprint: Fingerprint of the current skill taxonomy
+            features: JSON-serializable feature dict
+        """
+        with self._lock:
+            self._check_fingerprint(skills_fingerprint)
+            self._put(key, skills_fingerprint, features)
+
+    def invalidate(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._clear(keep_fingerprint=None)
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss/eviction counters and current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": self._size(),
+            }
+
+    def _check_fingerprint(self, skills_fingerprint: str) -> None:
+        """Purge entries from other taxonomies when the fingerprint changes."""
+        if skills_fingerprint != self._fingerprint:
+            self._clear(keep_fingerprint=skills_fingerprint)
+            self._fingerprint = skills_fingerprint
+
+    @abstractmethod
+    def _get(self, key: str) -> Optional[Dict]:
+        """Return stored features, or None."""
+
+    @abstractmethod
+    def _put(self, key: str, skills_fingerprint: str, features: Dict) -> None:
+        """Store features, evicting the least recently used entries."""
+
+    @abstractmethod
+    def _clear(self, keep_fingerprint: Optional[str]) -> None:
+        """Remove entries of every fingerprint except keep_fingerprint."""
+
+    @abstractmethod
+    def _size(self) -> int:
+        """Return the number of stored entries."""
+
+
+class MemoryFeatureCache(FeatureCache):
+    """In-process LRU feature cache."""
+
+    def __init__(self, max_entries: int = 10000):
+        super().__init__(max_entries)
+        # Features are stored serialized so callers never share mutable lists
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+
+    def _get(self, key: str) -> Optional[Dict]:
+        features = self._entries.get(key)
+        if features is None:
+            return None
+        self._entries.move_to_end(key)
+        return json.loads(features)
+
+    def _put(self, key: str, skills_fingerprint: str, features: Dict) -> None:
+        self._entries[key] = json.dumps(features)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _clear(self, keep_fingerprint: Optional[str]) -> None:
+        # All in-memory entries belong to the previous fingerprint
+        self._entries.clear()
+
+    def _size(self) -> int:
+        return len(self._entries)
+
+
+class SqliteFeatureCache(FeatureCache):
+    """Persistent LRU feature cache stored in a local SQLite database."""
+
+    def __init__(self, db_path: str, max_entries: int = 10000):
+        super().__init__(max_entries)
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS features ("
+            " key TEXT PRIMARY KEY,"
+            " fingerprint TEXT NOT NULL,"
+            " features TEXT NOT NULL,"
+            " last_access REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS features_last_access ON features (last_access)"
+        )
+        self._conn.commit()
+
+    def _get(self, key: str) -> Optional[Dict]:
+        row = self._conn.execute(
+            "SELECT features FROM features WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        self._conn.execute(
+            "UPDATE features SET last_access = ? WHERE key = ?", (time.time(), key)
+        )
+        self._conn.commit()
+        return json.loads(row[0])
+
+    def _put(self, key: str, skills_fingerprint: str, features: Dict) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO features (key, fingerprint, features, last_access)"
+            " VALUES (?, ?, ?, ?)",
+            (key, skills_fingerprint, json.dumps(features), time.time()),
+        )
+
+        excess = self._size() - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM features WHERE key IN ("
+                " SELECT key FROM features ORDER BY last_access LIMIT ?)",
+                (excess,),
+            )
+            self.evictions += excess
+        self._conn.commit()
+
+    def _clear(self, keep_fingerprint: Optional[str]) -> None:
+        self._conn.execute(
+            "DELETE FROM features WHERE fingerprint IS NOT ?", (keep_fingerprint,)
+        )
+        self._conn.commit()
+
+    def _size(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM features").fetchone()[0]
+
+
+# Global default cache (lazy created from environment)
+_default_cache: Optional[FeatureCache] = None
+# Whether the environment was read (the cache may still be disabled)
+_default_cache_configured = False
+
+
+def get_feature_cache() -> Optional[FeatureCache]:
+    """
+    Get the default feature cache configured by environment variables.
+
+    The environment is read on the first call only, so a disabled or
+    misconfigured cache is not looked up (or warned about) again.
+
+    Returns:
+        FeatureCache, or None if FEATURE_CACHE_BACKEND is not set
+    """
+    global _default_cache, _default_cache_configured
+
+    if not _default_cache_configured:
+        _default_cache_configured = True
+        backend = os.getenv("FEATURE_CACHE_BACKEND", "").lower()
+        max_entries = int(os.getenv("FEATURE_CACHE_MAX_ENTRIES", "10000"))
+
+        if backend == "memory":
+            _default_cache = MemoryFeatureCache(max_entries)
+        elif backend == "sqlite":
+            db_path = os.getenv("FEATURE_CACHE_PATH", "feature_cache.sqlite3")
+            _default_cache = SqliteFeatureCache(db_path, max_entries)
+        elif backend:
+            print(f"Warning: Unknown FEATURE_CACHE_BACKEND '{backend}'. Feature cache disabled.")
+
+    return _default_cache
@@ -1,13 +1,26 @@
 """
 Named Entity Recognition (NER) using spaCy.
+
+spaCy is imported together with the model on first use, so importing this
+module (and the pipeline) does not pay for it.
 """
 
-from typing import Dict, List
-import spacy
+import itertools
+from typing import Dict, Iterable, Iterator, List
 
 # Global spaCy model (lazy loaded)
 _nlp_model = None
 
+# Entity types reported for each resume
+ENTITY_TYPES = ("PERSON", "ORG", "GPE", "DATE")
+
+# Pipeline components that do not contribute to doc.ents in the
+# en_core_web_sm pipeline; they are disabled while extracting entities
+_NER_UNUSED_PIPES = ("tagger", "parser", "attribute_ruler", "lemmatizer", "morphologizer", "senter")
+
+# Shared embedding component; only needed while an enabled component listens to it
+_TOK2VEC_PIPES = ("tok2vec", "transformer")
+
 
 def get_spacy_model():
     """
@@ -19,6 +32,8 @@ def get_spacy_model():
     global _nlp_model
     
     if _nlp_model is None:
+        import spacy
+        
         try:
             _nlp_model = spacy.load("en_core_web_sm")
         except OSError:
@@ -29,6 +44,138 @@ def get_spacy_model():
     return _nlp_model
 
 
+def get_spacy_model_id() -> str:
+    """
+    Identify the loaded spaCy model, e.g. "core_web_sm-3.7.1".
+    
+    Returns:
+        Model name and version from its meta
+    """
+    meta = get_spacy_model().meta
+    return f"{meta.get('name', '')}-{meta.get('version', '')}"
+
+
+def _ner_disabled_pipes(nlp) -> List[str]:
+    """
+    Components to disable while extracting entities.
+    
+    Besides _NER_UNUSED_PIPES, a shared tok2vec is disabled when none of the
+    remaining components listens to it (en_core_web_sm's ner embeds its own
+    tok2vec, so the shared one only feeds the tagger and parser).
+    
+    Args:
+        nlp: spaCy language model
+        
+    Returns:
+        Names of the components to disable
+    """
+    disable = [name for name in nlp.pipe_names if name in _NER_UNUSED_PIPES]
+    
+    for name in nlp.pipe_names:
+        if name not in _TOK2VEC_PIPES:
+            continue
+        listeners = getattr(nlp.get_pipe(name), "listening_components", [])
+        if all(listener in disable for listener in listeners):
+            disable.append(name)
+    
+    return disable
+
+
+def _empty_entities() -> Dict[str, List[str]]:
+    """Return an entity dict with no entities for every reported type."""
+    return {ent_type: [] for ent_type in ENTITY_TYPES}
+
+
+def _collect_entities(doc, max_entities_per_type: int) -> Dict[str, List[str]]:
+    """
+    Collect unique entities by type from a processed spaCy doc.
+    
+    Args:
+        doc: spaCy Doc
+        max_entities_per_type: Maximum number of unique entities per category
+        
+    Returns:
+        Dictionary with entity types as keys and lists of entities as values
+    """
+    entities = _empty_entities()
+    
+    for ent in doc.ents:
+        if ent.label_ in entities:
+            # Add unique entities only
+            entity_text = ent.text.strip()
+            if entity_text and entity_text not in entities[ent.label_]:
+                entities[ent.label_].append(entity_text)
+    
+    # Limit to top N entities per type
+    for ent_type in entities:
+        entities[ent_type] = entities[ent_type][:max_entities_per_type]
+    
+    return entities
+
+
+def iter_entities(
+    texts: Iterable[str],
+    max_entities_per_type: int = 10,
+    batch_size: int = 32,
+    n_process: int = 1
+) -> Iterator[Dict[str, List[str]]]:
+    """
+    Lazily extract named entities for many texts with nlp.pipe.
+    
+    Components NER does not need (tagger, parser, lemmatizer, ...) are
+    disabled, as is the shared tok2vec if nothing left listens to it.
+    Empty texts are not sent through the model. The first text is
+    processed on its own, so its entities do not wait for a full batch.
+    
+    Args:
+        texts: Input texts (resumes)
+        max_entities_per_type: Maximum number of unique entities per category
+        batch_size: Number of texts per nlp.pipe batch
+        n_process: Number of processes used by nlp.pipe
+        
+    Yields:
+        Entity dictionaries, in input order
+    """
+    texts = list(texts)
+    non_empty = [text for text in texts if text]
+    
+    docs = iter(())
+    if non_empty:
+        nlp = get_spacy_model()
+        disable = _ner_disabled_pipes(nlp)
+        docs = itertools.chain(
+            nlp.pipe(non_empty[:1], disable=disable),
+            nlp.pipe(non_empty[1:], batch_size=batch_size, n_process=n_process, disable=disable),
+        )
+    
+    for text in texts:
+        if not text:
+            yield _empty_entities()
+        else:
+            yield _collect_entities(next(docs), max_entities_per_type)
+
+
+def extract_entities_batch(
+    texts: List[str],
+    max_entities_per_type: int = 10,
+    batch_size: int = 32,
+    n_process: int = 1
+) -> List[Dict[str, List[str]]]:
+    """
+    Extract named entities for many texts in one nlp.pipe run.
+    
+    Args:
+        texts: Input texts (resumes)
+        max_entities_per_type: Maximum number of unique entities per category
+        batch_size: Number of texts per nlp.pipe batch
+        n_process: Number of processes used by nlp.pipe
+        
+    Returns:
+        List of entity dictionaries, in the same order as texts
+    """
+    return list(iter_entities(texts, max_entities_per_type, batch_size, n_process))
+
+
 def extract_entities(text: str, max_entities_per_type: int = 10) -> Dict[str, List[str]]:
     """
     Extract named entities using spaCy NER.
@@ -55,34 +202,4 @@ def extract_entities(text: str, max_entities_per_type: int = 10) -> Dict[str, Li
             'DATE': ['2020-2023']
         }
     """
-    if not text:
-        return {
-            "PERSON": [],
-            "ORG": [],
-            "GPE": [],
-            "DATE": []
-        }
-    
-    nlp = get_spacy_model()
-    doc = nlp(text)
-    
-    # Collect entities by type
-    entities = {
-        "PERSON": [],
-        "ORG": [],
-        "GPE": [],
-        "DATE": []
-    }
-    
-    for ent in doc.ents:
-        if ent.label_ in entities:
-            # Add unique entities only
-            entity_text = ent.text.strip()
-            if entity_text and entity_text not in entities[ent.label_]:
-                entities[ent.label_].append(entity_text)
-    
-    # Limit to top N entities per type
-    for ent_type in entities:
-        entities[ent_type] = entities[ent_type][:max_entities_per_type]
-    
-    return entities
+    return extract_entities_batch([text], max_entities_per_type)[0]
@@ -1,16 +1,156 @@
 """PDF loading utilities for the resume engine.
 
 Provides functions to extract text from PDFs and load resumes or JDs from
-disk. Uses PyMuPDF (fitz) for robust PDF text extraction.
+disk. Uses PyMuPDF (fitz) for robust PDF text extraction; PyMuPDF is
+imported on first use.
+
+Extraction reads one page at a time through PdfPageReader and stops early
+once a limit is hit (``PDF_MAX_PAGES``, ``PDF_MAX_CHARS`` and, if set,
+``PDF_TIME_BUDGET_SEC``), so a huge PDF costs no more than its first pages.
 """
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+import os
 import re
-from typing import Dict
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from .text_cache import PdfTextCache, get_pdf_text_cache
+
+# Cache key component for pdf_to_text output; bump when extraction changes
+PDF_TEXT_EXTRACTOR_VERSION = "pdf_loader-1"
+
+# Default extraction limits per PDF (overridden by the PDF_MAX_PAGES,
+# PDF_MAX_CHARS and PDF_TIME_BUDGET_SEC environment variables; 0 disables).
+# The time budget is off by default: a cut depending on machine load would
+# make results differ between runs.
+DEFAULT_PDF_LIMITS = {"max_pages": 50, "max_chars": 200_000, "time_budget_sec": 0}
+
+# PyMuPDF module (lazy imported)
+_fitz = None
+
+
+def _load_fitz():
+    """Import PyMuPDF on first use.
+
+    Returns:
+        The fitz module, or None if PyMuPDF is not installed.
+    """
+    global _fitz
+
+    if _fitz is None:
+        try:
+            import fitz  # PyMuPDF
+        except Exception:
+            return None
+        _fitz = fitz
+
+    return _fitz
+
+
+def get_pdf_limits() -> Dict[str, Optional[Union[int, float]]]:
+    """Get the PDF extraction limits configured by environment variables.
+
+    Returns:
+        Dict with max_pages, max_chars and time_budget_sec (None = no limit)
+    """
+    limits: Dict[str, Optional[Union[int, float]]] = {}
+    for name, env_var, cast in (
+        ("max_pages", "PDF_MAX_PAGES", int),
+        ("max_chars", "PDF_MAX_CHARS", int),
+        ("time_budget_sec", "PDF_TIME_BUDGET_SEC", float),
+    ):
+        value = cast(os.getenv(env_var, DEFAULT_PDF_LIMITS[name]))
+        limits[name] = value if value > 0 else None
+    return limits
+
+
+class PdfPageReader:
+    """Iterate the page texts of an open PyMuPDF document within the extraction limits.
+
+    Every PDF extractor reads pages through this class, so they all truncate
+    the same way:
+
+    - Pages without text are skipped.
+    - Before each page, reading stops once max_pages pages were read or the
+      time budget is spent; the text is then truncated.
+    - max_chars counts the yielded texts plus one separator between
+      consecutive texts. The page that overflows it is cut, and the text is
+      truncated only if non-whitespace text was dropped.
+
+    Attributes:
+        truncated: Whether reading stopped with text left unread (set once
+            iteration ends)
+    """
+
+    def __init__(
+        self,
+        doc,
+        limits: Optional[Dict[str, Optional[Union[int, float]]]] = None,
+        separator: str = " ",
+        page_text: Optional[Callable[[str], str]] = None,
+        skip_page_errors: bool = False,
+    ):
+        """
+        Args:
+            doc: Open PyMuPDF document
+            limits: max_pages / max_chars / time_budget_sec (None values or
+                missing keys mean no limit), see get_pdf_limits()
+            separator: String the caller joins the page texts with
+            page_text: Optional function applied to each page's raw text
+            skip_page_errors: Skip pages that fail to load instead of raising
+        """
+        self.doc = doc
+        self.limits = limits or {}
+        self.separator = separator
+        self.page_text = page_text
+        self.skip_page_errors = skip_page_errors
+        self.truncated = False
+
+    def _out_of_budget(self, pages_read: int, start_time: float) -> bool:
+        max_pages = self.limits.get("max_pages")
+        time_budget = self.limits.get("time_budget_sec")
+        return (
+            (max_pages is not None and pages_read >= max_pages)
+            or (time_budget is not None and time.perf_counter() - start_time >= time_budget)
+        )
 
-try:
-    import fitz  # PyMuPDF
-except Exception as e:
-    fitz = None  # type: ignore
+    def __iter__(self) -> Iterator[str]:
+        max_chars = self.limits.get("max_chars")
+        chars_read = 0
+        start_time = time.perf_counter()
+        self.truncated = False
+
+        for page_num in range(self.doc.page_count):
+            if self._out_of_budget(page_num, start_time):
+                self.truncated = True
+                return
+
+            try:
+                text = self.doc.load_page(page_num).get_text() or ""
+            except Exception:
+                if not self.skip_page_errors:
+                    raise
+                continue
+            if self.page_text is not None:
+                text = self.page_text(text)
+            if not text.strip():
+                continue
+
+            separator = len(self.separator) if chars_read else 0
+            if max_chars is not None and chars_read + separator + len(text) > max_chars:
+                kept = text[:max(max_chars - chars_read - separator, 0)].rstrip()
+                chars_read = max_chars
+                if kept:
+                    yield kept
+                # Any later page with text overflows too
+                if text[len(kept):].strip():
+                    self.truncated = True
+                    return
+                continue
+
+            chars_read += separator + len(text)
+            yield text
 
 
 def _normalize_text(text: str) -> str:
@@ -22,74 +162,217 @@ def _normalize_text(text: str) -> str:
     return re.sub(r"\s+", " ", text).strip()
 
 
-def pdf_to_text(pdf_path: Path) -> str:
-    """Extract text from all pages of a PDF using PyMuPDF.
+def _extractor_version() -> str:
+    """Extractor version used in cache keys (includes the PyMuPDF version)."""
+    return f"{PDF_TEXT_EXTRACTOR_VERSION}/{getattr(_load_fitz(), 'VersionBind', '')}"
+
+
+def _extract_pdf_text(
+    source, limits: Dict[str, Optional[Union[int, float]]]
+) -> Tuple[str, bool]:
+    """Extract and normalize text from a PDF path or raw PDF bytes.
+
+    Pages are read and normalized one at a time, so only one page's raw
+    text is held in memory; reading stops once a limit is reached.
+
+    Returns:
+        Tuple of (extracted text, truncated). Returns ("", False) on failure.
+    """
+    try:
+        fitz = _load_fitz()
+        if isinstance(source, bytes):
+            doc = fitz.open(stream=source, filetype="pdf")
+        else:
+            doc = fitz.open(str(source))
+    except Exception:
+        return "", False
+
+    reader = PdfPageReader(doc, limits, page_text=_normalize_text, skip_page_errors=True)
+    try:
+        text = reader.separator.join(reader)
+    except Exception:
+        return "", False
+    finally:
+        doc.close()
+
+    return text, reader.truncated
+
+
+def extract_pdf_text_bounded(
+    pdf_path: Path,
+    cache: Optional[PdfTextCache] = None,
+    limits: Optional[Dict[str, Optional[Union[int, float]]]] = None,
+) -> Tuple[str, bool]:
+    """Extract text from a PDF, stopping early at the extraction limits.
 
     Args:
         pdf_path: Path to the PDF file
+        cache: Optional PDF text cache consulted before parsing. Defaults to
+            the cache configured by PDF_TEXT_CACHE_DIR (if any).
+        limits: max_pages / max_chars / time_budget_sec (None values mean no
+            limit). Defaults to get_pdf_limits().
 
     Returns:
-        Extracted text as a single string. Returns empty string on failure.
+        Tuple of (extracted text, truncated). Truncated text is not cached,
+        since a time budget cut depends on machine load.
     """
-    if fitz is None:
+    if _load_fitz() is None:
         raise RuntimeError("PyMuPDF (fitz) is not installed")
 
     pdf_path = Path(pdf_path)
     if not pdf_path.exists() or not pdf_path.is_file():
-        return ""
+        return "", False
 
+    if limits is None:
+        limits = get_pdf_limits()
+    if cache is None:
+        cache = get_pdf_text_cache()
+    if cache is None:
+        return _extract_pdf_text(pdf_path, limits)
+
+    # Complete extractions do not depend on the limits, so they share a key
     try:
-        doc = fitz.open(str(pdf_path))
-        parts = []
-        for page in doc:
-            try:
-                text = page.get_text() or ""
-                parts.append(text)
-            except Exception:
-                # Skip a single page on failure
-                continue
-        doc.close()
-        full_text = "\n".join(parts)
-        return _normalize_text(full_text)
-    except Exception:
-        return ""
+        key = cache.make_file_key(pdf_path, _extractor_version())
+    except OSError:
+        return "", False
+    text = cache.get(key)
+    if text is not None:
+        return text, False
+
+    text, truncated = _extract_pdf_text(pdf_path, limits)
+    if not truncated:
+        cache.put(key, text)
+    return text, truncated
+
+
+def pdf_to_text(pdf_path: Path, cache: Optional[PdfTextCache] = None) -> str:
+    """Extract text from the pages of a PDF using PyMuPDF.
+
+    Reading stops at the limits from get_pdf_limits(); truncated PDFs are
+    logged (see extract_pdf_text_bounded for the truncation flag).
+
+    Args:
+        pdf_path: Path to the PDF file
+        cache: Optional PDF text cache consulted before parsing. Defaults to
+            the cache configured by PDF_TEXT_CACHE_DIR (if any).
+
+    Returns:
+        Extracted text as a single string. Returns empty string on failure.
+    """
+    text, truncated = extract_pdf_text_bounded(pdf_path, cache)
+    if truncated:
+        print(f"[pdf_loader] Truncated '{Path(pdf_path).name}' at the extraction limits")
+    return text
+
+
+def _list_pdf_files(folder_path: str) -> List[Path]:
+    """List PDF files in a folder, sorted by name. Returns [] if missing."""
+    folder = Path(folder_path)
+
+    if not folder.exists() or not folder.is_dir():
+        return []
+
+    return [
+        p for p in sorted(folder.iterdir())
+        if p.is_file() and p.suffix.lower() == ".pdf"
+    ]
+
+
+def _timed_pdf_to_text(pdf_path: Path) -> Tuple[str, float, Optional[str]]:
+    """Run pdf_to_text and time it.
 
+    Returns:
+        Tuple of (text, elapsed seconds, error message or None)
+    """
+    start = time.perf_counter()
+    try:
+        text = pdf_to_text(pdf_path)
+        error = None
+    except Exception as e:
+        text = ""
+        error = str(e)
+    return text, time.perf_counter() - start, error
+
+
+def _collect_resume(
+    results: Dict[str, str], p: Path, text: str, error: Optional[str]
+) -> None:
+    """Add an extracted resume to results, logging skipped files."""
+    if error is not None:
+        print(f"[pdf_loader] Failed to read '{p.name}': {error}")
+        return
+
+    if not text:
+        print(f"[pdf_loader] Skipping '{p.name}' — no text extracted")
+        return
+
+    results[p.stem] = text
 
-def load_resumes_from_folder(folder_path: str) -> Dict[str, str]:
+
+def load_resumes_from_folder(
+    folder_path: str, timings: Optional[Dict[str, float]] = None
+) -> Dict[str, str]:
     """Load all PDF resumes from a folder into a dict.
 
     Args:
         folder_path: Path to folder containing PDF files
+        timings: Optional dict filled with per-file extraction time in
+            seconds, keyed by file name
 
     Returns:
         Dictionary mapping candidate_id (filename without extension) to
         extracted resume text. Files that fail extraction or yield empty
         text are skipped.
     """
-    folder = Path(folder_path)
     results: Dict[str, str] = {}
 
-    if not folder.exists() or not folder.is_dir():
-        return results
+    for p in _list_pdf_files(folder_path):
+        text, elapsed, error = _timed_pdf_to_text(p)
+        if timings is not None:
+            timings[p.name] = elapsed
+        _collect_resume(results, p, text, error)
 
-    for p in sorted(folder.iterdir()):
-        if not p.is_file():
-            continue
-        if p.suffix.lower() != ".pdf":
-            continue
+    return results
 
-        candidate_id = p.stem
-        try:
-            text = pdf_to_text(p)
-        except Exception as e:
-            print(f"[pdf_loader] Failed to read '{p.name}': {e}")
-            continue
 
-        if not text:
-            print(f"[pdf_loader] Skipping '{p.name}' — no text extracted")
-            continue
+def load_resumes_from_folder_parallel(
+    folder_path: str,
+    max_workers: Optional[int] = None,
+    timings: Optional[Dict[str, float]] = None,
+) -> Dict[str, str]:
+    """Load all PDF resumes from a folder using a process pool.
+
+    Same output, ordering and skip/log behavior as load_resumes_from_folder,
+    with PDF extraction fanned out across processes.
+
+    Args:
+        folder_path: Path to folder containing PDF files
+        max_workers: Number of worker processes (default: CPU count)
+        timings: Optional dict filled with per-file extraction time in
+            seconds, keyed by file name
+
+    Returns:
+        Dictionary mapping candidate_id (filename without extension) to
+        extracted resume text, in sorted file order.
+    """
+    paths = _list_pdf_files(folder_path)
+    results: Dict[str, str] = {}
+
+    if not paths:
+        return results
+
+    max_workers = max_workers or os.cpu_count() or 1
+    max_workers = min(max_workers, len(paths))
+
+    # Batch files per task so IPC overhead stays small on large folders
+    chunksize = max(1, len(paths) // (max_workers * 4))
 
-        results[candidate_id] = text
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        extracted = pool.map(_timed_pdf_to_text, paths, chunksize=chunksize)
+        for p, (text, elapsed, error) in zip(paths, extracted):
+            if timings is not None:
+                timings[p.name] = elapsed
+            _collect_resume(results, p, text, error)
 
     return results
 
@@ -1,25 +1,610 @@
-
 """
 Main pipeline orchestrating the entire resume screening process.
 """
 
 #Final Score = (Skill Match Score * Skill Weight) + (Semantic Similarity Score * Semantic Weight)
 
-from typing import Dict, List
+import heapq
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from .cleaner import clean_text
-from .skill_extractor import extract_skills, compute_skill_matches
+from .skill_extractor import extract_skills, compute_skill_matches, get_skill_matcher
 from .regex_extractor import extract_contact_info
-from .ner_extractor import extract_entities
-from .similarity import compute_tfidf_similarity
-from .scorer import compute_skill_match_score, compute_final_score
-from .ranker import rank_candidates
+from .ner_extractor import iter_entities, get_spacy_model
+from .similarity import (
+    compute_tfidf_similarity_batch,
+    compute_tfidf_similarity_matrix,
+    tfidf_similarity_scorer,
+)
+from .feature_cache import FeatureCache
+from .scorer import (
+    compute_skill_match_score,
+    compute_skill_match_scores,
+    compute_final_score,
+    compute_final_scores,
+)
+from .ranker import rank_candidates, generate_short_reason
+
+if TYPE_CHECKING:
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+# Chunks per worker when sharding candidates; several smaller chunks per
+# worker let fast workers pick up more work
+_CHUNKS_PER_WORKER = 4
+
+# Global process pool for parallel evaluation (lazy created)
+_process_pool = None
+_process_pool_workers = 0
+
+
+def _init_worker():
+    """Load the spaCy model and skill matcher once per worker process."""
+    get_spacy_model()
+    get_skill_matcher()
+
+
+def get_process_pool(n_workers: int) -> ProcessPoolExecutor:
+    """
+    Get or create the shared process pool (singleton pattern).
+    
+    Args:
+        n_workers: Number of worker processes
+        
+    Returns:
+        ProcessPoolExecutor whose workers have the models preloaded
+    """
+    global _process_pool, _process_pool_workers
+    
+    if _process_pool is None or _process_pool_workers != n_workers:
+        shutdown_process_pool()
+        _process_pool = ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker)
+        _process_pool_workers = n_workers
+    
+    return _process_pool
+
+
+def shutdown_process_pool():
+    """Shut down the shared process pool, if one was created."""
+    global _process_pool, _process_pool_workers
+    
+    if _process_pool is not None:
+        _process_pool.shutdown()
+        _process_pool = None
+        _process_pool_workers = 0
+
+
+def _worker_ready() -> bool:
+    """No-op task used to make sure a pool worker has started."""
+    return True
+
+
+def _warm_up_process_pool(n_workers: int) -> None:
+    """Start every worker of the shared process pool (loading its models)."""
+    pool = get_process_pool(n_workers)
+    
+    # Submitting all tasks before any finishes makes the pool spawn every worker
+    futures = [pool.submit(_worker_ready) for _ in range(n_workers)]
+    for future in futures:
+        future.result()
+
+
+# Tiny synthetic inputs used to warm up the pipeline
+_WARM_UP_JD = "Looking for a Python developer with SQL, Docker and machine learning experience."
+_WARM_UP_RESUME = (
+    "Jane Doe | jane.doe@example.com | +1 555 010 0000\n"
+    "Python developer at Example Corp in London since 2020. "
+    "Skills: Python, SQL, Docker, machine learning."
+)
+
+
+def warm_up_steps(
+    n_workers: int = 1,
+    tfidf_model: Optional["TfidfVectorizer"] = None
+) -> List[Tuple[str, Callable[[], None]]]:
+    """
+    Steps that load and warm every engine component before the first request.
+    
+    Running the steps in order loads the skill matcher, the spaCy model and
+    scikit-learn, starts the worker processes (when n_workers > 1) and finally
+    evaluates a tiny synthetic resume through the whole pipeline.
+    
+    Args:
+        n_workers: Number of worker processes requests will use
+        tfidf_model: Pre-fitted TF-IDF model requests will use, if any
+        
+    Returns:
+        List of (component name, step) pairs; each step raises on failure
+    """
+    steps = [
+        ("skill_matcher", get_skill_matcher),
+        ("spacy_model", get_spacy_model),
+        ("tfidf", lambda: compute_tfidf_similarity_batch(_WARM_UP_JD, [_WARM_UP_RESUME], tfidf_model)),
+    ]
+    
+    if n_workers > 1:
+        steps.append(("process_pool", lambda: _warm_up_process_pool(n_workers)))
+    
+    steps.append((
+        "pipeline",
+        lambda: evaluate_candidates(
+            _WARM_UP_JD, {"warm_up": _WARM_UP_RESUME}, tfidf_model=tfidf_model, n_workers=n_workers
+        ),
+    ))
+    
+    return steps
+
+
+def _balanced_chunks(texts: List[str], n_chunks: int) -> List[List[int]]:
+    """
+    Split text indices into chunks with roughly equal total text length.
+    
+    Longest texts are assigned first, each to the currently lightest chunk,
+    so long and short resumes are spread across workers.
+    
+    Args:
+        texts: Resume texts
+        n_chunks: Maximum number of chunks
+        
+    Returns:
+        Non-empty lists of indices into texts, each sorted ascending
+    """
+    n_chunks = max(1, min(n_chunks, len(texts)))
+    heap = [(0, chunk_idx) for chunk_idx in range(n_chunks)]
+    chunks = [[] for _ in range(n_chunks)]
+    
+    for i in sorted(range(len(texts)), key=lambda i: len(texts[i]), reverse=True):
+        load, chunk_idx = heapq.heappop(heap)
+        chunks[chunk_idx].append(i)
+        heapq.heappush(heap, (load + len(texts[i]), chunk_idx))
+    
+    return [sorted(chunk) for chunk in chunks if chunk]
+
+
+def _record_timing(timings: Optional[Dict[str, float]], stage: str, seconds: float) -> None:
+    """Add seconds to the cumulative time of a stage, if timings are collected."""
+    if timings is not None:
+        timings[stage] = timings.get(stage, 0.0) + seconds
+
+
+def _iter_extract_features(
+    resume_texts: List[str],
+    cleaned_texts: List[str],
+    timings: Optional[Dict[str, float]] = None
+) -> Iterator[Dict]:
+    """
+    Lazily compute the JD-independent features of each resume.
+    
+    Args:
+        resume_texts: Raw resume texts
+        cleaned_texts: Cleaned resume texts (same order)
+        timings: Optional dict receiving the time spent in the 'skills',
+            'contact' and 'ner' stages
+        
+    Yields:
+        Dicts with 'cleaned', 'skills', 'contact' and 'ner_entities' keys,
+        in input order
+    """
+    # NER runs batched over all resumes (original text for better NER)
+    ner_results = iter_entities(resume_texts)
+    
+    for resume_text, resume_cleaned in zip(resume_texts, cleaned_texts):
+        start = time.perf_counter()
+        skills = extract_skills(resume_cleaned)
+        skills_done = time.perf_counter()
+        contact = extract_contact_info(resume_text)  # Original text for better regex matching
+        contact_done = time.perf_counter()
+        ner_entities = next(ner_results)
+        ner_done = time.perf_counter()
+        
+        _record_timing(timings, "skills", skills_done - start)
+        _record_timing(timings, "contact", contact_done - skills_done)
+        _record_timing(timings, "ner", ner_done - contact_done)
+        
+        yield {
+            "cleaned": resume_cleaned,
+            "skills": skills,
+            "contact": contact,
+            "ner_entities": ner_entities,
+        }
+
+
+def _extract_features(
+    resume_texts: List[str],
+    cleaned_texts: List[str]
+) -> Tuple[List[Dict], Dict[str, float]]:
+    """
+    Compute the JD-independent features of each resume (worker entry point).
+    
+    Args:
+        resume_texts: Raw resume texts
+        cleaned_texts: Cleaned resume texts (same order)
+        
+    Returns:
+        (list of feature dicts in input order, per-stage timings)
+    """
+    timings: Dict[str, float] = {}
+    features = list(_iter_extract_features(resume_texts, cleaned_texts, timings))
+    return features, timings
+
+
+def _iter_features(
+    resume_texts: List[str],
+    cleaned_texts: List[str],
+    indices: List[int],
+    n_workers: int = 1,
+    timings: Optional[Dict[str, float]] = None
+) -> Iterator[Tuple[int, Dict]]:
+    """
+    Compute features for the given resumes, serially or across the process pool.
+    
+    Args:
+        resume_texts: Raw resume texts
+        cleaned_texts: Cleaned resume texts (same order)
+        indices: Indices of the resumes to process
+        n_workers: Number of worker processes (1 = serial)
+        timings: Optional dict receiving per-stage times (summed over
+            workers in parallel mode)
+        
+    Yields:
+        (index, features) tuples as soon as each resume (serial) or chunk
+        of resumes (parallel) is done
+    """
+    if n_workers <= 1 or len(indices) <= 1:
+        features = _iter_extract_features(
+            [resume_texts[i] for i in indices],
+            [cleaned_texts[i] for i in indices],
+            timings
+        )
+        yield from zip(indices, features)
+        return
+    
+    chunks = _balanced_chunks([resume_texts[i] for i in indices], n_workers * _CHUNKS_PER_WORKER)
+    pool = get_process_pool(n_workers)
+    
+    futures = {}
+    for chunk in chunks:
+        chunk_indices = [indices[j] for j in chunk]
+        future = pool.submit(
+            _extract_features,
+            [resume_texts[i] for i in chunk_indices],
+            [cleaned_texts[i] for i in chunk_indices]
+        )
+        futures[future] = chunk_indices
+    
+    for future in as_completed(futures):
+        features, worker_timings = future.result()
+        for stage, seconds in worker_timings.items():
+            _record_timing(timings, stage, seconds)
+        yield from zip(futures[future], features)
+
+
+def _score_candidate(
+    candidate_id: str,
+    features: Dict,
+    jd_skills: List[str],
+    semantic_score: float,
+    skill_weight: float,
+    semantic_weight: float
+) -> Dict:
+    """
+    Build the result dictionary of one candidate from its features.
+    
+    Returns:
+        Candidate result dictionary (short_reason is filled by the ranker)
+    """
+    resume_skills = features["skills"]
+    contact_info = features["contact"]
+    
+    # Compute skill matches
+    skill_comparison = compute_skill_matches(jd_skills, resume_skills)
+    matched_skills = skill_comparison["matched"]
+    missing_skills = skill_comparison["missing"]
+    
+    # Compute skill match score
+    skill_score = compute_skill_match_score(matched_skills, jd_skills)
+    
+    # Compute final weighted score
+    final_score = compute_final_score(
+        skill_score,
+        semantic_score,
+        skill_weight,
+        semantic_weight
+    )
+    
+    return {
+        "candidate_id": candidate_id,
+        "emails": contact_info["emails"],
+        "phones": contact_info["phones"],
+        "github": contact_info["github"],
+        "linkedin": contact_info["linkedin"],
+        "extracted_skills": resume_skills,
+        "matched_skills": matched_skills,
+        "missing_skills": missing_skills,
+        "skill_match_score": skill_score,
+        "semantic_similarity_score": semantic_score,
+        "final_match_score": final_score,
+        "ner_entities": features["ner_entities"],
+        "short_reason": ""  # Will be filled by ranker
+    }
+
+
+def _lookup_cached_features(
+    resume_texts: List[str],
+    feature_cache: Optional[FeatureCache]
+) -> Tuple[List[Optional[Dict]], List[str], Optional[str]]:
+    """
+    Look up the cached JD-independent features of each resume.
+    
+    Returns:
+        (features or None per resume, cache keys, skill fingerprint)
+    """
+    if feature_cache is None:
+        return [None] * len(resume_texts), [], None
+    
+    fingerprint = get_skill_matcher().fingerprint
+    keys = [feature_cache.make_key(text, fingerprint) for text in resume_texts]
+    cached = [feature_cache.get(key, fingerprint) for key in keys]
+    return cached, keys, fingerprint
+
+
+def _cleaned_texts(resume_texts: List[str], cached: List[Optional[Dict]]) -> List[str]:
+    """Cleaned resume texts, reusing cached ones."""
+    return [
+        features["cleaned"] if features is not None else clean_text(resume_text)
+        for resume_text, features in zip(resume_texts, cached)
+    ]
+
+
+def _iter_scored_candidates(
+    jd_text: str,
+    candidates: Dict[str, str],
+    skill_weight: float = 0.50,
+    semantic_weight: float = 0.50,
+    tfidf_model: Optional["TfidfVectorizer"] = None,
+    n_workers: int = 1,
+    feature_cache: Optional[FeatureCache] = None,
+    timings: Optional[Dict[str, float]] = None
+) -> Iterator[Tuple[int, Dict]]:
+    """
+    Score candidates one by one as their features become available.
+    
+    Yields:
+        (index into candidates, unranked candidate result) tuples, in
+        completion order
+    """
+    # Step 1: Clean job description
+    start = time.perf_counter()
+    jd_cleaned = clean_text(jd_text)
+    _record_timing(timings, "clean", time.perf_counter() - start)
+    
+    # Step 2: Extract skills from JD
+    start = time.perf_counter()
+    jd_skills = extract_skills(jd_cleaned)
+    _record_timing(timings, "skills", time.perf_counter() - start)
+    
+    candidate_ids = list(candidates.keys())
+    resume_texts = list(candidates.values())
+    
+    # Step 3: Look up cached JD-independent features
+    cached, keys, fingerprint = _lookup_cached_features(resume_texts, feature_cache)
+    
+    # Step 4: Clean resumes and compute semantic similarity for the whole
+    # pool in one pass
+    start = time.perf_counter()
+    cleaned_texts = _cleaned_texts(resume_texts, cached)
+    _record_timing(timings, "clean", time.perf_counter() - start)
+    
+    start = time.perf_counter()
+    semantic_scores = compute_tfidf_similarity_batch(jd_cleaned, cleaned_texts, model=tfidf_model)
+    _record_timing(timings, "similarity", time.perf_counter() - start)
+    
+    def score(i: int, features: Dict) -> Tuple[int, Dict]:
+        start = time.perf_counter()
+        result = _score_candidate(
+            candidate_ids[i], features, jd_skills, semantic_scores[i], skill_weight, semantic_weight
+        )
+        _record_timing(timings, "scoring", time.perf_counter() - start)
+        return i, result
+    
+    # Step 5: Score cached candidates right away
+    for i, features in enumerate(cached):
+        if features is not None:
+            yield score(i, features)
+    
+    # Step 6: Extract features (skills, contact, NER) for the rest and score
+    # each candidate as soon as it is done
+    missing = [i for i, features in enumerate(cached) if features is None]
+    for i, features in _iter_features(resume_texts, cleaned_texts, missing, n_workers, timings):
+        if feature_cache is not None:
+            feature_cache.put(keys[i], fingerprint, features)
+        yield score(i, features)
+
+
+def _iter_scored_incrementally(
+    jd_text: str,
+    candidates: Iterable[Tuple[str, str]],
+    skill_weight: float,
+    semantic_weight: float,
+    tfidf_model: "TfidfVectorizer",
+    n_workers: int = 1,
+    feature_cache: Optional[FeatureCache] = None,
+    timings: Optional[Dict[str, float]] = None
+) -> Iterator[Dict]:
+    """
+    Score candidates as they arrive from a (possibly lazy) stream.
+    
+    With a pre-fitted TF-IDF model, similarity depends only on the JD and
+    one resume, so no candidate waits for the rest of the pool. Features are
+    extracted one resume at a time, in this process or (n_workers > 1) as
+    one process pool task per resume.
+    
+    Yields:
+        Unranked candidate results, in completion order
+    """
+    start = time.perf_counter()
+    jd_cleaned = clean_text(jd_text)
+    _record_timing(timings, "clean", time.perf_counter() - start)
+    
+    start = time.perf_counter()
+    jd_skills = extract_skills(jd_cleaned)
+    _record_timing(timings, "skills", time.perf_counter() - start)
+    
+    start = time.perf_counter()
+    similarity = tfidf_similarity_scorer(jd_cleaned, tfidf_model)
+    _record_timing(timings, "similarity", time.perf_counter() - start)
+    
+    fingerprint = get_skill_matcher().fingerprint if feature_cache is not None else None
+    pool = get_process_pool(n_workers) if n_workers > 1 else None
+    pending = {}
+    
+    def score(candidate_id: str, features: Dict, semantic_score: float) -> Dict:
+        start = time.perf_counter()
+        result = _score_candidate(
+            candidate_id, features, jd_skills, semantic_score, skill_weight, semantic_weight
+        )
+        _record_timing(timings, "scoring", time.perf_counter() - start)
+        return result
+    
+    def finish(future) -> Dict:
+        candidate_id, key, semantic_score = pending.pop(future)
+        features, worker_timings = future.result()
+        for stage, seconds in worker_timings.items():
+            _record_timing(timings, stage, seconds)
+        if feature_cache is not None:
+            feature_cache.put(key, fingerprint, features[0])
+        return score(candidate_id, features[0], semantic_score)
+    
+    for candidate_id, resume_text in candidates:
+        key, cached = None, None
+        if feature_cache is not None:
+            key = feature_cache.make_key(resume_text, fingerprint)
+            cached = feature_cache.get(key, fingerprint)
+        
+        start = time.perf_counter()
+        resume_cleaned = cached["cleaned"] if cached is not None else clean_text(resume_text)
+        _record_timing(timings, "clean", time.perf_counter() - start)
+        
+        start = time.perf_counter()
+        semantic_score = similarity(resume_cleaned)
+        _record_timing(timings, "similarity", time.perf_counter() - start)
+        
+        if cached is not None:
+            yield score(candidate_id, cached, semantic_score)
+        elif pool is None:
+            features = next(_iter_extract_features([resume_text], [resume_cleaned], timings))
+            if feature_cache is not None:
+                feature_cache.put(key, fingerprint, features)
+            yield score(candidate_id, features, semantic_score)
+        else:
+            future = pool.submit(_extract_features, [resume_text], [resume_cleaned])
+            pending[future] = (candidate_id, key, semantic_score)
+            for done in [f for f in pending if f.done()]:
+                yield finish(done)
+    
+    for future in as_completed(list(pending)):
+        yield finish(future)
+
+
+def iter_candidate_results(
+    jd_text: str,
+    candidates: Union[Dict[str, str], Iterable[Tuple[str, str]]],
+    skill_weight: float = 0.50,
+    semantic_weight: float = 0.50,
+    tfidf_model: Optional["TfidfVectorizer"] = None,
+    n_workers: int = 1,
+    feature_cache: Optional[FeatureCache] = None,
+    timings: Optional[Dict[str, float]] = None
+) -> Iterator[Dict]:
+    """
+    Score candidates incrementally, yielding each result as soon as it is ready.
+    
+    Takes the same arguments as evaluate_candidates; candidates may also be
+    a lazy iterable of (candidate_id, resume_text) pairs. Results are not
+    ranked; pass the collected list (in input order) to
+    ranker.rank_candidates for the final ranking.
+    
+    With a pre-fitted tfidf_model, each candidate is scored as soon as it
+    is read from candidates, so the first result costs about one resume.
+    Without one, IDF weights come from the whole pool: every candidate is
+    read, cleaned and vectorized before the first result.
+    
+    Yields:
+        Unranked candidate result dictionaries (with short_reason), in
+        completion order
+    """
+    if tfidf_model is not None:
+        pairs = candidates.items() if isinstance(candidates, dict) else candidates
+        results = _iter_scored_incrementally(
+            jd_text, pairs, skill_weight, semantic_weight, tfidf_model, n_workers, feature_cache, timings
+        )
+    else:
+        if not isinstance(candidates, dict):
+            candidates = dict(candidates)
+        results = (
+            result for _, result in _iter_scored_candidates(
+                jd_text, candidates, skill_weight, semantic_weight, tfidf_model, n_workers, feature_cache,
+                timings
+            )
+        )
+    
+    for result in results:
+        result["short_reason"] = generate_short_reason(
+            skill_match_score=result["skill_match_score"],
+            matched_skills=result["matched_skills"],
+            missing_skills=result["missing_skills"],
+            semantic_score=result["semantic_similarity_score"]
+        )
+        yield result
+
+
+def score_candidates(
+    jd_text: str,
+    candidates: Dict[str, str],
+    skill_weight: float = 0.50,
+    semantic_weight: float = 0.50,
+    tfidf_model: Optional["TfidfVectorizer"] = None,
+    n_workers: int = 1,
+    feature_cache: Optional[FeatureCache] = None,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    timings: Optional[Dict[str, float]] = None
+) -> List[Dict]:
+    """
+    Score all candidates without ranking them.
+    
+    Takes the same arguments as evaluate_candidates. Keep the result to
+    rank pages on demand with ranker.rank_candidates(results, limit, offset).
+    
+    Returns:
+        List of candidate result dictionaries in input order (short_reason
+        is filled by the ranker)
+    """
+    total = len(candidates)
+    results = [None] * total
+    
+    for done, (i, result) in enumerate(_iter_scored_candidates(
+        jd_text, candidates, skill_weight, semantic_weight, tfidf_model, n_workers, feature_cache,
+        timings
+    ), 1):
+        results[i] = result
+        if progress_callback is not None:
+            progress_callback(done, total)
+    
+    return results
 
 
 def evaluate_candidates(
     jd_text: str,
     candidates: Dict[str, str],
     skill_weight: float = 0.50,
-    semantic_weight: float = 0.50
+    semantic_weight: float = 0.50,
+    tfidf_model: Optional["TfidfVectorizer"] = None,
+    n_workers: int = 1,
+    feature_cache: Optional[FeatureCache] = None,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    timings: Optional[Dict[str, float]] = None
 ) -> List[Dict]:
     """
     Main pipeline to evaluate and rank candidates against a job description.
@@ -29,6 +614,22 @@ def evaluate_candidates(
         candidates: Dictionary mapping candidate_id to resume text
         skill_weight: Weight for skill matching (default 0.50)
         semantic_weight: Weight for semantic similarity (default 0.50)
+        tfidf_model: Optional pre-fitted TF-IDF model (see similarity.load_tfidf_model).
+            When given, similarity only transforms texts instead of fitting.
+        n_workers: Number of worker processes for resume processing. Values
+            above 1 shard candidates across a process pool; results are
+            identical to the serial path (default 1, serial).
+        feature_cache: Optional cache of JD-independent resume features
+            (see feature_cache.py); only cache misses are recomputed.
+        progress_callback: Optional callable invoked as (done, total) each
+            time a candidate has been scored.
+        limit: Maximum number of ranked candidates to return (default all).
+            Only returned candidates get a short_reason.
+        offset: Number of top-ranked candidates to skip (default 0)
+        timings: Optional dict filled with cumulative time in seconds per
+            stage: 'clean', 'skills', 'contact', 'ner', 'similarity',
+            'scoring' and 'ranking' (feature stages are summed over
+            workers when n_workers > 1)
         
     Returns:
         List of candidate result dictionaries, ranked by final_match_score
@@ -62,67 +663,120 @@ def evaluate_candidates(
         >>> print(results[0]['final_match_score'])
         85.5
     """
-    # Step 1: Clean job description
-    jd_cleaned = clean_text(jd_text)
+    results = score_candidates(
+        jd_text, candidates, skill_weight, semantic_weight, tfidf_model,
+        n_workers, feature_cache, progress_callback, timings
+    )
     
-    # Step 2: Extract skills from JD
-    jd_skills = extract_skills(jd_cleaned)
+    # Rank candidates (in input order, so ties rank deterministically) and
+    # generate reasons
+    start = time.perf_counter()
+    ranked_results = rank_candidates(results, limit=limit, offset=offset)
+    _record_timing(timings, "ranking", time.perf_counter() - start)
+    
+    return ranked_results
+
+
+def evaluate_candidates_multi(
+    jd_texts: Dict[str, str],
+    candidates: Dict[str, str],
+    skill_weight: float = 0.50,
+    semantic_weight: float = 0.50,
+    tfidf_model: Optional["TfidfVectorizer"] = None,
+    n_workers: int = 1,
+    feature_cache: Optional[FeatureCache] = None,
+    limit: Optional[int] = None,
+    offset: int = 0
+) -> Dict[str, List[Dict]]:
+    """
+    Evaluate one resume pool against many job descriptions.
     
-    # Step 3: Process each candidate
-    results = []
+    Resume processing (cleaning, skills, contact info, NER) runs once for
+    the whole pool. JD and resume skills become sparse binary matrices whose
+    product gives every JD x candidate skill overlap, and TF-IDF similarity
+    is computed for all pairs at once (see compute_tfidf_similarity_matrix).
+    Full result dictionaries are only built for returned candidates.
     
-    for candidate_id, resume_text in candidates.items():
-        # Clean resume text
-        resume_cleaned = clean_text(resume_text)
-        
-        # Extract resume skills
-        resume_skills = extract_skills(resume_cleaned)
-        
-        # Compute skill matches
-        skill_comparison = compute_skill_matches(jd_skills, resume_skills)
-        matched_skills = skill_comparison["matched"]
-        missing_skills = skill_comparison["missing"]
-        
-        # Extract contact information
-        contact_info = extract_contact_info(resume_text)  # Use original text for better regex matching
-        
-        # Extract NER entities
-        ner_entities = extract_entities(resume_text)  # Use original text for better NER
-        
-        # Compute semantic similarity
-        semantic_score = compute_tfidf_similarity(jd_cleaned, resume_cleaned)
-        
-        # Compute skill match score
-        skill_score = compute_skill_match_score(matched_skills, jd_skills)
+    Args:
+        jd_texts: Dictionary mapping JD id to job description text
+        candidates: Dictionary mapping candidate_id to resume text
+        skill_weight, semantic_weight, tfidf_model, n_workers, feature_cache,
+        limit, offset: Same as evaluate_candidates
         
-        # Compute final weighted score
-        final_score = compute_final_score(
-            skill_score,
-            semantic_score,
-            skill_weight,
-            semantic_weight
+    Returns:
+        Dictionary mapping JD id to its ranked candidate list, identical to
+        evaluate_candidates(jd_text, candidates, ...) for that JD
+    """
+    from scipy import sparse
+    
+    jd_ids = list(jd_texts.keys())
+    candidate_ids = list(candidates.keys())
+    resume_texts = list(candidates.values())
+    
+    # JD skills
+    jd_cleaned = [clean_text(jd_text) for jd_text in jd_texts.values()]
+    jd_skills = [extract_skills(text) for text in jd_cleaned]
+    
+    # JD-independent resume features, computed once for the pool
+    cached, keys, fingerprint = _lookup_cached_features(resume_texts, feature_cache)
+    cleaned_texts = _cleaned_texts(resume_texts, cached)
+    features = list(cached)
+    missing = [i for i, entry in enumerate(cached) if entry is None]
+    for i, entry in _iter_features(resume_texts, cleaned_texts, missing, n_workers):
+        if feature_cache is not None:
+            feature_cache.put(keys[i], fingerprint, entry)
+        features[i] = entry
+    
+    # JD x candidate skill overlap from binary skill matrices; only skills
+    # required by some JD matter
+    skill_columns = {}
+    for skills in jd_skills:
+        for skill in skills:
+            skill_columns.setdefault(skill, len(skill_columns))
+    
+    def binary_matrix(skill_lists: List[List[str]]) -> "sparse.csr_matrix":
+        rows, columns = [], []
+        for row, skills in enumerate(skill_lists):
+            for skill in set(skills):
+                column = skill_columns.get(skill)
+                if column is not None:
+                    rows.append(row)
+                    columns.append(column)
+        return sparse.csr_matrix(
+            ([1] * len(rows), (rows, columns)),
+            shape=(len(skill_lists), len(skill_columns))
         )
+    
+    jd_matrix = binary_matrix(jd_skills)
+    resume_matrix = binary_matrix([entry["skills"] for entry in features])
+    overlap = jd_matrix.dot(resume_matrix.T).toarray()
+    
+    # JD x candidate semantic similarity
+    semantic_scores = compute_tfidf_similarity_matrix(jd_cleaned, cleaned_texts, model=tfidf_model)
+    
+    results = {}
+    for j, jd_id in enumerate(jd_ids):
+        skill_scores = compute_skill_match_scores(overlap[j], len(jd_skills[j]))
+        final_scores = compute_final_scores(
+            skill_scores, semantic_scores[j], skill_weight, semantic_weight
+        ).tolist()
         
-        # Build result dictionary
-        candidate_result = {
-            "candidate_id": candidate_id,
-            "emails": contact_info["emails"],
-            "phones": contact_info["phones"],
-            "github": contact_info["github"],
-            "linkedin": contact_info["linkedin"],
-            "extracted_skills": resume_skills,
-            "matched_skills": matched_skills,
-            "missing_skills": missing_skills,
-            "skill_match_score": skill_score,
-            "semantic_similarity_score": semantic_score,
-            "final_match_score": final_score,
-            "ner_entities": ner_entities,
-            "short_reason": ""  # Will be filled by ranker
-        }
+        # Same order as rank_candidates: score descending, ties in input order
+        def key(i: int) -> Tuple[float, int]:
+            return -final_scores[i], i
         
-        results.append(candidate_result)
-    
-    # Step 4: Rank candidates and generate reasons
-    ranked_results = rank_candidates(results)
+        if limit is None:
+            selected = sorted(range(len(candidate_ids)), key=key)[offset:]
+        else:
+            selected = heapq.nsmallest(offset + limit, range(len(candidate_ids)), key=key)[offset:]
+        
+        page = [
+            _score_candidate(
+                candidate_ids[i], features[i], jd_skills[j], semantic_scores[j][i],
+                skill_weight, semantic_weight
+            )
+            for i in selected
+        ]
+        results[jd_id] = rank_candidates(page)
     
-    return ranked_results
+    return results
@@ -2,7 +2,8 @@
 Candidate ranking and reason generation.
 """
 
-from typing import List, Dict
+import heapq
+from typing import List, Dict, Optional
 
 
 def generate_short_reason(
@@ -58,20 +59,44 @@ def generate_short_reason(
     return " ".join(reason_parts)
 
 
-def rank_candidates(candidates: List[Dict]) -> List[Dict]:
+def rank_candidates(
+    candidates: List[Dict],
+    limit: Optional[int] = None,
+    offset: int = 0
+) -> List[Dict]:
     """
     Rank candidates by final match score in descending order.
     
-    Also generates 'short_reason' for each candidate.
+    Also generates 'short_reason' for each returned candidate. Ties keep
+    their input order. With a limit, only the top offset + limit candidates
+    are selected (heap-based, no full sort).
     
     Args:
         candidates: List of candidate result dictionaries
+        limit: Maximum number of candidates to return (default all)
+        offset: Number of top-ranked candidates to skip (default 0)
         
     Returns:
         Sorted list of candidates (highest score first)
     """
-    # Generate short reason for each candidate
-    for candidate in candidates:
+    if limit is None:
+        # Sort by final_match_score descending (stable for ties)
+        ranked = sorted(
+            candidates,
+            key=lambda x: x.get("final_match_score", 0),
+            reverse=True
+        )[offset:]
+    else:
+        # Select top offset + limit; the index breaks ties in input order
+        top = heapq.nsmallest(
+            offset + limit,
+            range(len(candidates)),
+            key=lambda i: (-candidates[i].get("final_match_score", 0), i)
+        )
+        ranked = [candidates[i] for i in top[offset:]]
+    
+    # Generate short reason for each returned candidate
+    for candidate in ranked:
         candidate["short_reason"] = generate_short_reason(
             skill_match_score=candidate.get("skill_match_score", 0),
             matched_skills=candidate.get("matched_skills", []),
@@ -79,11 +104,4 @@ def rank_candidates(candidates: List[Dict]) -> List[Dict]:
             semantic_score=candidate.get("semantic_similarity_score", 0)
         )
     
-    # Sort by final_match_score descending
-    sorted_candidates = sorted(
-        candidates,
-        key=lambda x: x.get("final_match_score", 0),
-        reverse=True
-    )
-    
-    return sorted_candidates
+    return ranked
@@ -1,9 +1,124 @@
 """
 Regex-based extraction of contact information and URLs.
+
+extract_contact_info walks the text once with a combined trigger pattern
+that finds every position where an email, phone number or profile URL can
+start; each candidate is then matched locally. Results are identical to
+running each pattern over the whole text, but the worst case is linear in
+the text length (the email pattern used to backtrack quadratically on long
+junk strings from broken PDFs).
 """
 
 import re
-from typing import List, Dict
+import string
+from typing import List, Dict, Optional, Tuple
+
+# Email: \b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b, matched by
+# _match_email without backtracking
+_EMAIL_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + "._%+-")
+_EMAIL_DOMAIN_CHARS = frozenset(string.ascii_letters + string.digits + ".-")
+_EMAIL_TLD_CHARS = frozenset(string.ascii_letters + "|")
+
+_PHONE_PATTERNS = [
+    re.compile(r'\+91[-\s]?\d{10}'),  # Indian with +91
+    re.compile(r'\+\d{1,3}[-\s]?\d{9,10}'),  # International format
+    re.compile(r'\b\d{10}\b'),  # 10-digit number
+    re.compile(r'\(\d{3}\)\s*\d{3}[-\s]?\d{4}'),  # (123) 456-7890
+    re.compile(r'\b\d{3}[-\s]?\d{3}[-\s]?\d{4}\b'),  # 123-456-7890
+]
+
+# Every phone pattern match contains at least this many digits
+_MIN_PHONE_DIGITS = 10
+
+_GITHUB_PATTERN = re.compile(r'https?://(?:www\.)?github\.com/[\w\-]+', re.IGNORECASE)
+_LINKEDIN_PATTERN = re.compile(r'https?://(?:www\.)?linkedin\.com/in/[\w\-]+', re.IGNORECASE)
+
+# Start of every possible match: '@' (email), a run of phone characters
+# (phone matches only contain digits, whitespace and "()+-"), or a URL scheme
+_TRIGGER_PATTERN = re.compile(r'(@)|([\d+(][\d\s()+\-]*)|(?i:https?://)')
+_DIGITS_PATTERN = re.compile(r'\d+')
+
+
+def _unique(items: List[str]) -> List[str]:
+    """
+    Deduplicate items, keeping the order of first appearance.
+    
+    Unlike list(set(...)), the result does not depend on the process's hash
+    seed, so worker processes produce the same lists as the parent.
+    """
+    return list(dict.fromkeys(items))
+
+
+def _is_word(char: str) -> bool:
+    """Return True if char is a regex word character (\\w)."""
+    return char.isalnum() or char == "_"
+
+
+def _at_boundary(text: str, i: int) -> bool:
+    """Return True if a regex word boundary (\\b) holds at position i."""
+    before = i > 0 and _is_word(text[i - 1])
+    after = i < len(text) and _is_word(text[i])
+    return before != after
+
+
+def _match_email(text: str, at: int, min_start: int) -> Optional[Tuple[int, int]]:
+    """
+    Match the email pattern around the '@' at position at.
+    
+    Gives the same span as the leftmost match re.findall would return when
+    scanning from min_start (the end of the previous email). The local part
+    and the domain are each scanned once, so the cost is linear in their
+    length.
+    
+    Returns:
+        (start, end) span, or None if no email contains this '@'
+    """
+    # Local part: the match starts at the leftmost word boundary in the run
+    # of local-part characters before '@'
+    run_start = at
+    while run_start > min_start and text[run_start - 1] in _EMAIL_LOCAL_CHARS:
+        run_start -= 1
+    
+    start = None
+    for i in range(run_start, at):
+        if _at_boundary(text, i):
+            start = i
+            break
+    if start is None:
+        return None
+    
+    # Domain: backtrack over the dots of the domain run, last dot first,
+    # and take the longest TLD (2+ chars) followed by a word boundary
+    n = len(text)
+    domain_end = at + 1
+    while domain_end < n and text[domain_end] in _EMAIL_DOMAIN_CHARS:
+        domain_end += 1
+    
+    dot = text.rfind(".", at + 2, domain_end)
+    while dot != -1:
+        tld_end = dot + 1
+        while tld_end < n and text[tld_end] in _EMAIL_TLD_CHARS:
+            tld_end += 1
+        
+        for end in range(tld_end, dot + 2, -1):
+            if _at_boundary(text, end):
+                return start, end
+        
+        dot = text.rfind(".", at + 2, dot)
+    
+    return None
+
+
+def _find_emails(text: str, at_positions: List[int]) -> List[str]:
+    """Collect non-overlapping email matches around the given '@' positions."""
+    emails = []
+    last_end = 0
+    for at in at_positions:
+        span = _match_email(text, at, last_end)
+        if span is not None:
+            emails.append(text[span[0]:span[1]])
+            last_end = span[1]
+    return emails
 
 
 def extract_emails(text: str) -> List[str]:
@@ -16,9 +131,8 @@ def extract_emails(text: str) -> List[str]:
     Returns:
         List of unique email addresses
     """
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    emails = re.findall(email_pattern, text)
-    return list(set(emails))
+    at_positions = [i for i, char in enumerate(text) if char == "@"]
+    return _unique(_find_emails(text, at_positions))
 
 
 def extract_phone_numbers(text: str) -> List[str]:
@@ -38,21 +152,13 @@ def extract_phone_numbers(text: str) -> List[str]:
     Returns:
         List of unique phone numbers
     """
-    phone_patterns = [
-        r'\+91[-\s]?\d{10}',  # Indian with +91
-        r'\+\d{1,3}[-\s]?\d{9,10}',  # International format
-        r'\b\d{10}\b',  # 10-digit number
-        r'\(\d{3}\)\s*\d{3}[-\s]?\d{4}',  # (123) 456-7890
-        r'\b\d{3}[-\s]?\d{3}[-\s]?\d{4}\b',  # 123-456-7890
-    ]
-    
     phones = []
-    for pattern in phone_patterns:
-        matches = re.findall(pattern, text)
+    for pattern in _PHONE_PATTERNS:
+        matches = pattern.findall(text)
         phones.extend(matches)
     
     # Deduplicate and clean
-    unique_phones = list(set([p.strip() for p in phones]))
+    unique_phones = _unique([p.strip() for p in phones])
     return unique_phones
 
 
@@ -66,9 +172,8 @@ def extract_github_links(text: str) -> List[str]:
     Returns:
         List of unique GitHub URLs
     """
-    github_pattern = r'https?://(?:www\.)?github\.com/[\w\-]+'
-    github_links = re.findall(github_pattern, text, re.IGNORECASE)
-    return list(set(github_links))
+    github_links = _GITHUB_PATTERN.findall(text)
+    return _unique(github_links)
 
 
 def extract_linkedin_links(text: str) -> List[str]:
@@ -81,9 +186,8 @@ def extract_linkedin_links(text: str) -> List[str]:
     Returns:
         List of unique LinkedIn URLs
     """
-    linkedin_pattern = r'https?://(?:www\.)?linkedin\.com/in/[\w\-]+'
-    linkedin_links = re.findall(linkedin_pattern, text, re.IGNORECASE)
-    return list(set(linkedin_links))
+    linkedin_links = _LINKEDIN_PATTERN.findall(text)
+    return _unique(linkedin_links)
 
 
 def extract_contact_info(text: str) -> Dict[str, List[str]]:
@@ -105,9 +209,50 @@ def extract_contact_info(text: str) -> Dict[str, List[str]]:
             'linkedin': []
         }
     """
+    n = len(text)
+    at_positions = []
+    phones_by_pattern = [[] for _ in _PHONE_PATTERNS]
+    github = []
+    linkedin = []
+    github_end = 0
+    linkedin_end = 0
+    
+    for trigger in _TRIGGER_PATTERN.finditer(text):
+        start, end = trigger.span()
+        
+        if trigger.group(1):
+            at_positions.append(start)
+        
+        elif trigger.group(2):
+            # Phone matches never leave the run; the next character is
+            # included so trailing word boundaries see it
+            if end - start < _MIN_PHONE_DIGITS:
+                continue
+            digits = sum(len(run) for run in _DIGITS_PATTERN.findall(text, start, end))
+            if digits < _MIN_PHONE_DIGITS:
+                continue
+            for phones, pattern in zip(phones_by_pattern, _PHONE_PATTERNS):
+                phones.extend(pattern.findall(text, start, min(end + 1, n)))
+        
+        else:
+            # Skip URLs starting inside the previous match, like findall
+            if start >= github_end:
+                match = _GITHUB_PATTERN.match(text, start)
+                if match:
+                    github.append(match.group())
+                    github_end = match.end()
+            if start >= linkedin_end:
+                match = _LINKEDIN_PATTERN.match(text, start)
+                if match:
+                    linkedin.append(match.group())
+                    linkedin_end = match.end()
+    
+    # Phones are reported pattern by pattern, as extract_phone_numbers does
+    phones = [phone.strip() for matches in phones_by_pattern for phone in matches]
+    
     return {
-        "emails": extract_emails(text),
-        "phones": extract_phone_numbers(text),
-        "github": extract_github_links(text),
-        "linkedin": extract_linkedin_links(text)
+        "emails": _unique(_find_emails(text, at_positions)),
+        "phones": _unique(phones),
+        "github": _unique(github),
+        "linkedin": _unique(linkedin)
     }
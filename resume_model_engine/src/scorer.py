@@ -1,8 +1,13 @@
 """
 Scoring logic for skill matching and final candidate scores.
+
+NumPy is only needed by the vectorized functions and is imported on first use.
 """
 
-from typing import List
+from typing import TYPE_CHECKING, List, Union
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 def compute_skill_match_score(matched_skills: List[str], total_jd_skills: List[str]) -> float:
@@ -20,11 +25,22 @@ def compute_skill_match_score(matched_skills: List[str], total_jd_skills: List[s
         >>> compute_skill_match_score(['python', 'sql'], ['python', 'sql', 'aws'])
         66.67
     """
-    if not total_jd_skills:
-        return 0.0
+    return compute_skill_match_score_from_count(len(matched_skills), len(total_jd_skills))
+
+
+def compute_skill_match_score_from_count(match_count: int, total_count: int) -> float:
+    """
+    Compute skill match percentage from skill counts.
     
-    match_count = len(matched_skills)
-    total_count = len(total_jd_skills)
+    Args:
+        match_count: Number of JD skills found in the resume
+        total_count: Number of skills required in JD
+        
+    Returns:
+        Skill match score on 0-100 scale
+    """
+    if not total_count:
+        return 0.0
     
     score = (match_count / total_count) * 100
     return round(score, 2)
@@ -68,3 +84,90 @@ def compute_final_score(
     final_score = max(0.0, min(100.0, final_score))
     
     return round(final_score, 2)
+
+
+def _round_scores(values: "np.ndarray") -> "np.ndarray":
+    """
+    Round to 2 decimals exactly like Python's round(value, 2).
+    
+    np.round scales by 100 and rounds half to even, which can disagree with
+    Python's correctly rounded result when the scaled value lands within
+    float error of a .5 tie; those few elements are rounded in Python.
+    """
+    import numpy as np
+    
+    rounded = np.round(values, 2)
+    
+    scaled = values * 100
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-9 * np.maximum(1.0, np.abs(scaled))
+    for i in np.flatnonzero(near_tie):
+        rounded[i] = round(float(values[i]), 2)
+    
+    # Normalize -0.0 like the scalar path's max(0.0, ...)
+    return rounded + 0.0
+
+
+def compute_skill_match_scores(
+    match_counts: Union["np.ndarray", List[int]],
+    total_counts: Union["np.ndarray", List[int], int]
+) -> "np.ndarray":
+    """
+    Vectorized compute_skill_match_score.
+    
+    Args:
+        match_counts: Number of matched JD skills per candidate
+        total_counts: Number of JD skills (per candidate or one for all)
+        
+    Returns:
+        Array of skill match scores on 0-100 scale, identical to
+        compute_skill_match_score for each candidate
+    """
+    import numpy as np
+    
+    match_counts = np.asarray(match_counts, dtype=np.float64)
+    total_counts = np.broadcast_to(np.asarray(total_counts, dtype=np.float64), match_counts.shape)
+    
+    scores = np.zeros(match_counts.shape, dtype=np.float64)
+    has_skills = total_counts != 0
+    scores[has_skills] = (match_counts[has_skills] / total_counts[has_skills]) * 100
+    
+    return _round_scores(scores)
+
+
+def compute_final_scores(
+    skill_scores: Union["np.ndarray", List[float]],
+    semantic_scores: Union["np.ndarray", List[float]],
+    skill_weight: float = 0.50,
+    semantic_weight: float = 0.50
+) -> "np.ndarray":
+    """
+    Vectorized compute_final_score.
+    
+    Args:
+        skill_scores: Skill match scores (0-100)
+        semantic_scores: Semantic similarity scores (0-100)
+        skill_weight: Weight for skill score (default 0.50)
+        semantic_weight: Weight for semantic score (default 0.50)
+        
+    Returns:
+        Array of final weighted scores on 0-100 scale, identical to
+        compute_final_score for each candidate
+    """
+    import numpy as np
+    
+    skill_scores = np.asarray(skill_scores, dtype=np.float64)
+    semantic_scores = np.asarray(semantic_scores, dtype=np.float64)
+    
+    total_weight = skill_weight + semantic_weight
+    if total_weight == 0:
+        return np.zeros(np.broadcast(skill_scores, semantic_scores).shape, dtype=np.float64)
+    
+    # Normalize weights once for the whole batch
+    skill_weight = skill_weight / total_weight
+    semantic_weight = semantic_weight / total_weight
+    
+    final_scores = (skill_weight * skill_scores) + (semantic_weight * semantic_scores)
+    final_scores = np.minimum(100.0, final_scores)
+    final_scores = np.maximum(0.0, final_scores)
+    
+    return _round_scores(final_scores)
@@ -1,10 +1,50 @@
 """
 Text similarity computation using TF-IDF and cosine similarity.
+
+scikit-learn, SciPy and NumPy are imported on first use so that importing
+the engine stays cheap.
 """
 
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-import numpy as np
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, List, Optional
+
+if TYPE_CHECKING:
+    from scipy import sparse
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+
+def _build_vectorizer() -> "TfidfVectorizer":
+    """
+    Create the TF-IDF vectorizer used for all similarity computations.
+    
+    Returns:
+        Unfitted TfidfVectorizer
+    """
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    
+    return TfidfVectorizer(
+        max_features=1000,
+        stop_words='english',
+        ngram_range=(1, 2)  # Unigrams and bigrams
+    )
+
+
+def _to_score(similarity: float) -> float:
+    """
+    Convert a cosine similarity to a rounded 0-100 score.
+    
+    Args:
+        similarity: Cosine similarity (0-1)
+        
+    Returns:
+        Score on 0-100 scale
+    """
+    score = float(similarity * 100)
+    
+    # Ensure score is in valid range
+    score = max(0.0, min(100.0, score))
+    
+    return round(score, 2)
 
 
 def compute_tfidf_similarity(jd_text: str, resume_text: str) -> float:
@@ -25,12 +65,10 @@ def compute_tfidf_similarity(jd_text: str, resume_text: str) -> float:
     if not jd_text or not resume_text:
         return 0.0
     
+    from sklearn.metrics.pairwise import cosine_similarity
+    
     # Create TF-IDF vectorizer
-    vectorizer = TfidfVectorizer(
-        max_features=1000,
-        stop_words='english',
-        ngram_range=(1, 2)  # Unigrams and bigrams
-    )
+    vectorizer = _build_vectorizer()
     
     try:
         # Fit and transform both texts
@@ -40,16 +78,236 @@ def compute_tfidf_similarity(jd_text: str, resume_text: str) -> float:
         similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
         
         # Convert to 0-100 scale
-        score = float(similarity * 100)
+        return _to_score(similarity)
+    
+    except Exception as e:
+        print(f"Warning: Error computing TF-IDF similarity: {e}")
+        return 0.0
+
+
+def compute_tfidf_similarity_batch(
+    jd_text: str,
+    resume_texts: List[str],
+    model: Optional["TfidfVectorizer"] = None
+) -> List[float]:
+    """
+    Compute TF-IDF cosine similarity between one job description and many resumes.
+    
+    Without a model, the vectorizer is fitted once on the JD plus all non-empty
+    resumes, so IDF weights reflect the whole candidate pool. With a pre-fitted
+    model (see fit_tfidf_model / load_tfidf_model), texts are only transformed,
+    which keeps scores comparable across requests. Rows of the TF-IDF matrix
+    are L2-normalized, so all cosine scores come from a single sparse
+    matrix-vector product.
+    
+    Args:
+        jd_text: Job description text (cleaned)
+        resume_texts: Resume texts (cleaned)
+        model: Optional pre-fitted vectorizer used for transform-only scoring
+        
+    Returns:
+        Similarity scores on 0-100 scale, in the same order as resume_texts
+    """
+    scores = [0.0] * len(resume_texts)
+    
+    if not jd_text:
+        return scores
+    
+    # Empty resumes score 0.0 and are left out of the corpus
+    indices = [i for i, text in enumerate(resume_texts) if text]
+    if not indices:
+        return scores
+    
+    corpus = [jd_text] + [resume_texts[i] for i in indices]
+    
+    try:
+        if model is None:
+            tfidf_matrix = _build_vectorizer().fit_transform(corpus)
+        else:
+            tfidf_matrix = model.transform(corpus)
         
-        # Ensure score is in valid range
-        score = max(0.0, min(100.0, score))
+        # Cosine similarity of each resume row against the JD row
+        similarities = tfidf_matrix[1:].dot(tfidf_matrix[0].T).toarray().ravel()
+        
+        for i, similarity in zip(indices, similarities):
+            scores[i] = _to_score(similarity)
+    
+    except Exception as e:
+        print(f"Warning: Error computing batch TF-IDF similarity: {e}")
+    
+    return scores
+
+
+def tfidf_similarity_scorer(jd_text: str, model: "TfidfVectorizer") -> Callable[[str], float]:
+    """
+    Score resumes one at a time against a job description with a pre-fitted model.
+    
+    The JD is transformed once and each call transforms a single resume. A
+    pre-fitted model transforms every text independently, so scores equal
+    compute_tfidf_similarity_batch(jd_text, resume_texts, model=model).
+    
+    Args:
+        jd_text: Job description text (cleaned)
+        model: Pre-fitted vectorizer (see fit_tfidf_model / load_tfidf_model)
         
-        return round(score, 2)
+    Returns:
+        Function mapping a cleaned resume text to a 0-100 similarity score
+    """
+    if not jd_text:
+        return lambda resume_text: 0.0
     
+    try:
+        jd_vector = model.transform([jd_text]).T
     except Exception as e:
         print(f"Warning: Error computing TF-IDF similarity: {e}")
-        return 0.0
+        return lambda resume_text: 0.0
+    
+    def score(resume_text: str) -> float:
+        if not resume_text:
+            return 0.0
+        try:
+            similarity = model.transform([resume_text]).dot(jd_vector).toarray()[0, 0]
+        except Exception as e:
+            print(f"Warning: Error computing TF-IDF similarity: {e}")
+            return 0.0
+        return _to_score(similarity)
+    
+    return score
+
+
+def _pre_analyzed(terms: List[str]) -> List[str]:
+    """Analyzer for documents that are already lists of terms."""
+    return terms
+
+
+def compute_tfidf_similarity_matrix(
+    jd_texts: List[str],
+    resume_texts: List[str],
+    model: Optional["TfidfVectorizer"] = None
+) -> List[List[float]]:
+    """
+    Compute TF-IDF cosine similarity between many job descriptions and many resumes.
+    
+    Row j equals compute_tfidf_similarity_batch(jd_texts[j], resume_texts, model).
+    With a pre-fitted model, JDs and resumes are transformed once and all
+    scores come from a single sparse product. Without a model, each JD keeps
+    its own vocabulary and IDF weights, but the resume pool is tokenized only
+    once: each JD is fitted with a CountVectorizer over the pre-tokenized
+    pool, using the same max_features.
+    
+    Args:
+        jd_texts: Job description texts (cleaned)
+        resume_texts: Resume texts (cleaned)
+        model: Optional pre-fitted vectorizer used for transform-only scoring
+        
+    Returns:
+        len(jd_texts) x len(resume_texts) similarity scores on 0-100 scale
+    """
+    scores = [[0.0] * len(resume_texts) for _ in jd_texts]
+    
+    # Empty JDs and resumes score 0.0 and are left out of the corpus
+    jd_rows = [j for j, text in enumerate(jd_texts) if text]
+    indices = [i for i, text in enumerate(resume_texts) if text]
+    if not jd_rows or not indices:
+        return scores
+    
+    pool = [resume_texts[i] for i in indices]
+    
+    try:
+        if model is not None:
+            jd_matrix = model.transform([jd_texts[j] for j in jd_rows])
+            resume_matrix = model.transform(pool)
+            similarities = resume_matrix.dot(jd_matrix.T).toarray()
+            
+            for column, j in enumerate(jd_rows):
+                for row, i in enumerate(indices):
+                    scores[j][i] = _to_score(similarities[row, column])
+            return scores
+        
+        from sklearn.feature_extraction.text import CountVectorizer, TfidfTransformer
+        
+        vectorizer = _build_vectorizer()
+        analyze = vectorizer.build_analyzer()
+        pool_terms = [analyze(text) for text in pool]
+        
+        for j in jd_rows:
+            counter = CountVectorizer(analyzer=_pre_analyzed, max_features=vectorizer.max_features)
+            try:
+                count_matrix = counter.fit_transform([analyze(jd_texts[j])] + pool_terms)
+            except ValueError:
+                # Empty vocabulary (e.g. only stop words)
+                continue
+            
+            tfidf_matrix = TfidfTransformer().fit_transform(count_matrix)
+            similarities = tfidf_matrix[1:].dot(tfidf_matrix[0].T).toarray().ravel()
+            
+            for i, similarity in zip(indices, similarities):
+                scores[j][i] = _to_score(similarity)
+    
+    except Exception as e:
+        print(f"Warning: Error computing TF-IDF similarity matrix: {e}")
+    
+    return scores
+
+
+def fit_tfidf_model(corpus: List[str]) -> "TfidfVectorizer":
+    """
+    Fit a TF-IDF vocabulary and IDF weights on a historical corpus.
+    
+    Args:
+        corpus: Cleaned resume and/or job description texts
+        
+    Returns:
+        Fitted TfidfVectorizer
+    """
+    vectorizer = _build_vectorizer()
+    vectorizer.fit([text for text in corpus if text])
+    return vectorizer
+
+
+def save_tfidf_model(model: "TfidfVectorizer", model_path: str) -> None:
+    """
+    Save a fitted TF-IDF model as a compressed .npz file.
+    
+    Only the vocabulary terms (in column order) and the IDF weights are
+    stored; the remaining settings come from the engine's vectorizer config.
+    
+    Args:
+        model: Fitted TfidfVectorizer
+        model_path: Destination path (.npz)
+    """
+    import numpy as np
+    
+    model_path = Path(model_path)
+    model_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    terms = np.array(model.get_feature_names_out().tolist(), dtype=str)
+    
+    with open(model_path, 'wb') as f:
+        np.savez_compressed(f, terms=terms, idf=model.idf_)
+
+
+def load_tfidf_model(model_path: str) -> "TfidfVectorizer":
+    """
+    Load a TF-IDF model saved with save_tfidf_model.
+    
+    Args:
+        model_path: Path to the .npz model file
+        
+    Returns:
+        TfidfVectorizer ready for transform-only scoring
+    """
+    import numpy as np
+    
+    with np.load(model_path, allow_pickle=False) as data:
+        terms = data["terms"].tolist()
+        idf = data["idf"]
+    
+    vectorizer = _build_vectorizer()
+    vectorizer.set_params(vocabulary={term: i for i, term in enumerate(terms)})
+    vectorizer.idf_ = idf
+    
+    return vectorizer
 
 
 # Future extension interface for SBERT/sentence-transformers
@@ -2,6 +2,8 @@
 Skill extraction module with synonym support.
 """
 
+import hashlib
+import os
 import re
 from typing import List, Set
 from pathlib import Path
@@ -33,6 +35,11 @@ SKILL_SYNONYMS = {
 }
 
 
+def _default_skills_file() -> Path:
+    """Return the path of the bundled skills.csv."""
+    return Path(__file__).parent.parent / "data" / "skills.csv"
+
+
 def load_skills(skills_file: str = None) -> Set[str]:
     """
     Load skills from CSV file.
@@ -45,8 +52,7 @@ def load_skills(skills_file: str = None) -> Set[str]:
     """
     if skills_file is None:
         # Default path relative to this module
-        current_dir = Path(__file__).parent.parent
-        skills_file = current_dir / "data" / "skills.csv"
+        skills_file = _default_skills_file()
     
     skills = set()
     
@@ -83,9 +89,148 @@ def expand_skills_with_synonyms(skills: Set[str]) -> Set[str]:
     return expanded
 
 
+# Splits text into alternating runs of word and non-word characters. A
+# ``\b<skill>\b`` regex match always starts and ends on a run boundary, so a
+# skill occurs in the text exactly when its own run sequence appears as a
+# contiguous slice of the text's runs.
+_RUN_PATTERN = re.compile(r'\w+|\W+')
+
+# Cache of compiled matchers keyed by skills file path, holding
+# (file signature, matcher) so edits to the file trigger a rebuild
+_matcher_cache = {}
+
+
+def _is_word_run(run: str) -> bool:
+    """Return True if a run produced by ``_RUN_PATTERN`` is made of word characters."""
+    return run[0].isalnum() or run[0] == '_'
+
+
+class SkillMatcher:
+    """
+    Precompiled skill lookup built once per skills file.
+
+    Every skill (and synonym) is stored as a tuple of word/non-word runs in a
+    hash table, together with the canonical name it reports. Extraction then
+    tokenizes the text once and probes the table for each run slice, so the
+    cost per text no longer grows with the size of the taxonomy.
+    """
+
+    def __init__(self, base_skills: Set[str]):
+        self.base_skills = set(base_skills)
+
+        # Identifies the taxonomy; changes whenever skills or synonyms change
+        self.fingerprint = hashlib.sha256(
+            repr((sorted(self.base_skills), SKILL_SYNONYMS)).encode("utf-8")
+        ).hexdigest()
+
+        # Reverse map: first canonical (in SKILL_SYNONYMS order) listing a synonym
+        synonym_to_canonical = {}
+        for canonical, synonyms in SKILL_SYNONYMS.items():
+            for synonym in synonyms:
+                synonym_to_canonical.setdefault(synonym, canonical)
+
+        # Map each searchable run sequence to the skill name it reports
+        self._lookup = {}
+        self._first_runs = set()
+        lengths = set()
+
+        for skill in expand_skills_with_synonyms(self.base_skills):
+            runs = tuple(_RUN_PATTERN.findall(skill))
+            if not runs:
+                continue
+
+            canonical_skill = synonym_to_canonical.get(skill, skill)
+            if canonical_skill not in self.base_skills:
+                canonical_skill = skill
+
+            self._lookup[runs] = canonical_skill
+            self._first_runs.add(runs[0])
+            lengths.add(len(runs))
+
+        self._lengths = sorted(lengths)
+
+    def extract(self, text: str) -> List[str]:
+        """
+        Extract skills from text.
+
+        Args:
+            text: Input text (cleaned resume or job description)
+
+        Returns:
+            List of unique extracted skills (sorted)
+        """
+        if not text:
+            return []
+
+        runs = _RUN_PATTERN.findall(text.lower())
+        num_runs = len(runs)
+        lookup = self._lookup
+        found_skills = set()
+
+        for start, first_run in enumerate(runs):
+            if first_run not in self._first_runs:
+                continue
+
+            for length in self._lengths:
+                end = start + length
+                if end > num_runs:
+                    break
+
+                skill = lookup.get(tuple(runs[start:end]))
+                if skill is None:
+                    continue
+
+                # \b never matches at the edges of the text next to a non-word run
+                if start == 0 and not _is_word_run(runs[0]):
+                    continue
+                if end == num_runs and not _is_word_run(runs[-1]):
+                    continue
+
+                found_skills.add(skill)
+
+        return sorted(found_skills)
+
+
+def _file_signature(skills_file) -> tuple:
+    """Return (mtime, size) of a skills file, or None if it is missing."""
+    try:
+        stat = os.stat(skills_file)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def get_skill_matcher(skills_file: str = None) -> SkillMatcher:
+    """
+    Get or build the skill matcher for a skills file.
+    
+    Matchers are cached per file and rebuilt when the file changes.
+
+    Args:
+        skills_file: Path to skills.csv file. If None, uses default location.
+
+    Returns:
+        SkillMatcher for the given skills file
+    """
+    if skills_file is None:
+        skills_file = _default_skills_file()
+
+    cache_key = str(skills_file)
+    signature = _file_signature(skills_file)
+
+    cached = _matcher_cache.get(cache_key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    matcher = SkillMatcher(load_skills(skills_file))
+    _matcher_cache[cache_key] = (signature, matcher)
+
+    return matcher
+
+
 def extract_skills(text: str, skills_file: str = None) -> List[str]:
     """
-    Extract skills from text using regex matching with word boundaries.
+    Extract skills from text using word-boundary matching with synonyms.
     
     Args:
         text: Input text (cleaned resume or job description)
@@ -101,40 +246,7 @@ def extract_skills(text: str, skills_file: str = None) -> List[str]:
     if not text:
         return []
     
-    text = text.lower()
-    
-    # Load base skills
-    base_skills = load_skills(skills_file)
-    
-    # Expand with synonyms for matching
-    all_skills = expand_skills_with_synonyms(base_skills)
-    
-    found_skills = set()
-    
-    # Match skills using word boundary regex
-    for skill in all_skills:
-        # Escape special regex characters in skill name
-        escaped_skill = re.escape(skill)
-        
-        # Create pattern with word boundaries
-        # Use \b for word boundaries, but handle special cases like C++, C#, .NET
-        pattern = r'\b' + escaped_skill + r'\b'
-        
-        if re.search(pattern, text, re.IGNORECASE):
-            # Map back to canonical skill if it's a synonym
-            canonical_skill = skill
-            for canonical, synonyms in SKILL_SYNONYMS.items():
-                if skill in synonyms:
-                    canonical_skill = canonical
-                    break
-            
-            # Add the canonical or base skill
-            if canonical_skill in base_skills:
-                found_skills.add(canonical_skill)
-            else:
-                found_skills.add(skill)
-    
-    return sorted(list(found_skills))
+    return get_skill_matcher(skills_file).extract(text)
 
 
 def compute_skill_matches(jd_skills: List[str], resume_skills: List[str]) -> dict:
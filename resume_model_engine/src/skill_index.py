@@ -0,0 +1,218 @@
+"""
+Inverted skill index for candidate prefiltering.
+
+Maps each canonical skill (as produced by skill_extractor) to the candidates
+whose resumes mention it. A JD's skills then retrieve and pre-rank candidates
+by overlap count while only touching the posting lists of those skills, so
+just the top-N survivors need to go through evaluate_candidates.
+"""
+
+import heapq
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from .cleaner import clean_text
+from .skill_extractor import extract_skills, get_skill_matcher
+
+
+class SkillIndex:
+    """Inverted index from canonical skill to candidate ids."""
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self) -> None:
+        """Remove every candidate and adopt the current skill taxonomy."""
+        self._postings: Dict[str, Set[str]] = {}
+        self._skills: Dict[str, List[str]] = {}
+        # Insertion sequence per candidate, used to break overlap ties
+        self._order: Dict[str, int] = {}
+        self._next_order = 0
+        # Taxonomy the indexed skills were extracted with
+        self.fingerprint = get_skill_matcher().fingerprint
+
+    def is_current(self) -> bool:
+        """Check whether the index was built with the current skill taxonomy."""
+        return self.fingerprint == get_skill_matcher().fingerprint
+
+    def __len__(self) -> int:
+        return len(self._skills)
+
+    def __contains__(self, candidate_id: str) -> bool:
+        return candidate_id in self._skills
+
+    def add(self, candidate_id: str, skills: Iterable[str]) -> None:
+        """
+        Index a candidate's canonical skills, replacing any previous entry.
+
+        Args:
+            candidate_id: Candidate identifier
+            skills: Canonical skills of the candidate
+        """
+        if candidate_id in self._skills:
+            self.remove(candidate_id)
+
+        unique_skills = list(dict.fromkeys(skills))
+        self._skills[candidate_id] = unique_skills
+        self._order[candidate_id] = self._next_order
+        self._next_order += 1
+
+        for skill in unique_skills:
+            self._postings.setdefault(skill, set()).add(candidate_id)
+
+    def add_resume(self, candidate_id: str, resume_text: str) -> None:
+        """
+        Extract skills from a resume and index them.
+
+        Args:
+            candidate_id: Candidate identifier
+            resume_text: Raw resume text
+        """
+        self.add(candidate_id, extract_skills(clean_text(resume_text)))
+
+    def remove(self, candidate_id: str) -> bool:
+        """
+        Remove a candidate from the index.
+
+        Args:
+            candidate_id: Candidate identifier
+
+        Returns:
+            True if the candidate was indexed
+        """
+        skills = self._skills.pop(candidate_id, None)
+        if skills is None:
+            return False
+
+        del self._order[candidate_id]
+        for skill in skills:
+            posting = self._postings[skill]
+            posting.discard(candidate_id)
+            if not posting:
+                del self._postings[skill]
+        return True
+
+    def skills(self, candidate_id: str) -> List[str]:
+        """Return the indexed skills of a candidate."""
+        return list(self._skills.get(candidate_id, []))
+
+    def query(
+        self,
+        jd_skills: Iterable[str],
+        top_n: Optional[int] = None,
+        min_overlap: int = 1
+    ) -> List[Tuple[str, int]]:
+        """
+        Retrieve candidates sharing skills with a JD, ranked by overlap.
+
+        Args:
+            jd_skills: Canonical JD skills
+            top_n: Maximum number of candidates to return (default all)
+            min_overlap: Minimum number of shared skills (default 1)
+
+        Returns:
+            List of (candidate_id, overlap count) tuples, highest overlap
+            first; ties keep insertion order
+        """
+        overlap: Dict[str, int] = {}
+        for skill in set(jd_skills):
+            for candidate_id in self._postings.get(skill, ()):
+                overlap[candidate_id] = overlap.get(candidate_id, 0) + 1
+
+        hits = [(candidate_id, count) for candidate_id, count in overlap.items() if count >= min_overlap]
+
+        def key(hit: Tuple[str, int]) -> Tuple[int, int]:
+            return -hit[1], self._order[hit[0]]
+
+        if top_n is None:
+            return sorted(hits, key=key)
+        return heapq.nsmallest(top_n, hits, key=key)
+
+
+def build_skill_index(candidates: Dict[str, str]) -> SkillIndex:
+    """
+    Build a skill index over a pool of resumes.
+
+    Args:
+        candidates: Dictionary mapping candidate_id to resume text
+
+    Returns:
+        SkillIndex with every candidate added
+    """
+    index = SkillIndex()
+    for candidate_id, resume_text in candidates.items():
+        index.add_resume(candidate_id, resume_text)
+    return index
+
+
+def prefilter_candidates(
+    jd_text: str,
+    candidates: Dict[str, str],
+    index: SkillIndex,
+    top_n: int,
+    min_overlap: int = 1
+) -> Dict[str, str]:
+    """
+    Keep only the candidates with the highest skill overlap with a JD.
+
+    If the skill taxonomy changed since the index was built (see
+    SkillIndex.is_current), its skills no longer match the JD's, so the
+    index is rebuilt in place from candidates first.
+
+    Args:
+        jd_text: Job description text
+        candidates: Dictionary mapping candidate_id to resume text
+        index: Skill index covering the candidates
+        top_n: Number of candidates to keep
+        min_overlap: Minimum number of shared skills (default 1)
+
+    Returns:
+        Subset of candidates (in their original order) to pass to
+        evaluate_candidates
+    """
+    if not index.is_current():
+        print("Warning: Skill index was built with a different skill taxonomy. Rebuilding it.")
+        index.clear()
+        for candidate_id, resume_text in candidates.items():
+            index.add_resume(candidate_id, resume_text)
+
+    jd_skills = extract_skills(clean_text(jd_text))
+    survivors = {candidate_id for candidate_id, _ in index.query(jd_skills, top_n, min_overlap)}
+    return {
+        candidate_id: resume_text
+        for candidate_id, resume_text in candidates.items()
+        if candidate_id in survivors
+    }
+
+
+def recall_report(
+    index: SkillIndex,
+    jd_skills: Iterable[str],
+    ranked_results: List[Dict],
+    k: int = 10,
+    top_n_values: Sequence[int] = (10, 50, 100, 500)
+) -> Dict:
+    """
+    Measure how many of the true top-k candidates survive prefiltering.
+
+    Args:
+        index: Skill index covering the evaluated candidates
+        jd_skills: Canonical JD skills
+        ranked_results: Output of evaluate_candidates on the full pool
+        k: Number of top-ranked candidates that should be retrieved
+        top_n_values: Prefilter sizes to evaluate
+
+    Returns:
+        Dict with 'k', 'pool_size' and 'recall' (top_n -> fraction of the
+        true top-k retrieved)
+    """
+    jd_skills = list(jd_skills)
+    relevant = [result["candidate_id"] for result in ranked_results[:k]]
+    retrieved = index.query(jd_skills, top_n=max(top_n_values, default=0))
+
+    recall = {}
+    for top_n in top_n_values:
+        survivors = {candidate_id for candidate_id, _ in retrieved[:top_n]}
+        found = sum(1 for candidate_id in relevant if candidate_id in survivors)
+        recall[top_n] = round(found / len(relevant), 4) if relevant else 1.0
+
+    return {"k": len(relevant), "pool_size": len(index), "recall": recall}
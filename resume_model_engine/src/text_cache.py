@@ -0,0 +1,189 @@
+"""On-disk cache of extracted PDF text.
+
+Entries are keyed by a SHA-256 hash of the PDF bytes plus the extractor
+version, so re-uploading the same resume skips PDF parsing entirely. The
+cache is bounded by total size and evicts least recently used entries.
+Several processes may share a cache directory (e.g. the workers of
+load_resumes_from_folder_parallel): each put re-reads the directory before
+evicting, so the bound holds for the directory as a whole.
+
+The default cache is enabled by setting ``PDF_TEXT_CACHE_DIR`` (and
+optionally ``PDF_TEXT_CACHE_MAX_MB``, default 256).
+"""
+from collections import OrderedDict
+import hashlib
+import os
+from pathlib import Path
+import threading
+from typing import Dict, Optional
+
+
+class PdfTextCache:
+    """Size-bounded LRU cache of extracted text stored as files on disk."""
+
+    def __init__(self, cache_dir: str, max_bytes: int = 256 * 1024 * 1024):
+        """
+        Args:
+            cache_dir: Directory holding cache entries (created if missing)
+            max_bytes: Maximum total size of cached text files
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._index: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._load_index()
+
+    @staticmethod
+    def make_key(pdf_bytes: bytes, extractor_version: str) -> str:
+        """Build the cache key for PDF bytes extracted by a given extractor."""
+        digest = hashlib.sha256()
+        digest.update(extractor_version.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(pdf_bytes)
+        return digest.hexdigest()
+
+    @staticmethod
+    def make_file_key(pdf_path: Path, extractor_version: str, chunk_size: int = 1024 * 1024) -> str:
+        """Build the same key as make_key, hashing the file in chunks."""
+        digest = hashlib.sha256()
+        digest.update(extractor_version.encode("utf-8"))
+        digest.update(b"\0")
+        with open(pdf_path, "rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.txt"
+
+    def _load_index(self) -> None:
+        """
+        Rebuild the LRU index from files on disk, oldest access first.
+
+        Access times are kept in file mtimes, so the index also covers
+        entries written or read by other processes.
+        """
+        self._index.clear()
+        self._total_bytes = 0
+
+        entries = []
+        for p in self.cache_dir.glob("*/*.txt"):
+            try:
+                stat = p.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, p.stem, stat.st_size))
+
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self._total_bytes += size
+
+        self._evict()
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until under max_bytes."""
+        while self._index and self._total_bytes > self.max_bytes:
+            key, size = self._index.popitem(last=False)
+            self._total_bytes -= size
+            self.evictions += 1
+            try:
+                self._path(key).unlink()
+            except OSError:
+                pass
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up cached text.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Cached text, or None on a miss
+        """
+        p = self._path(key)
+        try:
+            text = p.read_text(encoding="utf-8")
+        except OSError:
+            with self._lock:
+                self.misses += 1
+                if key in self._index:
+                    self._total_bytes -= self._index.pop(key)
+            return None
+
+        with self._lock:
+            self.hits += 1
+            if key in self._index:
+                self._index.move_to_end(key)
+        try:
+            # Access time is kept in mtime so LRU order survives restarts
+            os.utime(p)
+        except OSError:
+            pass
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        """
+        Store extracted text.
+
+        Args:
+            key: Cache key from make_key
+            text: Extracted text
+        """
+        p = self._path(key)
+        data = text.encode("utf-8")
+
+        try:
+            p.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename so readers never see a partial entry
+            tmp_path = p.with_name(f"{p.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, p)
+        except OSError as e:
+            print(f"Warning: Could not write PDF text cache entry: {e}")
+            return
+
+        with self._lock:
+            # Other processes may have written to the directory since the
+            # last scan, so evict against its current contents
+            self._load_index()
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss/eviction counters and current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._index),
+                "bytes": self._total_bytes,
+            }
+
+
+# Global default cache (lazy created from environment)
+_default_cache: Optional[PdfTextCache] = None
+
+
+def get_pdf_text_cache() -> Optional[PdfTextCache]:
+    """
+    Get the default PDF text cache configured by environment variables.
+
+    Returns:
+        PdfTextCache, or None if PDF_TEXT_CACHE_DIR is not set
+    """
+    global _default_cache
+
+    if _default_cache is None:
+        cache_dir = os.getenv("PDF_TEXT_CACHE_DIR")
+        if cache_dir:
+            max_mb = int(os.getenv("PDF_TEXT_CACHE_MAX_MB", "256"))
+            _default_cache = PdfTextCache(cache_dir, max_bytes=max_mb * 1024 * 1024)
+
+    return _default_cache
@@ -2,7 +2,13 @@
 Basic tests for the resume screening pipeline.
 """
 
+import contextlib
+import io
+import json
+import os
+import subprocess
 import sys
+import tempfile
 from pathlib import Path
 
 # Add parent directory to path
@@ -10,11 +16,44 @@ parent_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(parent_dir))
 
 from src.cleaner import clean_text
-from src.skill_extractor import extract_skills, compute_skill_matches
+from src.skill_extractor import extract_skills, compute_skill_matches, get_skill_matcher
 from src.regex_extractor import extract_contact_info
-from src.similarity import compute_tfidf_similarity
-from src.scorer import compute_skill_match_score, compute_final_score
-from src.pipeline import evaluate_candidates
+from src import ner_extractor
+from src.similarity import (
+    compute_tfidf_similarity,
+    compute_tfidf_similarity_batch,
+    compute_tfidf_similarity_matrix,
+    fit_tfidf_model,
+    save_tfidf_model,
+    load_tfidf_model,
+)
+from src.scorer import (
+    compute_skill_match_score,
+    compute_final_score,
+    compute_skill_match_scores,
+    compute_final_scores,
+)
+from src.ranker import rank_candidates
+from src.pipeline import (
+    evaluate_candidates,
+    evaluate_candidates_multi,
+    iter_candidate_results,
+    shutdown_process_pool,
+    warm_up_steps,
+    _balanced_chunks,
+)
+from src.pdf_loader import (
+    PdfPageReader,
+    extract_pdf_text_bounded,
+    get_pdf_limits,
+    load_resumes_from_folder,
+    load_resumes_from_folder_parallel,
+    pdf_to_text,
+)
+from src.text_cache import PdfTextCache
+from src import feature_cache
+from src.feature_cache import FeatureCache, MemoryFeatureCache, SqliteFeatureCache
+from src.skill_index import SkillIndex, build_skill_index, prefilter_candidates, recall_report
 
 
 def test_cleaner():
@@ -33,6 +72,25 @@ def test_cleaner():
     print("✓ Cleaner tests passed")
 
 
+def test_clean_text_golden():
+    """Test clean_text reproduces the recorded outputs of the golden corpus."""
+    print("Testing cleaner golden corpus...")
+    
+    golden_path = Path(__file__).parent / "data" / "clean_text_golden.json"
+    with open(golden_path, "r", encoding="utf-8") as f:
+        cases = json.load(f)
+    
+    assert cases
+    for case in cases:
+        assert clean_text(case["input"]) == case["expected"], case["input"][:60]
+    
+    # Non-string and empty inputs
+    assert clean_text(None) == ""
+    assert clean_text("") == ""
+    
+    print(f"✓ Cleaner golden tests passed ({len(cases)} cases)")
+
+
 def test_skill_extractor():
     """Test skill extraction."""
     print("Testing skill extractor...")
@@ -59,6 +117,28 @@ def test_skill_extractor():
     print("✓ Skill extractor tests passed")
 
 
+def test_skill_matcher():
+    """Test the compiled skill matcher keeps word-boundary and synonym behavior."""
+    print("Testing skill matcher...")
+    
+    # Matcher is built once per skills file
+    assert get_skill_matcher() is get_skill_matcher()
+    
+    # Synonyms map back to their canonical skill
+    skills = extract_skills("built models in torch and deployed on k8s with ci/cd")
+    assert "pytorch" in skills
+    assert "kubernetes" in skills
+    assert "ci/cd" in skills
+    assert "torch" not in skills
+    
+    # Word boundaries are respected
+    assert extract_skills("javascripting and pythonic code") == []
+    assert "scikit-learn" in extract_skills("used scikit-learn daily")
+    assert extract_skills("") == []
+    
+    print("✓ Skill matcher tests passed")
+
+
 def test_regex_extractor():
     """Test regex-based extraction."""
     print("Testing regex extractor...")
@@ -81,6 +161,101 @@ def test_regex_extractor():
     print("✓ Regex extractor tests passed")
 
 
+def test_contact_scanner():
+    """Test the single-pass scanner matches running each pattern separately."""
+    print("Testing contact scanner...")
+    
+    import random
+    import re
+    import time
+    
+    def per_pattern(text):
+        def unique(items):
+            return list(dict.fromkeys(items))
+        
+        phones = []
+        for pattern in [
+            r'\+91[-\s]?\d{10}',
+            r'\+\d{1,3}[-\s]?\d{9,10}',
+            r'\b\d{10}\b',
+            r'\(\d{3}\)\s*\d{3}[-\s]?\d{4}',
+            r'\b\d{3}[-\s]?\d{3}[-\s]?\d{4}\b',
+        ]:
+            phones.extend(re.findall(pattern, text))
+        
+        return {
+            "emails": unique(re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)),
+            "phones": unique([phone.strip() for phone in phones]),
+            "github": unique(re.findall(r'https?://(?:www\.)?github\.com/[\w\-]+', text, re.IGNORECASE)),
+            "linkedin": unique(re.findall(r'https?://(?:www\.)?linkedin\.com/in/[\w\-]+', text, re.IGNORECASE)),
+        }
+    
+    atoms = list("abXZ09_.-@|%+() \n") + [
+        "é", "٣", "https://", "HTTP://", "github.com/", "linkedin.com/in/", "www.",
+        ".com", ".co|m", "+91", "9876543210", "(123)", "4567", "a@b.cd", "x@",
+    ]
+    rng = random.Random(16)
+    for _ in range(3000):
+        text = "".join(rng.choice(atoms) for _ in range(rng.randint(0, 50)))
+        assert extract_contact_info(text) == per_pattern(text), repr(text)
+    
+    # Overlapping URLs are skipped like findall does
+    text = "https://github.com/xhttps://github.com/y"
+    assert extract_contact_info(text)["github"] == ["https://github.com/xhttps"]
+    
+    # Backtracking-prone input stays fast (quadratic with the old regex)
+    start = time.perf_counter()
+    extract_contact_info("a@" + "b." * 50000)
+    assert time.perf_counter() - start < 1.0
+    
+    print("✓ Contact scanner tests passed")
+
+
+def test_ner_batch():
+    """Test batched NER keeps input order and per-text results."""
+    print("Testing batched NER...")
+    
+    import spacy
+    
+    # Small rule-based pipeline so the test does not need en_core_web_sm
+    nlp = spacy.blank("en")
+    ruler = nlp.add_pipe("entity_ruler")
+    ruler.add_patterns([
+        {"label": "PERSON", "pattern": "John Doe"},
+        {"label": "ORG", "pattern": "TechCorp"},
+        {"label": "GPE", "pattern": "Pune"},
+    ])
+    
+    original_model = ner_extractor._nlp_model
+    ner_extractor._nlp_model = nlp
+    try:
+        texts = ["John Doe works at TechCorp", "", "TechCorp office in Pune"]
+        batch = ner_extractor.extract_entities_batch(texts, batch_size=2)
+        single = [ner_extractor.extract_entities(text) for text in texts]
+    finally:
+        ner_extractor._nlp_model = original_model
+    
+    assert batch == single
+    assert batch[0]["PERSON"] == ["John Doe"]
+    assert batch[1] == {"PERSON": [], "ORG": [], "GPE": [], "DATE": []}
+    assert batch[2]["GPE"] == ["Pune"]
+    
+    # A shared tok2vec is disabled once every component listening to it is
+    listener = {"@architectures": "spacy.Tok2VecListener.v1", "width": 96, "upstream": "*"}
+    nlp = spacy.blank("en")
+    nlp.add_pipe("tok2vec")
+    nlp.add_pipe("tagger", config={"model": {"@architectures": "spacy.Tagger.v2", "tok2vec": listener}})
+    nlp.add_pipe("entity_ruler")
+    assert ner_extractor._ner_disabled_pipes(nlp) == ["tagger", "tok2vec"]
+    
+    nlp = spacy.blank("en")
+    nlp.add_pipe("tok2vec")
+    nlp.add_pipe("ner", config={"model": {"@architectures": "spacy.TransitionBasedParser.v2", "tok2vec": listener}})
+    assert ner_extractor._ner_disabled_pipes(nlp) == []
+    
+    print("✓ Batched NER tests passed")
+
+
 def test_similarity():
     """Test TF-IDF similarity."""
     print("Testing similarity...")
@@ -93,9 +268,45 @@ def test_similarity():
     assert 0 <= score <= 100
     assert score > 0  # Should have some similarity
     
+    # Batch scoring of a single resume matches the pairwise score
+    assert compute_tfidf_similarity_batch(jd, [resume]) == [score]
+    
+    # Batch keeps input order and scores empty resumes as 0
+    batch = compute_tfidf_similarity_batch(jd, [resume, "", "java spring hibernate"])
+    assert len(batch) == 3
+    assert batch[0] > batch[2]
+    assert batch[1] == 0.0
+    
     print(f"✓ Similarity tests passed (score: {score})")
 
 
+def test_tfidf_model_persistence():
+    """Test saving and loading a pre-fitted TF-IDF model."""
+    print("Testing TF-IDF model persistence...")
+    
+    corpus = [
+        "python machine learning tensorflow deep learning",
+        "java spring boot microservices",
+        "python django rest api postgresql",
+    ]
+    jd = "python deep learning engineer"
+    resumes = ["python tensorflow deep learning", "java spring", ""]
+    
+    model = fit_tfidf_model(corpus)
+    expected = compute_tfidf_similarity_batch(jd, resumes, model=model)
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        model_path = Path(tmp_dir) / "tfidf_model.npz"
+        save_tfidf_model(model, str(model_path))
+        loaded = load_tfidf_model(str(model_path))
+    
+    assert compute_tfidf_similarity_batch(jd, resumes, model=loaded) == expected
+    assert expected[0] > expected[1]
+    assert expected[2] == 0.0
+    
+    print("✓ TF-IDF model persistence tests passed")
+
+
 def test_scorer():
     """Test scoring functions."""
     print("Testing scorer...")
@@ -114,6 +325,590 @@ def test_scorer():
     print("✓ Scorer tests passed")
 
 
+def test_vectorized_scorer():
+    """Test array scoring matches the scalar functions exactly."""
+    print("Testing vectorized scorer...")
+    
+    import random
+    
+    rng = random.Random(7)
+    totals = [rng.randint(0, 12) for _ in range(5000)]
+    matches = [rng.randint(0, total) for total in totals]
+    # Include exact .xx5 ties where naive array rounding disagrees
+    semantic = [rng.choice([rng.uniform(0, 100), rng.randint(0, 800) / 8, 0.125, 100.0]) for _ in totals]
+    
+    skill_scores = compute_skill_match_scores(matches, totals)
+    expected_skill = [compute_skill_match_score(["s"] * m, ["s"] * t) for m, t in zip(matches, totals)]
+    assert skill_scores.tolist() == expected_skill
+    assert compute_skill_match_scores([1, 2], 3).tolist() == [33.33, 66.67]
+    
+    for skill_weight, semantic_weight in [(0.5, 0.5), (0.6, 0.4), (1, 2), (0, 0)]:
+        final_scores = compute_final_scores(skill_scores, semantic, skill_weight, semantic_weight)
+        expected = [
+            compute_final_score(skill, sem, skill_weight, semantic_weight)
+            for skill, sem in zip(expected_skill, semantic)
+        ]
+        assert final_scores.tolist() == expected
+    
+    print("✓ Vectorized scorer tests passed")
+
+
+def test_ranker_top_k():
+    """Test top-k selection and pagination match the full ranking."""
+    print("Testing top-k ranking...")
+    
+    scores = [55.0, 90.0, 70.0, 90.0, 10.0, 70.0, 70.0, 35.0]
+    
+    def make_candidates():
+        return [
+            {"candidate_id": f"c{i}", "final_match_score": score, "skill_match_score": score}
+            for i, score in enumerate(scores)
+        ]
+    
+    full = [c["candidate_id"] for c in rank_candidates(make_candidates())]
+    # Ties keep input order
+    assert full == ["c1", "c3", "c2", "c5", "c6", "c0", "c7", "c4"]
+    
+    for limit, offset in [(3, 0), (3, 2), (2, 6), (5, 7), (4, 20)]:
+        candidates = make_candidates()
+        page = rank_candidates(candidates, limit=limit, offset=offset)
+        assert [c["candidate_id"] for c in page] == full[offset:offset + limit]
+        
+        # Reasons are only generated for returned candidates
+        returned = {c["candidate_id"] for c in page}
+        for c in candidates:
+            assert ("short_reason" in c) == (c["candidate_id"] in returned)
+    
+    assert [c["candidate_id"] for c in rank_candidates(make_candidates(), offset=6)] == full[6:]
+    
+    print("✓ Top-k ranking tests passed")
+
+
+def test_skill_index():
+    """Test inverted skill index retrieval, updates and recall."""
+    print("Testing skill index...")
+    
+    candidates = {
+        "alice": "Python, Django and Docker developer",
+        "bob": "Java and Spring engineer",
+        "carol": "Python and Docker, some Kubernetes",
+        "dave": "Graphic designer",
+    }
+    index = build_skill_index(candidates)
+    assert len(index) == 4 and "dave" in index
+    
+    jd_skills = extract_skills("python docker kubernetes")
+    hits = index.query(jd_skills)
+    assert hits == [("carol", 3), ("alice", 2)]
+    assert index.query(jd_skills, top_n=1) == [("carol", 3)]
+    assert index.query(jd_skills, min_overlap=3) == [("carol", 3)]
+    
+    # Incremental updates
+    assert index.remove("carol")
+    assert not index.remove("carol")
+    index.add("erin", ["python", "docker", "kubernetes", "aws"])
+    assert index.query(jd_skills)[0] == ("erin", 3)
+    index.add_resume("bob", "Python and Kubernetes now")
+    assert [cid for cid, _ in index.query(jd_skills)] == ["erin", "alice", "bob"]
+    
+    # Prefilter keeps the original candidate order
+    survivors = prefilter_candidates("Python, Docker and Kubernetes", candidates, build_skill_index(candidates), 2)
+    assert list(survivors) == ["alice", "carol"]
+    
+    # An index built with another taxonomy is rebuilt before prefiltering
+    stale = SkillIndex()
+    stale.add("dave", ["python", "docker", "kubernetes"])
+    stale.fingerprint = "previous-taxonomy"
+    assert not stale.is_current()
+    survivors = prefilter_candidates("Python, Docker and Kubernetes", candidates, stale, 2)
+    assert list(survivors) == ["alice", "carol"]
+    assert stale.is_current() and len(stale) == 4
+    
+    report = recall_report(
+        SkillIndex(), jd_skills, [{"candidate_id": "alice"}], k=1, top_n_values=(1,)
+    )
+    assert report == {"k": 1, "pool_size": 0, "recall": {1: 0.0}}
+    report = recall_report(
+        build_skill_index(candidates), jd_skills,
+        [{"candidate_id": "alice"}, {"candidate_id": "carol"}], k=2, top_n_values=(1, 2)
+    )
+    assert report["recall"] == {1: 0.5, 2: 1.0}
+    
+    print("✓ Skill index tests passed")
+
+
+def test_evaluate_candidates_multi():
+    """Test multi-JD evaluation matches evaluating each JD separately."""
+    print("Testing multi-JD evaluation...")
+    
+    import spacy
+    
+    jds = {
+        "backend": "Backend engineer: Python, Django, PostgreSQL, Docker and AWS",
+        "ml": "Machine learning engineer with Python, TensorFlow, PyTorch and SQL",
+        "frontend": "Frontend developer, React, TypeScript, CSS and HTML",
+        "empty": "",
+    }
+    candidates = {
+        "c1": "Python developer. Django, Docker, AWS and PostgreSQL in production.",
+        "c2": "Deep learning with PyTorch and TensorFlow; Python and SQL daily.",
+        "c3": "React and TypeScript UI work, CSS animations, some Python scripting.",
+        "c4": "Python, Django and React full stack developer with Docker",
+        "c5": "",
+        "c6": "Python developer. Django, Docker, AWS and PostgreSQL in production.",
+    }
+    
+    # Similarity matrix rows equal the single-JD batch scores
+    jd_list = [clean_text(text) for text in jds.values()]
+    resume_list = [clean_text(text) for text in candidates.values()]
+    matrix = compute_tfidf_similarity_matrix(jd_list, resume_list)
+    assert matrix == [compute_tfidf_similarity_batch(jd, resume_list) for jd in jd_list]
+    
+    # Pools whose vocabulary exceeds max_features (1000) keep the same terms
+    words = [f"term{i:04d}" for i in range(1500)]
+    large_pool = [" ".join(words[i::7] + words[:i % 50]) for i in range(20)]
+    large_jds = [" ".join(words[::3]), "term0001 term0002 python", "the and of"]
+    assert compute_tfidf_similarity_matrix(large_jds, large_pool) == [
+        compute_tfidf_similarity_batch(jd, large_pool) for jd in large_jds
+    ]
+    
+    model = fit_tfidf_model(resume_list)
+    matrix = compute_tfidf_similarity_matrix(jd_list, resume_list, model=model)
+    assert matrix == [compute_tfidf_similarity_batch(jd, resume_list, model=model) for jd in jd_list]
+    
+    original_model = ner_extractor._nlp_model
+    ner_extractor._nlp_model = spacy.blank("en")
+    try:
+        multi = evaluate_candidates_multi(jds, candidates)
+        for jd_id, jd_text in jds.items():
+            assert multi[jd_id] == evaluate_candidates(jd_text, candidates)
+        
+        page = evaluate_candidates_multi(jds, candidates, skill_weight=0.7, semantic_weight=0.3, limit=2, offset=1)
+        for jd_id, jd_text in jds.items():
+            assert page[jd_id] == evaluate_candidates(
+                jd_text, candidates, skill_weight=0.7, semantic_weight=0.3, limit=2, offset=1
+            )
+    finally:
+        ner_extractor._nlp_model = original_model
+    
+    assert multi["backend"][0]["candidate_id"] == "c1"
+    assert multi["ml"][0]["candidate_id"] == "c2"
+    assert multi["frontend"][0]["candidate_id"] == "c3"
+    
+    print("✓ Multi-JD evaluation tests passed")
+
+
+def test_warm_up_steps():
+    """Test warm-up steps cover every component and run end to end."""
+    print("Testing warm-up steps...")
+    
+    import spacy
+    
+    names = [name for name, _ in warm_up_steps()]
+    assert names == ["skill_matcher", "spacy_model", "tfidf", "pipeline"]
+    assert "process_pool" in [name for name, _ in warm_up_steps(n_workers=2)]
+    
+    original_model = ner_extractor._nlp_model
+    ner_extractor._nlp_model = spacy.blank("en")
+    try:
+        for _, step in warm_up_steps():
+            step()
+    finally:
+        ner_extractor._nlp_model = original_model
+    
+    print("✓ Warm-up tests passed")
+
+
+def test_stage_timings():
+    """Test evaluate_candidates reports per-stage timings without changing results."""
+    print("Testing stage timings...")
+    
+    import spacy
+    
+    jd = "Python developer with Django, Docker and SQL"
+    candidates = {
+        "c1": "Python and Django developer, jane@example.com, Docker in production",
+        "c2": "Java developer with Spring and SQL",
+        "c3": "",
+    }
+    
+    original_model = ner_extractor._nlp_model
+    ner_extractor._nlp_model = spacy.blank("en")
+    try:
+        timings = {}
+        results = evaluate_candidates(jd, candidates, timings=timings)
+        assert results == evaluate_candidates(jd, candidates)
+    finally:
+        ner_extractor._nlp_model = original_model
+    
+    assert set(timings) == {"clean", "skills", "contact", "ner", "similarity", "scoring", "ranking"}
+    assert all(seconds >= 0 for seconds in timings.values())
+    
+    print(f"✓ Stage timing tests passed ({sum(timings.values()) * 1000:.1f} ms total)")
+
+
+def test_incremental_results():
+    """Test a pre-fitted model lets iter_candidate_results score a lazy stream one candidate at a time."""
+    print("Testing incremental results...")
+    
+    import spacy
+    
+    jd = "Python developer with Django, Docker and SQL"
+    candidates = {
+        "c1": "Python and Django developer, jane@example.com, Docker in production",
+        "c2": "Java developer with Spring and SQL",
+        "c3": "",
+        "c4": "Data engineer: SQL, Spark, Python, Airflow",
+    }
+    model = fit_tfidf_model([jd] + [clean_text(text) for text in candidates.values()])
+    
+    pulled = []
+    
+    def stream():
+        for candidate_id, text in candidates.items():
+            pulled.append(candidate_id)
+            yield candidate_id, text
+    
+    original_model = ner_extractor._nlp_model
+    ner_extractor._nlp_model = spacy.blank("en")
+    try:
+        results = iter_candidate_results(jd, stream(), tfidf_model=model)
+        first = next(results)
+        # Scored before the rest of the stream was read
+        assert first["candidate_id"] == "c1"
+        assert pulled == ["c1"]
+        
+        streamed = [first] + list(results)
+        expected = evaluate_candidates(jd, candidates, tfidf_model=model)
+    finally:
+        ner_extractor._nlp_model = original_model
+    
+    by_id = {result["candidate_id"]: result for result in expected}
+    assert [result["candidate_id"] for result in streamed] == list(candidates)
+    for result in streamed:
+        assert result == by_id[result["candidate_id"]]
+    
+    print("✓ Incremental results tests passed")
+
+
+def test_balanced_chunks():
+    """Test candidate sharding for parallel evaluation."""
+    print("Testing balanced chunks...")
+    
+    texts = ["a" * 900, "b" * 100, "c" * 500, "d" * 400, "e" * 50, "f" * 50]
+    chunks = _balanced_chunks(texts, 2)
+    
+    # Every candidate is assigned exactly once
+    assert sorted(i for chunk in chunks for i in chunk) == list(range(len(texts)))
+    
+    # Long resumes are spread across chunks
+    loads = [sum(len(texts[i]) for i in chunk) for chunk in chunks]
+    assert max(loads) - min(loads) <= 100
+    
+    # Never more chunks than candidates
+    assert len(_balanced_chunks(texts[:2], 8)) == 2
+    
+    print("✓ Balanced chunks tests passed")
+
+
+def test_parallel_evaluation():
+    """Test evaluate_candidates gives the same results with a process pool as serially."""
+    print("Testing parallel evaluation...")
+    
+    import spacy
+    
+    jd = "Backend engineer: Python, Django, PostgreSQL, Docker and AWS"
+    candidates = {
+        # Repeated contacts exercise first-appearance deduplication
+        "c1": "zoe@example.com, adam@example.com, zoe@example.com. +1 555 010 0002, +1 555 010 0001. "
+              "Python, Django and Docker developer",
+        "c2": "Java developer with Spring and SQL. https://github.com/bob https://github.com/alice github.com/bob",
+        "c3": "",
+        "c4": "AWS and PostgreSQL administrator, Python scripting",
+        "c5": "Frontend developer: React, TypeScript and CSS",
+    }
+    model = fit_tfidf_model([jd] + [clean_text(text) for text in candidates.values()])
+    
+    original_model = ner_extractor._nlp_model
+    ner_extractor._nlp_model = spacy.blank("en")
+    # Workers created from here on inherit the blank model
+    shutdown_process_pool()
+    try:
+        serial = evaluate_candidates(jd, candidates)
+        parallel = evaluate_candidates(jd, candidates, n_workers=2)
+        
+        streamed = {
+            result["candidate_id"]: result
+            for result in iter_candidate_results(jd, candidates, tfidf_model=model, n_workers=2)
+        }
+        expected = {
+            result["candidate_id"]: result
+            for result in iter_candidate_results(jd, candidates, tfidf_model=model)
+        }
+    finally:
+        shutdown_process_pool()
+        ner_extractor._nlp_model = original_model
+    
+    assert parallel == serial
+    assert streamed == expected
+    
+    by_id = {result["candidate_id"]: result for result in serial}
+    assert by_id["c1"]["emails"] == ["zoe@example.com", "adam@example.com"]
+    assert by_id["c1"]["phones"] == ["555 010 0002", "555 010 0001"]
+    assert by_id["c2"]["github"] == ["https://github.com/bob", "https://github.com/alice"]
+    
+    print("✓ Parallel evaluation tests passed")
+
+
+def test_pdf_loader_parallel():
+    """Test parallel folder loading matches the serial loader."""
+    print("Testing parallel PDF loading...")
+    
+    import fitz  # PyMuPDF
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, text in [("b_resume", "Python developer"), ("a_resume", "Java developer")]:
+            doc = fitz.open()
+            doc.new_page().insert_text((72, 72), text)
+            doc.save(str(Path(tmp_dir) / f"{name}.pdf"))
+            doc.close()
+        (Path(tmp_dir) / "broken.pdf").write_bytes(b"not a pdf")
+        (Path(tmp_dir) / "notes.txt").write_text("ignored")
+        
+        timings = {}
+        serial = load_resumes_from_folder(tmp_dir)
+        parallel = load_resumes_from_folder_parallel(tmp_dir, max_workers=2, timings=timings)
+    
+    assert parallel == serial
+    assert list(parallel) == ["a_resume", "b_resume"]
+    assert set(timings) == {"a_resume.pdf", "b_resume.pdf", "broken.pdf"}
+    
+    print("✓ Parallel PDF loading tests passed")
+
+
+def test_pdf_extraction_limits():
+    """Test page-by-page PDF extraction stops at the limits."""
+    print("Testing PDF extraction limits...")
+    
+    import fitz  # PyMuPDF
+    
+    no_limits = {"max_pages": None, "max_chars": None, "time_budget_sec": None}
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pdf_path = Path(tmp_dir) / "portfolio.pdf"
+        doc = fitz.open()
+        for i in range(1, 6):
+            doc.new_page().insert_text((72, 72), f"Page {i} Python")
+        doc.new_page()  # Blank last page
+        doc.save(str(pdf_path))
+        doc.close()
+        
+        full_text = "Page 1 Python Page 2 Python Page 3 Python Page 4 Python Page 5 Python"
+        assert extract_pdf_text_bounded(pdf_path, limits=no_limits) == (full_text, False)
+        
+        # Limits that are not exceeded leave the text untouched
+        exact = {**no_limits, "max_pages": 6, "max_chars": len(full_text)}
+        assert extract_pdf_text_bounded(pdf_path, limits=exact) == (full_text, False)
+        
+        text, truncated = extract_pdf_text_bounded(pdf_path, limits={**no_limits, "max_pages": 2})
+        assert (text, truncated) == ("Page 1 Python Page 2 Python", True)
+        
+        text, truncated = extract_pdf_text_bounded(pdf_path, limits={**no_limits, "max_chars": 20})
+        assert truncated and len(text) <= 20 and full_text.startswith(text)
+        
+        # An exhausted time budget stops before the first page
+        assert extract_pdf_text_bounded(pdf_path, limits={**no_limits, "time_budget_sec": 1e-9}) == ("", True)
+        
+        # Only dropping non-whitespace text counts as truncation
+        doc = fitz.open()
+        doc.new_page().insert_text((72, 72), "Page 1 Python")
+        try:
+            page_text = doc.load_page(0).get_text()
+            reader = PdfPageReader(doc, {"max_chars": len(page_text.rstrip())}, separator="\n")
+            assert list(reader) == [page_text.rstrip()] and not reader.truncated
+            reader = PdfPageReader(doc, {"max_chars": len(page_text.rstrip()) - 1}, separator="\n")
+            assert list(reader) == [page_text.rstrip()[:-1].rstrip()] and reader.truncated
+        finally:
+            doc.close()
+        
+        # Truncated text is never cached
+        cache = PdfTextCache(str(Path(tmp_dir) / "cache"))
+        extract_pdf_text_bounded(pdf_path, cache=cache, limits={**no_limits, "max_pages": 2})
+        assert cache.stats()["entries"] == 0
+        assert extract_pdf_text_bounded(pdf_path, cache=cache, limits=no_limits) == (full_text, False)
+        assert cache.stats()["entries"] == 1
+    
+    # The time budget is off unless configured
+    original_budget = os.environ.pop("PDF_TIME_BUDGET_SEC", None)
+    try:
+        assert get_pdf_limits()["time_budget_sec"] is None
+    finally:
+        if original_budget is not None:
+            os.environ["PDF_TIME_BUDGET_SEC"] = original_budget
+    
+    print("✓ PDF extraction limits tests passed")
+
+
+def test_pdf_text_cache():
+    """Test the content-addressed PDF text cache."""
+    print("Testing PDF text cache...")
+    
+    import fitz  # PyMuPDF
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pdf_path = Path(tmp_dir) / "resume.pdf"
+        doc = fitz.open()
+        doc.new_page().insert_text((72, 72), "Python developer")
+        doc.save(str(pdf_path))
+        doc.close()
+        
+        cache = PdfTextCache(str(Path(tmp_dir) / "cache"), max_bytes=64)
+        first = pdf_to_text(pdf_path, cache=cache)
+        second = pdf_to_text(pdf_path, cache=cache)
+        
+        assert first == second == "Python developer"
+        assert cache.stats()["misses"] == 1
+        assert cache.stats()["hits"] == 1
+        
+        # Keys depend on the bytes and the extractor version
+        assert cache.make_key(b"pdf", "v1") != cache.make_key(b"pdf", "v2")
+        
+        # Least recently used entries are evicted past max_bytes
+        cache.put(cache.make_key(b"other", "v1"), "x" * 60)
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["bytes"] <= 64
+        
+        # Index survives a restart
+        assert PdfTextCache(str(Path(tmp_dir) / "cache"), max_bytes=64).stats()["entries"] == 1
+        
+        # Instances sharing a directory (e.g. worker processes) keep the
+        # directory as a whole under max_bytes
+        shared_dir = Path(tmp_dir) / "shared"
+        caches = [PdfTextCache(str(shared_dir), max_bytes=100) for _ in range(2)]
+        for i in range(10):
+            caches[i % 2].put(caches[0].make_key(f"pdf {i}".encode(), "v1"), "x" * 30)
+        sizes = [p.stat().st_size for p in shared_dir.glob("*/*.txt")]
+        assert sum(sizes) <= 100 and len(sizes) == 3
+    
+    print("✓ PDF text cache tests passed")
+
+
+def test_feature_cache():
+    """Test memory and SQLite feature caches."""
+    print("Testing feature cache...")
+    
+    features = {
+        "cleaned": "python developer",
+        "skills": ["python"],
+        "contact": {"emails": [], "phones": [], "github": [], "linkedin": []},
+        "ner_entities": {"PERSON": [], "ORG": [], "GPE": [], "DATE": []},
+    }
+    
+    import spacy
+    
+    # Feature caches cannot be created without a storage backend
+    try:
+        FeatureCache()
+        assert False, "FeatureCache is abstract"
+    except TypeError:
+        pass
+    
+    original_model = ner_extractor._nlp_model
+    ner_extractor._nlp_model = spacy.blank("en")
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = str(Path(tmp_dir) / "features.sqlite3")
+            
+            for cache in (MemoryFeatureCache(max_entries=2), SqliteFeatureCache(db_path, max_entries=2)):
+                key = cache.make_key("Python developer", "fp1")
+                assert cache.get(key, "fp1") is None
+                cache.put(key, "fp1", features)
+                assert cache.get(key, "fp1") == features
+                
+                # Least recently used entries are evicted
+                cache.put(cache.make_key("resume 2", "fp1"), "fp1", features)
+                cache.put(cache.make_key("resume 3", "fp1"), "fp1", features)
+                assert cache.stats()["entries"] == 2
+                assert cache.stats()["evictions"] == 1
+                
+                # A new skill taxonomy invalidates existing entries
+                assert cache.make_key("Python developer", "fp2") != key
+                assert cache.get(cache.make_key("resume 3", "fp1"), "fp2") is None
+                assert cache.stats()["entries"] == 0
+            
+            # Persistent entries survive a restart
+            cache = SqliteFeatureCache(db_path)
+            key = cache.make_key("Python developer", "fp2")
+            cache.put(key, "fp2", features)
+            assert SqliteFeatureCache(db_path).get(key, "fp2") == features
+        
+        # Keys change with the spaCy model
+        key = MemoryFeatureCache.make_key("Python developer", "fp1")
+        ner_extractor._nlp_model.meta["version"] = "9.9.9"
+        assert MemoryFeatureCache.make_key("Python developer", "fp1") != key
+    finally:
+        ner_extractor._nlp_model = original_model
+    
+    # An unknown backend is reported once, not on every lookup
+    originals = (feature_cache._default_cache, feature_cache._default_cache_configured)
+    original_backend = os.environ.get("FEATURE_CACHE_BACKEND")
+    feature_cache._default_cache, feature_cache._default_cache_configured = None, False
+    os.environ["FEATURE_CACHE_BACKEND"] = "redis"
+    output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output):
+            assert feature_cache.get_feature_cache() is None
+            assert feature_cache.get_feature_cache() is None
+    finally:
+        feature_cache._default_cache, feature_cache._default_cache_configured = originals
+        if original_backend is None:
+            del os.environ["FEATURE_CACHE_BACKEND"]
+        else:
+            os.environ["FEATURE_CACHE_BACKEND"] = original_backend
+    assert output.getvalue().count("Unknown FEATURE_CACHE_BACKEND") == 1
+    
+    print("✓ Feature cache tests passed")
+
+
+def test_import_time():
+    """Test importing the pipeline stays cheap and defers heavy dependencies."""
+    print("Testing import time...")
+    
+    budget_ms = 500
+    heavy_modules = ["spacy", "sklearn", "scipy", "numpy", "fitz"]
+    
+    # Fresh interpreter so nothing is already imported
+    script = (
+        "import sys; import src.pipeline; "
+        f"print(','.join(m for m in {heavy_modules!r} if m in sys.modules))"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        cwd=str(parent_dir),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    
+    # Lines look like "import time: <self us> | <cumulative us> | <module>"
+    cumulative = {}
+    for line in completed.stderr.splitlines():
+        parts = line.split("|")
+        if not line.startswith("import time:") or len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        cumulative[parts[2].strip()] = int(parts[1])
+    
+    print("  Slowest imports (cumulative ms):")
+    for module, micros in sorted(cumulative.items(), key=lambda item: -item[1])[:10]:
+        print(f"    {micros / 1000:8.1f}  {module}")
+    
+    assert completed.stdout.strip() == "", f"Eagerly imported: {completed.stdout.strip()}"
+    pipeline_ms = cumulative["src.pipeline"] / 1000
+    assert pipeline_ms < budget_ms, f"src.pipeline took {pipeline_ms:.1f} ms to import"
+    
+    print(f"✓ Import time tests passed (src.pipeline: {pipeline_ms:.1f} ms)")
+
+
 def test_pipeline():
     """Test full pipeline."""
     print("Testing full pipeline...")
@@ -167,10 +962,29 @@ def run_all_tests():
     
     try:
         test_cleaner()
+        test_clean_text_golden()
         test_skill_extractor()
+        test_skill_matcher()
         test_regex_extractor()
+        test_contact_scanner()
+        test_ner_batch()
         test_similarity()
+        test_tfidf_model_persistence()
         test_scorer()
+        test_vectorized_scorer()
+        test_ranker_top_k()
+        test_skill_index()
+        test_evaluate_candidates_multi()
+        test_warm_up_steps()
+        test_stage_timings()
+        test_incremental_results()
+        test_balanced_chunks()
+        test_parallel_evaluation()
+        test_pdf_loader_parallel()
+        test_pdf_extraction_limits()
+        test_pdf_text_cache()
+        test_feature_cache()
+        test_import_time()
         test_pipeline()
         
         print("\n" + "=" * 60)